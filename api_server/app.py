@@ -10,6 +10,7 @@ No external API keys required!
 """
 
 import os
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -92,6 +93,16 @@ class SearchResponse(BaseModel):
     processing_time_seconds: float
 
 
+class BatchSearchRequest(BaseModel):
+    queries: List[str] = Field(..., min_length=1, max_length=100, description="Search queries")
+    max_results: int = Field(default=10, ge=1, le=20, description="Maximum number of results per query")
+
+
+class BatchSearchResponse(BaseModel):
+    responses: List[SearchResponse]
+    processing_time_seconds: float
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -178,6 +189,44 @@ async def search(request: SearchRequest):
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
+# Batch search endpoint
+@app.post("/api/v1/search/batch", response_model=BatchSearchResponse)
+async def search_batch(request: BatchSearchRequest):
+    """
+    Search for evidence for several queries in one request.
+    
+    Queries are searched concurrently; results are returned in request order.
+    """
+    try:
+        start_time = datetime.utcnow()
+        
+        logger.info(f"Batch searching {len(request.queries)} queries")
+        
+        async def run_query(query: str) -> SearchResponse:
+            query_start = datetime.utcnow()
+            results = await search_service.search(query=query, max_results=request.max_results)
+            return SearchResponse(
+                results=results,
+                query=query,
+                processing_time_seconds=(datetime.utcnow() - query_start).total_seconds()
+            )
+        
+        responses = await asyncio.gather(*(run_query(query) for query in request.queries))
+        
+        processing_time = (datetime.utcnow() - start_time).total_seconds()
+        
+        logger.info(f"Completed batch search in {processing_time:.2f}s")
+        
+        return BatchSearchResponse(
+            responses=responses,
+            processing_time_seconds=processing_time
+        )
+    
+    except Exception as e:
+        logger.error(f"Error in batch search: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch search failed: {str(e)}")
+
+
 # API key generation endpoint (for your own authentication)
 @app.post("/api/v1/generate-api-key")
 async def generate_api_key(request: Request):
@@ -7,9 +7,10 @@ constants for the system. It validates that required API keys are present.
 Requirements: 16.1, 16.2, 16.3, 16.4, 16.5
 """
 
+from __future__ import annotations
+
 import os
 import logging
-from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -18,6 +19,16 @@ load_dotenv()
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_ENV = os.environ
+
+# Accepted spellings for boolean environment flags
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _envbool(name: str, default: bool = False) -> bool:
+    """Read a boolean flag from the environment (case-insensitive, surrounding whitespace ignored)."""
+    return _ENV.get(name, str(default)).strip().lower() in _TRUTHY
+
 
 class ConfigurationError(Exception):
     """Raised when required configuration is missing or invalid."""
@@ -28,27 +39,42 @@ class Settings:
     """Configuration settings for the Fake News Detection System."""
     
     # Self-Hosted API Configuration (NEW - No external API keys needed!)
-    USE_SELF_HOSTED_API: bool = os.getenv("USE_SELF_HOSTED_API", "false").lower() == "true"
+    USE_SELF_HOSTED_API: bool = _envbool("USE_SELF_HOSTED_API")
     SELF_HOSTED_API_URL: str = os.getenv("SELF_HOSTED_API_URL", "http://localhost:8000")
-    SELF_HOSTED_API_KEY: Optional[str] = os.getenv("SELF_HOSTED_API_KEY")
+    SELF_HOSTED_API_KEY: str | None = os.getenv("SELF_HOSTED_API_KEY")
     
     # External API Keys (Legacy - Optional if using self-hosted)
-    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    GROQ_API_KEY: Optional[str] = os.getenv("GROQ_API_KEY")
-    SERPER_API_KEY: Optional[str] = os.getenv("SERPER_API_KEY")
-    TAVILY_API_KEY: Optional[str] = os.getenv("TAVILY_API_KEY")
-    TINEYE_API_KEY: Optional[str] = os.getenv("TINEYE_API_KEY")
+    OPENAI_API_KEY: str | None = os.getenv("OPENAI_API_KEY")
+    GROQ_API_KEY: str | None = os.getenv("GROQ_API_KEY")
+    SERPER_API_KEY: str | None = os.getenv("SERPER_API_KEY")
+    TAVILY_API_KEY: str | None = os.getenv("TAVILY_API_KEY")
+    TINEYE_API_KEY: str | None = os.getenv("TINEYE_API_KEY")
     
     # Configurable constants
     MAX_CLAIMS_PER_ARTICLE: int = int(os.getenv("MAX_CLAIMS_PER_ARTICLE", "10"))
     MAX_EVIDENCE_PER_CLAIM: int = int(os.getenv("MAX_EVIDENCE_PER_CLAIM", "5"))
     MINIMUM_CREDIBILITY_THRESHOLD: float = float(os.getenv("MINIMUM_CREDIBILITY_THRESHOLD", "0.3"))
     
+    # Evidence relevance scorer: "jaccard", "bm25" or "tfidf"
+    RELEVANCE_SCORER: str = os.getenv("RELEVANCE_SCORER", "jaccard").lower()
+    
     # Timeout and retry settings
     REQUEST_TIMEOUT_SECONDS: int = int(os.getenv("REQUEST_TIMEOUT_SECONDS", "10"))
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    SEARCH_REQUESTS_PER_MINUTE: int = int(os.getenv("SEARCH_REQUESTS_PER_MINUTE", "60"))
     CACHE_TTL_HOURS: int = int(os.getenv("CACHE_TTL_HOURS", "24"))
     
+    # Search result cache (see src/search_cache.py)
+    SEARCH_CACHE_TTL_SECONDS: int = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "300"))
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+    SEARCH_CACHE_SEMANTIC: bool = _envbool("SEARCH_CACHE_SEMANTIC", True)
+    SEARCH_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv("SEARCH_CACHE_SIMILARITY_THRESHOLD", "0.92"))
+    SEARCH_CACHE_EMBEDDING_MODEL: str = os.getenv(
+        "SEARCH_CACHE_EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2"
+    )
+    # On-disk embedding cache, relative to the project root (empty to disable)
+    EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", ".cache/embeddings.db")
+    
     # NLI model configuration
     NLI_MODEL_NAME: str = os.getenv("NLI_MODEL_NAME", "facebook/bart-large-mnli")
     
@@ -95,6 +121,9 @@ class Settings:
         if not (0.0 <= cls.MINIMUM_CREDIBILITY_THRESHOLD <= 1.0):
             raise ConfigurationError("MINIMUM_CREDIBILITY_THRESHOLD must be between 0.0 and 1.0")
         
+        if cls.RELEVANCE_SCORER not in ("jaccard", "bm25", "tfidf"):
+            raise ConfigurationError("RELEVANCE_SCORER must be 'jaccard', 'bm25' or 'tfidf'")
+        
         if cls.REQUEST_TIMEOUT_SECONDS <= 0:
             raise ConfigurationError("REQUEST_TIMEOUT_SECONDS must be greater than 0")
         
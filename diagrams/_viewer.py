@@ -0,0 +1,39 @@
+"""
+Shared helper for opening diagrams in the platform's default viewer
+"""
+
+import os
+import subprocess
+import sys
+
+def open_file(path):
+    """Open a file in the default viewer without blocking"""
+    try:
+        if sys.platform == "win32":
+            os.startfile(str(path))
+        elif sys.platform == "darwin":  # macOS
+            subprocess.Popen(["open", str(path)])
+        else:  # Linux
+            subprocess.Popen(["xdg-open", str(path)])
+        
+        print(f"✓ Opened: {path.name}")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Error opening {path.name}: {e}")
+        return False
+
+def open_files(paths):
+    """Open several files, batching them into one call where the platform allows it"""
+    paths = list(paths)
+    if sys.platform == "darwin" and paths:  # `open` accepts several files at once
+        try:
+            subprocess.Popen(["open", *map(str, paths)])
+        except Exception as e:
+            print(f"❌ Error opening diagrams: {e}")
+            return False
+        for path in paths:
+            print(f"✓ Opened: {path.name}")
+        return True
+    
+    return all([open_file(path) for path in paths])
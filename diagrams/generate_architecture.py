@@ -2,169 +2,284 @@
 Generate architecture diagrams for Callout system
 """
 
-from graphviz import Digraph
+import glob
+import hashlib
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 
 # Create diagrams directory if it doesn't exist
 import os
 os.makedirs('diagrams', exist_ok=True)
 
+# Layout engine for the large clustered graphs; sfdp/fdp scale better than dot on nested clusters
+LARGE_GRAPH_ENGINE = os.getenv('CALLOUT_DIAGRAM_ENGINE', 'dot')
+
+# Diagrams are rendered as SVG; set CALLOUT_DIAGRAM_PNG=true to also rasterize a PNG copy
+CONVERT_TO_PNG = os.getenv('CALLOUT_DIAGRAM_PNG', 'false').lower() == 'true'
+
+def _outputs(name):
+    """Paths this script is expected to produce for a diagram"""
+    outputs = [f'diagrams/{name}.svg']
+    if CONVERT_TO_PNG:
+        outputs.append(f'diagrams/{name}.png')
+    return outputs
+
+def _inputs_key():
+    """Digest of everything the rendered diagrams depend on: this script and the render settings"""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generate_architecture.py')
+    with open(script, 'rb') as f:
+        source = f.read()
+    settings = f'{LARGE_GRAPH_ENGINE}|{CONVERT_TO_PNG}'.encode()
+    return hashlib.blake2b(source + settings, digest_size=8).hexdigest()
+
+# Written into every stamp, so an unchanged run can exit before building any graph
+INPUTS_KEY = _inputs_key()
+
+def _stamps(name):
+    return glob.glob(f'diagrams/{name}.*.stamp')
+
+def _write_stamp(stamp):
+    with open(stamp, 'w') as f:
+        f.write(INPUTS_KEY)
+
+def _read_stamp(stamp):
+    with open(stamp) as f:
+        return f.read()
+
+def _render(dot, name):
+    """Render a diagram, skipping the dot subprocess if this exact graph was already rendered"""
+    digest = hashlib.blake2b((dot.engine + dot.format + dot.source).encode(), digest_size=8).hexdigest()
+    stamp = f'diagrams/{name}.{digest}.stamp'
+    out_path = f'diagrams/{name}.{dot.format}'
+    if os.path.exists(stamp) and all(os.path.exists(path) for path in _outputs(name)):
+        # The script changed but not this graph: record the new inputs so the next run exits early
+        if _read_stamp(stamp) != INPUTS_KEY:
+            _write_stamp(stamp)
+        print(f"✓ Up to date: {name}.{dot.format}")
+        return
+    
+    # Pipe the source straight into the layout engine instead of Digraph.render's temp .gv file
+    subprocess.run(
+        ['dot', f'-K{dot.engine}', f'-T{dot.format}', '-o', out_path],
+        input=dot.source, text=True, check=True,
+    )
+    if CONVERT_TO_PNG:
+        # Runs inside this builder's pool worker, so PNG conversions overlap too
+        subprocess.run(['rsvg-convert', '-o', f'diagrams/{name}.png', out_path], check=True)
+    for old_stamp in _stamps(name):
+        os.remove(old_stamp)
+    _write_stamp(stamp)
+    print(f"✓ Created: {name}.{dot.format}")
+
+# Shared node styles, passed as prebuilt attribute dicts instead of per-call kwargs
+BOX_NODE = {'shape': 'box', 'style': 'rounded,filled'}
+WHEAT = {'fillcolor': 'wheat'}
+LIGHTGREEN = {'fillcolor': 'lightgreen'}
+LIGHTYELLOW = {'fillcolor': 'lightyellow'}
+ORANGE = {'fillcolor': 'orange'}
+IO_NODE = {'fillcolor': 'lightgreen', 'shape': 'parallelogram'}
+NOTE = {'fillcolor': 'lightyellow', 'shape': 'note'}
+WHEAT_CYLINDER = {'fillcolor': 'wheat', 'shape': 'cylinder'}
+CORAL_CYLINDER = {'fillcolor': 'lightcoral', 'shape': 'cylinder'}
+ORANGE_CYLINDER = {'fillcolor': 'orange', 'shape': 'cylinder'}
+
+def _add_nodes(graph, nodes, _attributes=None):
+    """Add (id, label) node pairs that share the same styling"""
+    node = graph.node
+    for node_id, label in nodes:
+        node(node_id, label, _attributes=_attributes)
+
+def _add_edges(graph, edges):
+    """Add (tail, head, label) edges; a label of None draws a plain edge"""
+    edge = graph.edge
+    for tail, head, label in edges:
+        edge(tail, head, label)
+
 # 1. SYSTEM OVERVIEW DIAGRAM
 def create_system_overview():
-    dot = Digraph(comment='Callout System Overview', format='png')
+    from graphviz import Digraph
+    
+    dot = Digraph(comment='Callout System Overview', format='svg')
     dot.attr(rankdir='TB', size='12,10')
-    dot.attr('node', shape='box', style='rounded,filled', fillcolor='lightblue')
+    dot.attr('node', _attributes=BOX_NODE, fillcolor='lightblue')
     
     # User layer
-    dot.node('user', 'User\n(Web Browser)', fillcolor='lightgreen')
+    dot.node('user', 'User\n(Web Browser)', _attributes=LIGHTGREEN)
     
     # UI layer
-    dot.node('ui', 'Streamlit UI\n(app.py)', fillcolor='lightyellow')
+    dot.node('ui', 'Streamlit UI\n(app.py)', _attributes=LIGHTYELLOW)
     
     # Core pipeline
     dot.node('pipeline', 'Verification Pipeline\n(verification_pipeline.py)', fillcolor='lightcoral')
     
     # Processing modules
-    dot.node('parser', 'Article Parser\n(BeautifulSoup)', fillcolor='wheat')
-    dot.node('lang', 'Language Detection\n(langdetect)', fillcolor='wheat')
-    dot.node('claims', 'Claim Extraction\n(LLM)', fillcolor='wheat')
-    dot.node('evidence', 'Evidence Retrieval\n(Search API)', fillcolor='wheat')
-    dot.node('nli', 'NLI Verification\n(BART/mDeBERTa)', fillcolor='wheat')
-    dot.node('tone', 'Tone Analysis', fillcolor='wheat')
-    dot.node('synthesis', 'Verdict Synthesis', fillcolor='wheat')
+    _add_nodes(dot, (
+        ('parser', 'Article Parser\n(BeautifulSoup)'),
+        ('lang', 'Language Detection\n(langdetect)'),
+        ('claims', 'Claim Extraction\n(LLM)'),
+        ('evidence', 'Evidence Retrieval\n(Search API)'),
+        ('nli', 'NLI Verification\n(BART/mDeBERTa)'),
+        ('tone', 'Tone Analysis'),
+        ('synthesis', 'Verdict Synthesis'),
+    ), _attributes=WHEAT)
     
     # External services
     dot.node('api_wrapper', 'API Wrapper\n(Smart Router)', fillcolor='lightgray')
-    dot.node('self_hosted', 'Self-Hosted API\n(FastAPI + Ollama)', fillcolor='lightgreen')
-    dot.node('external', 'External APIs\n(OpenAI/Groq/Serper)', fillcolor='orange')
+    dot.node('self_hosted', 'Self-Hosted API\n(FastAPI + Ollama)', _attributes=LIGHTGREEN)
+    dot.node('external', 'External APIs\n(OpenAI/Groq/Serper)', _attributes=ORANGE)
     
     # Connections
-    dot.edge('user', 'ui', 'Submit Article')
-    dot.edge('ui', 'pipeline', 'Process')
-    dot.edge('pipeline', 'parser', '1. Parse')
-    dot.edge('pipeline', 'lang', '2. Detect Language')
-    dot.edge('pipeline', 'claims', '3. Extract Claims')
-    dot.edge('pipeline', 'evidence', '4. Search Evidence')
-    dot.edge('pipeline', 'nli', '5. Verify Claims')
-    dot.edge('pipeline', 'tone', '6. Analyze Tone')
-    dot.edge('pipeline', 'synthesis', '7. Synthesize')
-    
-    dot.edge('claims', 'api_wrapper', 'LLM Request')
-    dot.edge('evidence', 'api_wrapper', 'Search Request')
-    dot.edge('api_wrapper', 'self_hosted', 'Route (if enabled)')
-    dot.edge('api_wrapper', 'external', 'Route (if disabled)')
-    
-    dot.edge('synthesis', 'ui', 'Result')
-    dot.edge('ui', 'user', 'Display')
-    
-    dot.render('diagrams/01_system_overview', cleanup=True)
-    print("✓ Created: 01_system_overview.png")
+    _add_edges(dot, (
+        ('user', 'ui', 'Submit Article'),
+        ('ui', 'pipeline', 'Process'),
+        ('pipeline', 'parser', '1. Parse'),
+        ('pipeline', 'lang', '2. Detect Language'),
+        ('pipeline', 'claims', '3. Extract Claims'),
+        ('pipeline', 'evidence', '4. Search Evidence'),
+        ('pipeline', 'nli', '5. Verify Claims'),
+        ('pipeline', 'tone', '6. Analyze Tone'),
+        ('pipeline', 'synthesis', '7. Synthesize'),
+        
+        ('claims', 'api_wrapper', 'LLM Request'),
+        ('evidence', 'api_wrapper', 'Search Request'),
+        ('api_wrapper', 'self_hosted', 'Route (if enabled)'),
+        ('api_wrapper', 'external', 'Route (if disabled)'),
+        
+        ('synthesis', 'ui', 'Result'),
+        ('ui', 'user', 'Display'),
+    ))
+    
+    _render(dot, '01_system_overview')
 
 # 2. VERIFICATION PIPELINE DIAGRAM
 def create_verification_pipeline():
-    dot = Digraph(comment='Verification Pipeline', format='png')
+    from graphviz import Digraph
+    
+    dot = Digraph(comment='Verification Pipeline', format='svg', engine=LARGE_GRAPH_ENGINE)
     dot.attr(rankdir='TB', size='10,12')
-    dot.attr('node', shape='box', style='rounded,filled')
+    dot.attr('node', _attributes=BOX_NODE)
     
     # Input
-    dot.node('input', 'Article Input\n(URL or Text)', fillcolor='lightgreen', shape='parallelogram')
+    dot.node('input', 'Article Input\n(URL or Text)', _attributes=IO_NODE)
     
     # Stage 1
     with dot.subgraph(name='cluster_1') as c:
         c.attr(label='Stage 1: Parsing', style='filled', color='lightgray')
-        c.node('parse', 'Parse Article\n(BeautifulSoup)', fillcolor='wheat')
-        c.node('extract_text', 'Extract Text', fillcolor='wheat')
+        _add_nodes(c, (
+            ('parse', 'Parse Article\n(BeautifulSoup)'),
+            ('extract_text', 'Extract Text'),
+        ), _attributes=WHEAT)
     
     # Stage 2
     with dot.subgraph(name='cluster_2') as c:
         c.attr(label='Stage 2: Language Detection', style='filled', color='lightgray')
-        c.node('detect_lang', 'Detect Language\n(langdetect)', fillcolor='wheat')
-        c.node('select_model', 'Select NLI Model\n(BART/mDeBERTa)', fillcolor='wheat')
+        _add_nodes(c, (
+            ('detect_lang', 'Detect Language\n(langdetect)'),
+            ('select_model', 'Select NLI Model\n(BART/mDeBERTa)'),
+        ), _attributes=WHEAT)
     
     # Stage 3
     with dot.subgraph(name='cluster_3') as c:
         c.attr(label='Stage 3: Claim Extraction', style='filled', color='lightgray')
-        c.node('extract_claims', 'Extract Claims\n(LLM)', fillcolor='wheat')
-        c.node('fallback', 'Fallback\n(Rule-based)', fillcolor='orange')
+        c.node('extract_claims', 'Extract Claims\n(LLM)', _attributes=WHEAT)
+        c.node('fallback', 'Fallback\n(Rule-based)', _attributes=ORANGE)
     
     # Stage 4
     with dot.subgraph(name='cluster_4') as c:
         c.attr(label='Stage 4: Evidence Retrieval', style='filled', color='lightgray')
-        c.node('search', 'Search Evidence\n(DuckDuckGo/Serper)', fillcolor='wheat')
-        c.node('filter', 'Filter by Credibility\n(>= 0.3)', fillcolor='wheat')
-        c.node('rank', 'Rank by Relevance\n(0.7*rel + 0.3*cred)', fillcolor='wheat')
+        _add_nodes(c, (
+            ('search', 'Search Evidence\n(DuckDuckGo/Serper)'),
+            ('filter', 'Filter by Credibility\n(>= 0.3)'),
+            ('rank', 'Rank by Relevance\n(0.7*rel + 0.3*cred)'),
+        ), _attributes=WHEAT)
     
     # Stage 5
     with dot.subgraph(name='cluster_5') as c:
         c.attr(label='Stage 5: NLI Verification', style='filled', color='lightgray')
-        c.node('nli_verify', 'Verify Each Claim\n(NLI Model)', fillcolor='wheat')
-        c.node('confidence', 'Calculate Confidence', fillcolor='wheat')
+        _add_nodes(c, (
+            ('nli_verify', 'Verify Each Claim\n(NLI Model)'),
+            ('confidence', 'Calculate Confidence'),
+        ), _attributes=WHEAT)
     
     # Stage 6
     with dot.subgraph(name='cluster_6') as c:
         c.attr(label='Stage 6: Analysis', style='filled', color='lightgray')
-        c.node('tone_analysis', 'Tone Analysis\n(Sentiment)', fillcolor='wheat')
-        c.node('aggregate', 'Aggregate Results', fillcolor='wheat')
+        _add_nodes(c, (
+            ('tone_analysis', 'Tone Analysis\n(Sentiment)'),
+            ('aggregate', 'Aggregate Results'),
+        ), _attributes=WHEAT)
     
     # Stage 7
     with dot.subgraph(name='cluster_7') as c:
         c.attr(label='Stage 7: Synthesis', style='filled', color='lightgray')
-        c.node('synthesize', 'Synthesize Verdict', fillcolor='wheat')
-        c.node('explain', 'Generate Explanation', fillcolor='wheat')
+        _add_nodes(c, (
+            ('synthesize', 'Synthesize Verdict'),
+            ('explain', 'Generate Explanation'),
+        ), _attributes=WHEAT)
     
     # Output
-    dot.node('output', 'Verification Result\n(Verdict + Evidence)', fillcolor='lightgreen', shape='parallelogram')
+    dot.node('output', 'Verification Result\n(Verdict + Evidence)', _attributes=IO_NODE)
     
     # Connections
-    dot.edge('input', 'parse')
-    dot.edge('parse', 'extract_text')
-    dot.edge('extract_text', 'detect_lang')
-    dot.edge('detect_lang', 'select_model')
-    dot.edge('select_model', 'extract_claims')
-    dot.edge('extract_claims', 'search', label='Success')
+    _add_edges(dot, (
+        ('input', 'parse', None),
+        ('parse', 'extract_text', None),
+        ('extract_text', 'detect_lang', None),
+        ('detect_lang', 'select_model', None),
+        ('select_model', 'extract_claims', None),
+        ('extract_claims', 'search', 'Success'),
+    ))
     dot.edge('extract_claims', 'fallback', label='Failure', style='dashed')
-    dot.edge('fallback', 'search')
-    dot.edge('search', 'filter')
-    dot.edge('filter', 'rank')
-    dot.edge('rank', 'nli_verify')
-    dot.edge('nli_verify', 'confidence')
-    dot.edge('confidence', 'tone_analysis')
-    dot.edge('tone_analysis', 'aggregate')
-    dot.edge('aggregate', 'synthesize')
-    dot.edge('synthesize', 'explain')
-    dot.edge('explain', 'output')
-    
-    dot.render('diagrams/02_verification_pipeline', cleanup=True)
-    print("✓ Created: 02_verification_pipeline.png")
+    _add_edges(dot, (
+        ('fallback', 'search', None),
+        ('search', 'filter', None),
+        ('filter', 'rank', None),
+        ('rank', 'nli_verify', None),
+        ('nli_verify', 'confidence', None),
+        ('confidence', 'tone_analysis', None),
+        ('tone_analysis', 'aggregate', None),
+        ('aggregate', 'synthesize', None),
+        ('synthesize', 'explain', None),
+        ('explain', 'output', None),
+    ))
+    
+    _render(dot, '02_verification_pipeline')
 
 # 3. SELF-HOSTED API ARCHITECTURE
 def create_self_hosted_architecture():
-    dot = Digraph(comment='Self-Hosted API Architecture', format='png')
+    from graphviz import Digraph
+    
+    dot = Digraph(comment='Self-Hosted API Architecture', format='svg')
     dot.attr(rankdir='LR', size='12,8')
-    dot.attr('node', shape='box', style='rounded,filled')
+    dot.attr('node', _attributes=BOX_NODE)
     
     # Client
-    dot.node('client', 'Callout App\n(Streamlit)', fillcolor='lightgreen')
+    dot.node('client', 'Callout App\n(Streamlit)', _attributes=LIGHTGREEN)
     
     # API Wrapper
-    dot.node('wrapper', 'API Wrapper\n(api_wrapper.py)', fillcolor='lightyellow')
+    dot.node('wrapper', 'API Wrapper\n(api_wrapper.py)', _attributes=LIGHTYELLOW)
     
     # Self-hosted API
     with dot.subgraph(name='cluster_api') as c:
         c.attr(label='Self-Hosted API Server', style='filled', color='lightblue')
-        c.node('fastapi', 'FastAPI\n(app.py)', fillcolor='wheat')
-        c.node('llm_service', 'LLM Service\n(llm_service.py)', fillcolor='wheat')
-        c.node('search_service', 'Search Service\n(search_service.py)', fillcolor='wheat')
+        _add_nodes(c, (
+            ('fastapi', 'FastAPI\n(app.py)'),
+            ('llm_service', 'LLM Service\n(llm_service.py)'),
+            ('search_service', 'Search Service\n(search_service.py)'),
+        ), _attributes=WHEAT)
     
     # Backend services
-    dot.node('ollama', 'Ollama\n(Local LLM)', fillcolor='lightcoral', shape='cylinder')
-    dot.node('duckduckgo', 'DuckDuckGo\n(Free Search)', fillcolor='lightcoral', shape='cylinder')
+    dot.node('ollama', 'Ollama\n(Local LLM)', _attributes=CORAL_CYLINDER)
+    dot.node('duckduckgo', 'DuckDuckGo\n(Free Search)', _attributes=CORAL_CYLINDER)
     
     # External APIs (alternative)
     with dot.subgraph(name='cluster_external') as c:
         c.attr(label='External APIs (Optional)', style='filled', color='orange')
-        c.node('openai', 'OpenAI\n(GPT-4)', fillcolor='wheat')
-        c.node('groq', 'Groq\n(Llama)', fillcolor='wheat')
-        c.node('serper', 'Serper\n(Google Search)', fillcolor='wheat')
+        _add_nodes(c, (
+            ('openai', 'OpenAI\n(GPT-4)'),
+            ('groq', 'Groq\n(Llama)'),
+            ('serper', 'Serper\n(Google Search)'),
+        ), _attributes=WHEAT)
     
     # Connections
     dot.edge('client', 'wrapper', 'Request')
@@ -173,39 +288,42 @@ def create_self_hosted_architecture():
     dot.edge('wrapper', 'groq', 'External\n(if disabled)', color='orange', style='dashed')
     dot.edge('wrapper', 'serper', 'External\n(if disabled)', color='orange', style='dashed')
     
-    dot.edge('fastapi', 'llm_service', 'Claim Extraction')
-    dot.edge('fastapi', 'search_service', 'Evidence Search')
-    
-    dot.edge('llm_service', 'ollama', 'LLM Request')
-    dot.edge('search_service', 'duckduckgo', 'Search Query')
-    
-    dot.edge('ollama', 'llm_service', 'Response')
-    dot.edge('duckduckgo', 'search_service', 'Results')
-    
-    dot.edge('llm_service', 'fastapi', 'Claims')
-    dot.edge('search_service', 'fastapi', 'Evidence')
-    
-    dot.edge('fastapi', 'wrapper', 'Response')
+    _add_edges(dot, (
+        ('fastapi', 'llm_service', 'Claim Extraction'),
+        ('fastapi', 'search_service', 'Evidence Search'),
+        
+        ('llm_service', 'ollama', 'LLM Request'),
+        ('search_service', 'duckduckgo', 'Search Query'),
+        
+        ('ollama', 'llm_service', 'Response'),
+        ('duckduckgo', 'search_service', 'Results'),
+        
+        ('llm_service', 'fastapi', 'Claims'),
+        ('search_service', 'fastapi', 'Evidence'),
+        
+        ('fastapi', 'wrapper', 'Response'),
+    ))
     dot.edge('openai', 'wrapper', 'Response', style='dashed')
     dot.edge('groq', 'wrapper', 'Response', style='dashed')
     dot.edge('serper', 'wrapper', 'Response', style='dashed')
     
     dot.edge('wrapper', 'client', 'Result')
     
-    dot.render('diagrams/03_self_hosted_architecture', cleanup=True)
-    print("✓ Created: 03_self_hosted_architecture.png")
+    _render(dot, '03_self_hosted_architecture')
 
 # 4. MULTILINGUAL PIPELINE
 def create_multilingual_pipeline():
-    dot = Digraph(comment='Multilingual Pipeline', format='png')
+    from graphviz import Digraph
+    
+    dot = Digraph(comment='Multilingual Pipeline', format='svg')
     dot.attr(rankdir='TB', size='10,10')
-    dot.attr('node', shape='box', style='rounded,filled')
+    dot.attr('node', _attributes=BOX_NODE)
     
     # Input
-    dot.node('input', 'Article Text\n(Any Language)', fillcolor='lightgreen', shape='parallelogram')
+    dot.node('input', 'Article Text\n(Any Language)', _attributes=IO_NODE)
     
     # Language detection
-    dot.node('detect', 'Language Detection\n(langdetect)', fillcolor='lightyellow')
+    dot.node('detect', 'Language Detection\n(langdetect)', _attributes=LIGHTYELLOW)
     
     # Language routing
     dot.node('route', 'Route by Language', fillcolor='lightcoral', shape='diamond')
@@ -213,170 +331,230 @@ def create_multilingual_pipeline():
     # English path
     with dot.subgraph(name='cluster_en') as c:
         c.attr(label='English Path', style='filled', color='lightblue')
-        c.node('en_model', 'BART-large-mnli\n(95% accuracy)', fillcolor='wheat')
-        c.node('en_prompt', 'English Prompts', fillcolor='wheat')
+        _add_nodes(c, (
+            ('en_model', 'BART-large-mnli\n(95% accuracy)'),
+            ('en_prompt', 'English Prompts'),
+        ), _attributes=WHEAT)
     
     # Multilingual path
     with dot.subgraph(name='cluster_ml') as c:
         c.attr(label='Multilingual Path (19 languages)', style='filled', color='lightgreen')
-        c.node('ml_model', 'mDeBERTa-v3-xnli\n(90% accuracy)', fillcolor='wheat')
-        c.node('ml_prompt', 'Native Prompts\n(Hindi, Spanish, etc.)', fillcolor='wheat')
+        _add_nodes(c, (
+            ('ml_model', 'mDeBERTa-v3-xnli\n(90% accuracy)'),
+            ('ml_prompt', 'Native Prompts\n(Hindi, Spanish, etc.)'),
+        ), _attributes=WHEAT)
     
     # Cross-lingual verification
-    dot.node('cross_lingual', 'Cross-Lingual NLI\n(Hindi claim vs English evidence)', fillcolor='orange')
+    dot.node('cross_lingual', 'Cross-Lingual NLI\n(Hindi claim vs English evidence)', _attributes=ORANGE)
     
     # Output
-    dot.node('output', 'Verification Result\n(Native Language)', fillcolor='lightgreen', shape='parallelogram')
+    dot.node('output', 'Verification Result\n(Native Language)', _attributes=IO_NODE)
     
     # Connections
-    dot.edge('input', 'detect')
-    dot.edge('detect', 'route')
-    dot.edge('route', 'en_model', label='English (en)')
-    dot.edge('route', 'ml_model', label='Other (hi, es, fr, etc.)')
-    
-    dot.edge('en_model', 'en_prompt')
-    dot.edge('ml_model', 'ml_prompt')
-    
-    dot.edge('en_prompt', 'cross_lingual')
-    dot.edge('ml_prompt', 'cross_lingual')
-    
-    dot.edge('cross_lingual', 'output')
+    _add_edges(dot, (
+        ('input', 'detect', None),
+        ('detect', 'route', None),
+        ('route', 'en_model', 'English (en)'),
+        ('route', 'ml_model', 'Other (hi, es, fr, etc.)'),
+        
+        ('en_model', 'en_prompt', None),
+        ('ml_model', 'ml_prompt', None),
+        
+        ('en_prompt', 'cross_lingual', None),
+        ('ml_prompt', 'cross_lingual', None),
+        
+        ('cross_lingual', 'output', None),
+    ))
     
     # Add language examples
     dot.node('langs', '19 Languages:\n• English\n• Hindi, Bengali, Tamil\n• Spanish, French, German\n• Chinese, Japanese, Arabic\n• And 10 more...', 
-             fillcolor='lightyellow', shape='note')
+             _attributes=NOTE)
     
-    dot.render('diagrams/04_multilingual_pipeline', cleanup=True)
-    print("✓ Created: 04_multilingual_pipeline.png")
+    _render(dot, '04_multilingual_pipeline')
 
 # 5. DEPLOYMENT ARCHITECTURE
 def create_deployment_architecture():
-    dot = Digraph(comment='Deployment Architecture', format='png')
+    from graphviz import Digraph
+    
+    dot = Digraph(comment='Deployment Architecture', format='svg', engine=LARGE_GRAPH_ENGINE)
     dot.attr(rankdir='TB', size='12,10')
-    dot.attr('node', shape='box', style='rounded,filled')
+    dot.attr('node', _attributes=BOX_NODE)
     
     # User
     dot.node('users', 'Users\n(Web Browsers)', fillcolor='lightgreen', shape='ellipse')
     
     # Load balancer
-    dot.node('lb', 'Load Balancer\n(nginx)', fillcolor='lightyellow')
+    dot.node('lb', 'Load Balancer\n(nginx)', _attributes=LIGHTYELLOW)
     
     # Application instances
     with dot.subgraph(name='cluster_app') as c:
         c.attr(label='Application Layer (Docker Compose)', style='filled', color='lightblue')
-        c.node('app1', 'Streamlit UI\nInstance 1', fillcolor='wheat')
-        c.node('app2', 'Streamlit UI\nInstance 2', fillcolor='wheat')
-        c.node('app3', 'Streamlit UI\nInstance N', fillcolor='wheat')
+        _add_nodes(c, (
+            ('app1', 'Streamlit UI\nInstance 1'),
+            ('app2', 'Streamlit UI\nInstance 2'),
+            ('app3', 'Streamlit UI\nInstance N'),
+        ), _attributes=WHEAT)
     
     # API instances
     with dot.subgraph(name='cluster_api') as c:
         c.attr(label='API Layer (Docker Compose)', style='filled', color='lightcoral')
-        c.node('api1', 'FastAPI\nInstance 1', fillcolor='wheat')
-        c.node('api2', 'FastAPI\nInstance 2', fillcolor='wheat')
-        c.node('api3', 'FastAPI\nInstance N', fillcolor='wheat')
+        _add_nodes(c, (
+            ('api1', 'FastAPI\nInstance 1'),
+            ('api2', 'FastAPI\nInstance 2'),
+            ('api3', 'FastAPI\nInstance N'),
+        ), _attributes=WHEAT)
     
     # Backend services
     with dot.subgraph(name='cluster_backend') as c:
         c.attr(label='Backend Services', style='filled', color='lightgreen')
-        c.node('ollama1', 'Ollama\nInstance 1', fillcolor='wheat', shape='cylinder')
-        c.node('ollama2', 'Ollama\nInstance 2', fillcolor='wheat', shape='cylinder')
+        _add_nodes(c, (
+            ('ollama1', 'Ollama\nInstance 1'),
+            ('ollama2', 'Ollama\nInstance 2'),
+        ), _attributes=WHEAT_CYLINDER)
     
     # Cache
-    dot.node('redis', 'Redis Cache\n(80% hit rate)', fillcolor='orange', shape='cylinder')
+    dot.node('redis', 'Redis Cache\n(80% hit rate)', _attributes=ORANGE_CYLINDER)
     
     # Database
-    dot.node('db', 'PostgreSQL\n(Verification History)', fillcolor='orange', shape='cylinder')
+    dot.node('db', 'PostgreSQL\n(Verification History)', _attributes=ORANGE_CYLINDER)
     
     # Monitoring
     with dot.subgraph(name='cluster_monitor') as c:
         c.attr(label='Monitoring', style='filled', color='yellow')
-        c.node('prometheus', 'Prometheus\n(Metrics)', fillcolor='wheat')
-        c.node('grafana', 'Grafana\n(Dashboards)', fillcolor='wheat')
+        _add_nodes(c, (
+            ('prometheus', 'Prometheus\n(Metrics)'),
+            ('grafana', 'Grafana\n(Dashboards)'),
+        ), _attributes=WHEAT)
     
     # Connections
-    dot.edge('users', 'lb', 'HTTPS')
-    dot.edge('lb', 'app1')
-    dot.edge('lb', 'app2')
-    dot.edge('lb', 'app3')
-    
-    dot.edge('app1', 'api1')
-    dot.edge('app2', 'api2')
-    dot.edge('app3', 'api3')
-    
-    dot.edge('api1', 'ollama1')
-    dot.edge('api2', 'ollama2')
-    dot.edge('api3', 'ollama1')
-    
-    dot.edge('api1', 'redis', 'Cache Check')
-    dot.edge('api2', 'redis', 'Cache Check')
-    dot.edge('api3', 'redis', 'Cache Check')
-    
-    dot.edge('api1', 'db', 'Store Results')
-    dot.edge('api2', 'db', 'Store Results')
-    dot.edge('api3', 'db', 'Store Results')
+    _add_edges(dot, (
+        ('users', 'lb', 'HTTPS'),
+        ('lb', 'app1', None),
+        ('lb', 'app2', None),
+        ('lb', 'app3', None),
+        
+        ('app1', 'api1', None),
+        ('app2', 'api2', None),
+        ('app3', 'api3', None),
+        
+        ('api1', 'ollama1', None),
+        ('api2', 'ollama2', None),
+        ('api3', 'ollama1', None),
+        
+        ('api1', 'redis', 'Cache Check'),
+        ('api2', 'redis', 'Cache Check'),
+        ('api3', 'redis', 'Cache Check'),
+        
+        ('api1', 'db', 'Store Results'),
+        ('api2', 'db', 'Store Results'),
+        ('api3', 'db', 'Store Results'),
+    ))
     
     dot.edge('app1', 'prometheus', 'Metrics', style='dashed')
     dot.edge('api1', 'prometheus', 'Metrics', style='dashed')
     dot.edge('prometheus', 'grafana', 'Query')
     
-    dot.render('diagrams/05_deployment_architecture', cleanup=True)
-    print("✓ Created: 05_deployment_architecture.png")
+    _render(dot, '05_deployment_architecture')
 
 # 6. DATA FLOW DIAGRAM
 def create_data_flow():
-    dot = Digraph(comment='Data Flow', format='png')
+    from graphviz import Digraph
+    
+    dot = Digraph(comment='Data Flow', format='svg')
     dot.attr(rankdir='LR', size='14,10')
-    dot.attr('node', shape='box', style='rounded,filled')
+    dot.attr('node', _attributes=BOX_NODE)
     
     # Input
     dot.node('article', 'Article\n"Economy grew 10%"', fillcolor='lightgreen', shape='note')
     
     # Processing stages
-    dot.node('claims', 'Claims\n["Economy grew 10%"]', fillcolor='lightyellow', shape='note')
-    dot.node('evidence', 'Evidence\n["Official data: 5% growth"]', fillcolor='lightyellow', shape='note')
-    dot.node('nli_result', 'NLI Result\nCONTRADICTED (95%)', fillcolor='lightyellow', shape='note')
+    _add_nodes(dot, (
+        ('claims', 'Claims\n["Economy grew 10%"]'),
+        ('evidence', 'Evidence\n["Official data: 5% growth"]'),
+        ('nli_result', 'NLI Result\nCONTRADICTED (95%)'),
+    ), _attributes=NOTE)
     dot.node('verdict', 'Final Verdict\nFALSE (95% confidence)', fillcolor='lightcoral', shape='note')
     
     # Processing nodes
-    dot.node('extract', 'Claim Extraction\n(LLM)', fillcolor='wheat')
-    dot.node('search', 'Evidence Search\n(DuckDuckGo)', fillcolor='wheat')
-    dot.node('verify', 'NLI Verification\n(BART)', fillcolor='wheat')
-    dot.node('synthesize', 'Synthesis\n(Aggregate)', fillcolor='wheat')
+    _add_nodes(dot, (
+        ('extract', 'Claim Extraction\n(LLM)'),
+        ('search', 'Evidence Search\n(DuckDuckGo)'),
+        ('verify', 'NLI Verification\n(BART)'),
+        ('synthesize', 'Synthesis\n(Aggregate)'),
+    ), _attributes=WHEAT)
     
     # Connections with data labels
-    dot.edge('article', 'extract', 'Input Text')
-    dot.edge('extract', 'claims', 'Extract')
-    dot.edge('claims', 'search', 'Query')
-    dot.edge('search', 'evidence', 'Retrieve')
-    dot.edge('claims', 'verify', 'Hypothesis')
-    dot.edge('evidence', 'verify', 'Premise')
-    dot.edge('verify', 'nli_result', 'Classify')
-    dot.edge('nli_result', 'synthesize', 'Aggregate')
-    dot.edge('synthesize', 'verdict', 'Output')
-    
-    dot.render('diagrams/06_data_flow', cleanup=True)
-    print("✓ Created: 06_data_flow.png")
+    _add_edges(dot, (
+        ('article', 'extract', 'Input Text'),
+        ('extract', 'claims', 'Extract'),
+        ('claims', 'search', 'Query'),
+        ('search', 'evidence', 'Retrieve'),
+        ('claims', 'verify', 'Hypothesis'),
+        ('evidence', 'verify', 'Premise'),
+        ('verify', 'nli_result', 'Classify'),
+        ('nli_result', 'synthesize', 'Aggregate'),
+        ('synthesize', 'verdict', 'Output'),
+    ))
+    
+    _render(dot, '06_data_flow')
+
+DIAGRAM_BUILDERS = (
+    create_system_overview,
+    create_verification_pipeline,
+    create_self_hosted_architecture,
+    create_multilingual_pipeline,
+    create_deployment_architecture,
+    create_data_flow,
+)
+
+DIAGRAM_NAMES = (
+    '01_system_overview',
+    '02_verification_pipeline',
+    '03_self_hosted_architecture',
+    '04_multilingual_pipeline',
+    '05_deployment_architecture',
+    '06_data_flow',
+)
+
+def _call(builder):
+    builder()
+
+def _all_up_to_date():
+    """Check whether every diagram was rendered from the current script and settings"""
+    for name in DIAGRAM_NAMES:
+        stamps = _stamps(name)
+        if len(stamps) != 1 or _read_stamp(stamps[0]) != INPUTS_KEY:
+            return False
+        if not all(os.path.exists(path) for path in _outputs(name)):
+            return False
+    return True
 
 # Generate all diagrams
 if __name__ == "__main__":
+    # Bail out before graphviz is ever imported when there is nothing to do
+    if _all_up_to_date():
+        print("✓ All diagrams up to date")
+        raise SystemExit(0)
+    
     print("Generating architecture diagrams...")
     print()
     
-    create_system_overview()
-    create_verification_pipeline()
-    create_self_hosted_architecture()
-    create_multilingual_pipeline()
-    create_deployment_architecture()
-    create_data_flow()
+    # Resolves to the Cython build when setup_speedups.py has been run, else to this file
+    from generate_architecture import DIAGRAM_BUILDERS
+    
+    # Each builder renders through its own `dot` subprocess, so run them side by side
+    max_workers = min(len(DIAGRAM_BUILDERS), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_call, DIAGRAM_BUILDERS))
     
     print()
     print("✓ All diagrams generated successfully!")
     print("✓ Location: diagrams/ folder")
     print()
     print("Diagrams created:")
-    print("  1. 01_system_overview.png - High-level system architecture")
-    print("  2. 02_verification_pipeline.png - Detailed verification pipeline")
-    print("  3. 03_self_hosted_architecture.png - Self-hosted API architecture")
-    print("  4. 04_multilingual_pipeline.png - Multilingual processing")
-    print("  5. 05_deployment_architecture.png - Production deployment")
-    print("  6. 06_data_flow.png - Data flow example")
+    print("  1. 01_system_overview.svg - High-level system architecture")
+    print("  2. 02_verification_pipeline.svg - Detailed verification pipeline")
+    print("  3. 03_self_hosted_architecture.svg - Self-hosted API architecture")
+    print("  4. 04_multilingual_pipeline.svg - Multilingual processing")
+    print("  5. 05_deployment_architecture.svg - Production deployment")
+    print("  6. 06_data_flow.svg - Data flow example")
@@ -1,12 +1,13 @@
 """
 Interactive Diagram Viewer
-Select and view specific diagrams
+Select and view specific diagrams, or run with `all` to open every diagram and exit
 """
 
-import os
 import sys
 from pathlib import Path
 
+from _viewer import open_file, open_files
+
 def show_menu():
     """Display menu of available diagrams"""
     print()
@@ -35,26 +36,20 @@ def show_menu():
     print("     → Concrete example with real data")
     print()
     print("  A. View ALL diagrams")
+    print("  R. Refresh file list")
     print("  Q. Quit")
     print()
     print("=" * 60)
 
-def open_diagram(diagram_path):
-    """Open a diagram in the default viewer"""
-    try:
-        if sys.platform == "win32":
-            os.startfile(str(diagram_path))
-        elif sys.platform == "darwin":  # macOS
-            os.system(f"open '{diagram_path}'")
-        else:  # Linux
-            os.system(f"xdg-open '{diagram_path}'")
-        
-        print(f"✓ Opened: {diagram_path.name}")
-        return True
-    
-    except Exception as e:
-        print(f"❌ Error opening diagram: {e}")
-        return False
+def _find_existing(diagram_paths):
+    """Map choices to files on disk, falling back to a PNG when no SVG was rendered"""
+    existing = {}
+    for key, path in diagram_paths.items():
+        for candidate in (path, path.with_suffix('.png')):
+            if candidate.exists():
+                existing[key] = candidate
+                break
+    return existing
 
 def main():
     """Main interactive loop"""
@@ -64,18 +59,29 @@ def main():
     
     # Map choices to files
     diagram_files = {
-        '1': '01_system_overview.png',
-        '2': '02_verification_pipeline.png',
-        '3': '03_self_hosted_architecture.png',
-        '4': '04_multilingual_pipeline.png',
-        '5': '05_deployment_architecture.png',
-        '6': '06_data_flow.png'
+        '1': '01_system_overview.svg',
+        '2': '02_verification_pipeline.svg',
+        '3': '03_self_hosted_architecture.svg',
+        '4': '04_multilingual_pipeline.svg',
+        '5': '05_deployment_architecture.svg',
+        '6': '06_data_flow.svg'
     }
     
+    # Build the paths and check which files exist once, not on every menu redraw
+    diagram_paths = {key: diagrams_dir / name for key, name in diagram_files.items()}
+    existing = _find_existing(diagram_paths)
+    
+    # Non-interactive mode: `python show_diagram.py all` opens everything and exits
+    if len(sys.argv) > 1 and sys.argv[1].lower() in ('all', 'a'):
+        open_files(existing.values())
+        for key in sorted(diagram_files.keys() - existing.keys()):
+            print(f"❌ File not found: {diagram_files[key]}")
+        return
+    
     while True:
         show_menu()
         
-        choice = input("Select a diagram (1-6, A, Q): ").strip().upper()
+        choice = input("Select a diagram (1-6, A, R, Q): ").strip().upper()
         
         if choice == 'Q':
             print()
@@ -83,40 +89,44 @@ def main():
             print()
             break
         
+        elif choice == 'R':
+            existing = _find_existing(diagram_paths)
+            print()
+            print(f"✓ Found {len(existing)} of {len(diagram_paths)} diagrams")
+            print()
+            input("Press Enter to continue...")
+        
         elif choice == 'A':
             print()
             print("Opening all diagrams...")
             print()
-            for file_name in diagram_files.values():
-                diagram_path = diagrams_dir / file_name
-                if diagram_path.exists():
-                    open_diagram(diagram_path)
-                else:
-                    print(f"❌ File not found: {file_name}")
+            for diagram_path in existing.values():
+                open_file(diagram_path)
+            for key in sorted(diagram_files.keys() - existing.keys()):
+                print(f"❌ File not found: {diagram_files[key]}")
             print()
             input("Press Enter to continue...")
         
         elif choice in diagram_files:
             file_name = diagram_files[choice]
-            diagram_path = diagrams_dir / file_name
             
-            if diagram_path.exists():
+            if choice in existing:
                 print()
                 print(f"Opening: {file_name}")
                 print()
-                open_diagram(diagram_path)
+                open_file(existing[choice])
                 print()
                 input("Press Enter to continue...")
             else:
                 print()
                 print(f"❌ File not found: {file_name}")
-                print("Run 'python generate_architecture.py' to generate diagrams.")
+                print("Run 'python generate_architecture.py' to generate diagrams, then press R.")
                 print()
                 input("Press Enter to continue...")
         
         else:
             print()
-            print("❌ Invalid choice. Please select 1-6, A, or Q.")
+            print("❌ Invalid choice. Please select 1-6, A, R, or Q.")
             print()
             input("Press Enter to continue...")
 
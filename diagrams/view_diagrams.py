@@ -3,50 +3,39 @@ View Architecture Diagrams
 Opens all generated diagrams in your default image viewer
 """
 
-import os
-import sys
 from pathlib import Path
 
+from _viewer import open_files
+
 def view_diagrams():
-    """Open all diagram PNG files"""
+    """Open all diagram files (the SVG of each diagram, or its PNG when no SVG was rendered)"""
     
     # Get the diagrams directory
     diagrams_dir = Path(__file__).parent
     
-    # Find all PNG files
-    png_files = sorted(diagrams_dir.glob("*.png"))
+    # Find all diagram files, falling back to the PNG per diagram
+    svg_files = list(diagrams_dir.glob("*.svg"))
+    svg_stems = {path.stem for path in svg_files}
+    png_files = [path for path in diagrams_dir.glob("*.png") if path.stem not in svg_stems]
+    diagram_files = sorted(svg_files + png_files)
     
-    if not png_files:
+    if not diagram_files:
         print("❌ No diagram files found!")
         print("Run 'python generate_architecture.py' first to generate diagrams.")
         return
     
-    print("📊 Found {} diagrams:".format(len(png_files)))
+    print("📊 Found {} diagrams:".format(len(diagram_files)))
     print()
     
-    for i, png_file in enumerate(png_files, 1):
-        file_size = png_file.stat().st_size / 1024  # KB
-        print(f"  {i}. {png_file.name} ({file_size:.1f} KB)")
+    for i, diagram_file in enumerate(diagram_files, 1):
+        file_size = diagram_file.stat().st_size / 1024  # KB
+        print(f"  {i}. {diagram_file.name} ({file_size:.1f} KB)")
     
     print()
     print("Opening diagrams in your default image viewer...")
     print()
     
-    # Open each diagram
-    for png_file in png_files:
-        try:
-            # Use the appropriate command based on OS
-            if sys.platform == "win32":
-                os.startfile(str(png_file))
-            elif sys.platform == "darwin":  # macOS
-                os.system(f"open '{png_file}'")
-            else:  # Linux
-                os.system(f"xdg-open '{png_file}'")
-            
-            print(f"✓ Opened: {png_file.name}")
-        
-        except Exception as e:
-            print(f"❌ Error opening {png_file.name}: {e}")
+    open_files(diagram_files)
     
     print()
     print("✓ All diagrams opened!")
@@ -58,6 +47,8 @@ def view_diagrams():
     print("  4. Multilingual Pipeline - 19 languages")
     print("  5. Deployment Architecture - Production setup")
     print("  6. Data Flow - Concrete example")
+    print("  7. Custom Model Training - Training and continuous learning")
+    print("  8. Model Selection Strategy - Pre-trained vs custom models")
 
 if __name__ == "__main__":
     view_diagrams()
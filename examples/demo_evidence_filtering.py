@@ -17,21 +17,11 @@ import os
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.models import Claim
-from src.evidence_retrieval import (
-    optimizeQueryForSearch,
-    calculateRelevance,
-    filterTrustedSources,
-    searchEvidence,
-    SearchResult,
-    SearchAPIError,
-    RateLimitError
-)
-from config.settings import settings
-
 
 def demo_query_optimization():
     """Demonstrate query optimization."""
+    from src.evidence_retrieval import optimizeQueryForSearch
+    
     print("=" * 70)
     print("Demo 1: Query Optimization")
     print("=" * 70)
@@ -55,6 +45,8 @@ def demo_query_optimization():
 
 def demo_relevance_calculation():
     """Demonstrate relevance scoring."""
+    from src.evidence_retrieval import calculateRelevanceBatch
+    
     print("\n" + "=" * 70)
     print("Demo 2: Relevance Calculation")
     print("=" * 70)
@@ -72,8 +64,9 @@ def demo_relevance_calculation():
     print("\nRelevance scores:")
     print("-" * 70)
     
-    for label, snippet in snippets:
-        score = calculateRelevance(claim, snippet)
+    scores = calculateRelevanceBatch(claim, [snippet for _, snippet in snippets])
+    
+    for (label, snippet), score in zip(snippets, scores):
         print(f"\n{label}: {score:.3f}")
         print(f"Snippet: {snippet}")
     
@@ -82,6 +75,9 @@ def demo_relevance_calculation():
 
 def demo_source_filtering():
     """Demonstrate source credibility filtering."""
+    from config.settings import settings
+    from src.evidence_retrieval import filterTrustedSources, SearchResult
+    
     print("\n" + "=" * 70)
     print("Demo 3: Source Credibility Filtering")
     print("=" * 70)
@@ -128,6 +124,10 @@ def demo_source_filtering():
 
 def demo_complete_workflow():
     """Demonstrate the complete searchEvidence workflow."""
+    from config.settings import settings
+    from src.models import Claim
+    from src.evidence_retrieval import searchEvidence, SearchAPIError, RateLimitError
+    
     print("\n" + "=" * 70)
     print("Demo 4: Complete Evidence Search Workflow")
     print("=" * 70)
@@ -163,12 +163,10 @@ def demo_complete_workflow():
             print("-" * 70)
             
             for i, evidence in enumerate(evidence_list, 1):
-                combined = 0.7 * evidence.relevanceScore + 0.3 * evidence.credibilityScore
-                
                 print(f"\n{i}. {evidence.sourceDomain}")
                 print(f"   Credibility: {evidence.credibilityScore:.2f}")
                 print(f"   Relevance:   {evidence.relevanceScore:.2f}")
-                print(f"   Combined:    {combined:.2f}")
+                print(f"   Combined:    {evidence.combinedScore:.2f}")
                 print(f"   URL: {evidence.sourceURL}")
                 print(f"   Snippet: {evidence.snippet[:100]}...")
         
@@ -185,6 +183,9 @@ def demo_complete_workflow():
 
 def demo_edge_cases():
     """Demonstrate edge case handling."""
+    from src.models import Claim
+    from src.evidence_retrieval import calculateRelevance, filterTrustedSources
+    
     print("\n" + "=" * 70)
     print("Demo 5: Edge Case Handling")
     print("=" * 70)
@@ -13,11 +13,11 @@ import os
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.evidence_retrieval import callSearchAPI, extractDomain, SearchAPIError, RateLimitError
-
 
 def demo_basic_search():
     """Demonstrate basic search functionality."""
+    from src.evidence_retrieval import callSearchAPI, SearchAPIError, RateLimitError
+    
     print("=" * 60)
     print("Demo: Basic Search API Integration")
     print("=" * 60)
@@ -50,6 +50,8 @@ def demo_basic_search():
 
 def demo_domain_extraction():
     """Demonstrate domain extraction functionality."""
+    from src.evidence_retrieval import extractDomain
+    
     print("\n" + "=" * 60)
     print("Demo: Domain Extraction")
     print("=" * 60)
@@ -72,6 +74,8 @@ def demo_domain_extraction():
 
 def demo_error_handling():
     """Demonstrate error handling."""
+    from src.evidence_retrieval import callSearchAPI
+    
     print("\n" + "=" * 60)
     print("Demo: Error Handling")
     print("=" * 60)
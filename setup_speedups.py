@@ -0,0 +1,38 @@
+"""
+Optional Cython build of the pure-Python hot paths
+
+src/_relevance_core.py (evidence relevance scoring) and
+diagrams/generate_architecture.py (the diagram generators) are plain Python
+and compile unchanged in Cython's pure-Python mode. Building is opt-in; run
+from the repository root:
+
+    CALLOUT_ENABLE_SPEEDUPS=1 python setup_speedups.py build_ext --inplace
+
+Each extension module is written next to its source file and takes precedence
+over it on import: evidence_retrieval picks up src._relevance_core, and
+generate_architecture.py picks up the compiled generators.
+"""
+
+import os
+import sys
+
+if not os.environ.get('CALLOUT_ENABLE_SPEEDUPS'):
+    print("Set CALLOUT_ENABLE_SPEEDUPS=1 to build the compiled modules.")
+    sys.exit(0)
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name='callout-speedups',
+    ext_modules=cythonize(
+        [
+            Extension('src._relevance_core', ['src/_relevance_core.py']),
+            # diagrams/ is a script directory, not a package: the module is
+            # imported as plain `generate_architecture` from inside it
+            Extension('diagrams.generate_architecture', ['diagrams/generate_architecture.py']),
+        ],
+        language_level=3,
+    ),
+    zip_safe=False,
+)
@@ -0,0 +1,55 @@
+"""
+Tokenization and lexical scoring used by evidence relevance ranking.
+
+Kept free of other project imports so it also compiles unchanged in Cython's
+pure-Python mode (see setup_speedups.py). When the compiled extension is
+built it sits next to this file and is imported in its place.
+"""
+
+# Common words ignored when comparing claims and snippets
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
+    'those', 'it', 'its', 'they', 'them', 'their'
+})
+
+
+def content_words(text_lower: str) -> set:
+    """Split lowercase text into words, dropping stop words."""
+    # In-place difference avoids allocating a second set
+    words = set(text_lower.split())
+    words -= STOP_WORDS
+    return words
+
+
+def tokenize(text: str) -> list:
+    """Lowercase word tokens with stop words removed (duplicates kept)."""
+    return [word for word in text.lower().split() if word not in STOP_WORDS]
+
+
+def jaccard_relevance(claim_lower: str, claim_words: set, snippet: str) -> float:
+    """Score one snippet against a claim that has already been tokenized."""
+    if not snippet:
+        return 0.0
+    
+    snippet_lower = snippet.lower()
+    snippet_words = content_words(snippet_lower)
+    
+    # Calculate Jaccard similarity (intersection over union)
+    if not claim_words or not snippet_words:
+        return 0.0
+    
+    # |A u B| = |A| + |B| - |A n B|, so the union set is never built;
+    # both sets are non-empty here, so the union is too
+    intersection = len(claim_words & snippet_words)
+    union = len(claim_words) + len(snippet_words) - intersection
+    
+    jaccard_score = intersection / union
+    
+    # Boost score if claim appears as substring in snippet
+    if claim_lower in snippet_lower or snippet_lower in claim_lower:
+        jaccard_score = min(1.0, jaccard_score * 1.5)
+    
+    return jaccard_score
@@ -8,14 +8,99 @@ This module provides a unified interface that automatically uses:
 No code changes needed in your existing modules!
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import List, Tuple, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional, Union
 
 from config.settings import settings
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on inputs per batched request
+MAX_BATCH_SIZE = 100
+
+# Worker threads for fanning out I/O-bound calls when no batch endpoint exists
+MAX_PARALLEL_REQUESTS = 8
+
+# Claim extraction cache: identical articles skip the LLM call entirely
+CLAIM_CACHE_MAX_ENTRIES = 1000
+CLAIM_CACHE_TTL_SECONDS = 86400
+
+_CLAIM_CACHE: "OrderedDict[str, List[Tuple[str, float, str]]]" = OrderedDict()
+_CLAIM_CACHE_TIMES: Dict[str, float] = {}
+_CLAIM_CACHE_LOCK = threading.Lock()
+
+
+def _dedupe(texts: List[str]) -> Tuple[List[str], Dict[str, List[int]]]:
+    """
+    Collapse duplicate inputs while remembering where each one came from.
+    
+    Returns:
+        Tuple of (unique texts in first-seen order, {text: [original indices]})
+    """
+    positions: Dict[str, List[int]] = {}
+    for index, text in enumerate(texts):
+        positions.setdefault(text, []).append(index)
+    return list(positions), positions
+
+
+def _scatter(unique: List[str], results: List, positions: Dict[str, List[int]], size: int) -> List:
+    """Map results for unique inputs back onto the original input positions."""
+    output: List = [None] * size
+    for text, result in zip(unique, results):
+        for index in positions[text]:
+            output[index] = result
+    return output
+
+
+def _chunks(items: List[str], size: int = MAX_BATCH_SIZE):
+    """Yield successive slices of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _claim_cache_key(article_text: str, language: Optional[str]) -> str:
+    """SHA-256 key for an article and requested language."""
+    return hashlib.sha256((article_text + "|" + (language or "")).encode("utf-8")).hexdigest()
+
+
+def _get_cached_claims(key: str) -> Optional[List[Tuple[str, float, str]]]:
+    """Return cached claims for `key`, or None if missing or expired."""
+    with _CLAIM_CACHE_LOCK:
+        claims = _CLAIM_CACHE.get(key)
+        if claims is None:
+            return None
+        if time.monotonic() - _CLAIM_CACHE_TIMES[key] > CLAIM_CACHE_TTL_SECONDS:
+            del _CLAIM_CACHE[key]
+            del _CLAIM_CACHE_TIMES[key]
+            return None
+        _CLAIM_CACHE.move_to_end(key)
+        return list(claims)
+
+
+def _store_claims(key: str, claims: List[Tuple[str, float, str]]) -> None:
+    """Cache claims for `key`, evicting the least recently used entry when full."""
+    with _CLAIM_CACHE_LOCK:
+        _CLAIM_CACHE[key] = list(claims)
+        _CLAIM_CACHE_TIMES[key] = time.monotonic()
+        _CLAIM_CACHE.move_to_end(key)
+        if len(_CLAIM_CACHE) > CLAIM_CACHE_MAX_ENTRIES:
+            evicted, _ = _CLAIM_CACHE.popitem(last=False)
+            del _CLAIM_CACHE_TIMES[evicted]
+
+
+def clear_claim_cache() -> None:
+    """Drop all cached claim extraction results."""
+    with _CLAIM_CACHE_LOCK:
+        _CLAIM_CACHE.clear()
+        _CLAIM_CACHE_TIMES.clear()
+
 
 def extract_claims_unified(
     article_text: str,
@@ -25,7 +110,9 @@ def extract_claims_unified(
     """
     Extract claims using self-hosted API or external APIs.
     
-    Automatically routes based on USE_SELF_HOSTED_API setting.
+    Automatically routes based on USE_SELF_HOSTED_API setting. Results are
+    cached by article hash, so re-submitting the same article does not
+    call the LLM again.
     
     Args:
         article_text: Article text to extract claims from
@@ -35,6 +122,23 @@ def extract_claims_unified(
     Returns:
         List of (claim_text, importance, context) tuples
     """
+    key = _claim_cache_key(article_text, language)
+    cached = _get_cached_claims(key)
+    if cached is not None:
+        logger.info("Using cached claim extraction results")
+        return cached
+    
+    claims = _extract_claims_backend(article_text, language, max_retries)
+    _store_claims(key, claims)
+    return claims
+
+
+def _extract_claims_backend(
+    article_text: str,
+    language: Optional[str],
+    max_retries: int
+) -> List[Tuple[str, float, str]]:
+    """Run claim extraction against the configured backend without consulting the cache."""
     if settings.USE_SELF_HOSTED_API:
         # Use self-hosted API
         logger.info("Using self-hosted API for claim extraction")
@@ -67,17 +171,21 @@ def extract_claims_unified(
 def search_unified(
     query: str,
     max_results: Optional[int] = None,
-    max_retries: int = 3
+    max_retries: int = 3,
+    cache_bypass: bool = False
 ) -> List[dict]:
     """
     Search for evidence using self-hosted API or external APIs.
     
-    Automatically routes based on USE_SELF_HOSTED_API setting.
+    Automatically routes based on USE_SELF_HOSTED_API setting. Results are served
+    from the semantic search cache when the same or a near-identical query was
+    answered recently.
     
     Args:
         query: Search query
         max_results: Maximum number of results
         max_retries: Maximum number of retry attempts
+        cache_bypass: Skip the cache lookup and always query the search backend
     
     Returns:
         List of search result dictionaries with keys:
@@ -87,6 +195,33 @@ def search_unified(
         - domain: str
         - published_date: Optional[str]
     """
+    from src.search_cache import search_cache
+    
+    limit = max_results or None
+    if not cache_bypass:
+        cached = search_cache.get(query, limit)
+        if cached is not None:
+            logger.info("Using cached search results")
+            return cached
+    
+    results, cacheable = _search_backend(query, max_results, max_retries)
+    if cacheable:
+        search_cache.put(query, results, limit)
+    return results
+
+
+def _search_backend(
+    query: str,
+    max_results: Optional[int],
+    max_retries: int
+) -> Tuple[List[dict], bool]:
+    """
+    Run a search against the configured backend without consulting the cache.
+    
+    Returns:
+        (search result dictionaries, whether they may be cached); mock results
+        served because the search API failed or is not configured must not be
+    """
     if settings.USE_SELF_HOSTED_API:
         # Use self-hosted API
         logger.info("Using self-hosted API for search")
@@ -94,7 +229,7 @@ def search_unified(
         
         try:
             client = get_client()
-            return client.search(query, max_results, max_retries)
+            return client.search(query, max_results, max_retries), True
         except Exception as e:
             logger.error(f"Self-hosted API search failed: {e}")
             raise
@@ -104,22 +239,233 @@ def search_unified(
         logger.info("Using external APIs for search")
         from src.evidence_retrieval import callSearchAPI
         
-        search_results = callSearchAPI(query)
+        return _results_and_cacheable(callSearchAPI(query))
+
+
+def _results_and_cacheable(search_results) -> Tuple[List[dict], bool]:
+    """Convert evidence_retrieval.SearchResult objects, flagging mock fallbacks as uncacheable."""
+    from src.evidence_retrieval import MockSearchResult
+    
+    cacheable = not any(isinstance(result, MockSearchResult) for result in search_results)
+    return [_result_to_dict(result) for result in search_results], cacheable
+
+
+def _result_to_dict(result) -> dict:
+    """Convert an evidence_retrieval.SearchResult to a search result dictionary."""
+    return {
+        "url": result.url,
+        "title": result.title,
+        "snippet": result.snippet,
+        "domain": result.domain,
+        "published_date": result.date
+    }
+
+
+async def search_unified_async(
+    query: str,
+    max_results: Optional[int] = None,
+    max_retries: int = 3,
+    cache_bypass: bool = False
+) -> List[dict]:
+    """
+    Asynchronous variant of `search_unified` for concurrent fan-out.
+    
+    External searches go through evidence_retrieval.callSearchAPIAsync, which
+    throttles requests with a token bucket and backs off on 429 responses.
+    
+    Args:
+        query: Search query
+        max_results: Maximum number of results
+        max_retries: Maximum number of retry attempts (self-hosted API)
+        cache_bypass: Skip the cache lookup and always query the search backend
+    
+    Returns:
+        List of search result dictionaries (see `search_unified`)
+    """
+    from src.search_cache import search_cache
+    
+    limit = max_results or None
+    if not cache_bypass:
+        cached = search_cache.get(query, limit)
+        if cached is not None:
+            logger.info("Using cached search results")
+            return cached
+    
+    if settings.USE_SELF_HOSTED_API:
+        results, cacheable = await asyncio.to_thread(_search_backend, query, max_results, max_retries)
+    else:
+        from src.evidence_retrieval import callSearchAPIAsync
         
-        # Convert SearchResult objects to dictionaries
-        return [
-            {
-                "url": result.url,
-                "title": result.title,
-                "snippet": result.snippet,
-                "domain": result.domain,
-                "published_date": result.date
-            }
-            for result in search_results
-        ]
+        results, cacheable = _results_and_cacheable(await callSearchAPIAsync(query))
+    
+    if cacheable:
+        search_cache.put(query, results, limit)
+    return results
+
+
+def extract_claims_batch_unified(
+    articles: List[str],
+    language: Optional[str] = None,
+    max_retries: int = 3
+) -> List[List[Tuple[str, float, str]]]:
+    """
+    Extract claims from several articles at once.
+    
+    Duplicate articles are only sent once, and the remaining LLM calls run
+    concurrently since they are bound by network latency.
+    
+    Args:
+        articles: Article texts to extract claims from
+        language: Language code applied to every article (auto-detected if None)
+        max_retries: Maximum number of retry attempts per article
+    
+    Returns:
+        One list of (claim_text, importance, context) tuples per input article,
+        in the same order as `articles`
+    """
+    if not articles:
+        return []
+    
+    unique, positions = _dedupe(articles)
+    logger.info(f"Extracting claims for {len(unique)} unique articles ({len(articles)} requested)")
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REQUESTS, len(unique))) as executor:
+        results = list(executor.map(
+            lambda text: extract_claims_unified(text, language, max_retries),
+            unique
+        ))
+    
+    return _scatter(unique, results, positions, len(articles))
+
+
+def search_batch_unified(
+    queries: List[str],
+    max_results: Optional[int] = None,
+    max_retries: int = 3
+) -> List[Union[List[dict], Exception]]:
+    """
+    Search for evidence for several queries at once.
+    
+    Duplicate queries are only searched once. The self-hosted API receives them
+    in batches of up to MAX_BATCH_SIZE; external search APIs are called
+    concurrently from an event loop, one rate-limited request per unique query.
+    When called while an event loop is already running in this thread, a new
+    loop cannot be started, so external searches run on worker threads instead.
+    From async code use `search_batch_unified_async` instead.
+    
+    Args:
+        queries: Search queries
+        max_results: Maximum number of results per query
+        max_retries: Maximum number of retry attempts
+    
+    Returns:
+        One entry per input query, in the same order as `queries`: its list of
+        search result dictionaries (see `search_unified`), or the exception
+        raised while searching external APIs for it
+    """
+    if not queries:
+        return []
+    
+    unique, positions = _dedupe(queries)
+    logger.info(f"Searching {len(unique)} unique queries ({len(queries)} requested)")
+    
+    if settings.USE_SELF_HOSTED_API:
+        from src.self_hosted_api_client import get_client
+        
+        client = get_client()
+        results: List[Union[List[dict], Exception]] = []
+        try:
+            for chunk in _chunks(unique):
+                results.extend(client.search_batch(chunk, max_results, max_retries))
+        except Exception as e:
+            logger.error(f"Self-hosted API batch search failed: {e}")
+            raise
+    
+    else:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            results = asyncio.run(_search_all_async(unique, max_results, max_retries))
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REQUESTS, len(unique))) as executor:
+                results = list(executor.map(
+                    lambda query: _search_or_error(query, max_results, max_retries),
+                    unique
+                ))
+    
+    return _scatter(unique, results, positions, len(queries))
+
+
+def _search_or_error(
+    query: str,
+    max_results: Optional[int],
+    max_retries: int
+) -> Union[List[dict], Exception]:
+    """Run `search_unified`, returning the exception instead of raising it."""
+    try:
+        return search_unified(query, max_results, max_retries)
+    except Exception as e:
+        logger.error(f"Search failed for query '{query}': {e}")
+        return e
+
+
+async def _search_all_async(
+    queries: List[str],
+    max_results: Optional[int],
+    max_retries: int
+) -> List[Union[List[dict], Exception]]:
+    """
+    Run `search_unified_async` for every query, at most MAX_PARALLEL_REQUESTS
+    at a time. A failing query yields its exception and does not affect the others.
+    """
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_REQUESTS)
+    
+    async def run(query: str) -> List[dict]:
+        async with semaphore:
+            return await search_unified_async(query, max_results, max_retries)
+    
+    results = await asyncio.gather(*(run(query) for query in queries), return_exceptions=True)
+    for query, result in zip(queries, results):
+        if isinstance(result, Exception):
+            logger.error(f"Search failed for query '{query}': {result}")
+    return list(results)
+
+
+async def search_batch_unified_async(
+    queries: List[str],
+    max_results: Optional[int] = None,
+    max_retries: int = 3
+) -> List[Union[List[dict], Exception]]:
+    """
+    Asynchronous variant of `search_batch_unified` for callers already running
+    inside an event loop.
+    
+    Args:
+        queries: Search queries
+        max_results: Maximum number of results per query
+        max_retries: Maximum number of retry attempts
+    
+    Returns:
+        One entry per input query, in input order: its list of search result
+        dictionaries, or the exception raised while searching for it
+    """
+    if not queries:
+        return []
+    
+    if settings.USE_SELF_HOSTED_API:
+        return await asyncio.to_thread(search_batch_unified, queries, max_results, max_retries)
+    
+    unique, positions = _dedupe(queries)
+    results = await _search_all_async(unique, max_results, max_retries)
+    return _scatter(unique, results, positions, len(queries))
 
 
 __all__ = [
     'extract_claims_unified',
-    'search_unified'
+    'clear_claim_cache',
+    'extract_claims_batch_unified',
+    'search_unified',
+    'search_unified_async',
+    'search_batch_unified',
+    'search_batch_unified_async'
 ]
@@ -5,13 +5,140 @@ This module provides functionality to fetch and parse article content from URLs
 with robust error handling and security measures.
 """
 
+import atexit
 import ipaddress
 import re
-from typing import Optional
-from urllib.parse import urlparse
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.parse import ParseResult, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Prefer the C-backed lxml parser for fetched documents; fall back to the
+# pure-Python stdlib parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+
+# Common article containers, most specific first, as find() arguments
+# (equivalent to the CSS selectors article, [role="main"], .article-content,
+# .post-content, .entry-content and main)
+_ARTICLE_CONTAINERS = (
+    {'name': 'article'},
+    {'attrs': {'role': 'main'}},
+    {'class_': 'article-content'},
+    {'class_': 'post-content'},
+    {'class_': 'entry-content'},
+    {'name': 'main'},
+)
+
+
+# Document-level elements that never hold article text. The strainer rejects
+# them while parsing, so the <head> (inline scripts, styles, JSON-LD, meta
+# tags) is never turned into tree objects; <body> and everything in it is kept.
+_NON_CONTENT_TAGS = frozenset({
+    'html', 'head', 'title', 'meta', 'link', 'base', 'script', 'style', 'noscript', 'template'
+})
+
+
+def _is_content_tag(name, attrs=None) -> bool:
+    # beautifulsoup4 4.12 passes (name, attrs) to the strainer; 4.13+ passes only name
+    return name not in _NON_CONTENT_TAGS
+
+
+_CONTENT_STRAINER = SoupStrainer(_is_content_tag)
+
+# charset declaration in a Content-Type header or <meta> tag
+_CHARSET_RE = re.compile(rb'charset\s*=\s*["\']?([A-Za-z0-9._:-]+)', re.IGNORECASE)
+
+# Lone UTF-16 surrogates, the only str content that cannot be encoded as UTF-8
+_SURROGATE_RE = re.compile('[\ud800-\udfff]')
+
+# Hostnames that always refer to the local machine
+_BLOCKED_HOSTS = frozenset({'localhost', '127.0.0.1', '::1', '0.0.0.0'})
+
+# Runs of whitespace, collapsed to a single space when normalizing text
+_WS_RE = re.compile(r'\s+')
+
+
+_USER_AGENT = 'Mozilla/5.0 (compatible; FakeNewsDetector/1.0)'
+_MAX_REDIRECTS = 3
+
+# Largest response body read from an article URL (5 MB)
+_MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+
+def _build_session(max_redirects: int = _MAX_REDIRECTS) -> requests.Session:
+    """Create a session with pooled keep-alive connections and the parser's headers."""
+    session = requests.Session()
+    session.max_redirects = max_redirects
+    # requests' default retry policy (no retries, read timeouts re-raised as
+    # Timeout); the redirect cap is enforced by session.max_redirects
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(0, read=False)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'User-Agent': _USER_AGENT})
+    return session
+
+
+# Parsed article cache: repeat submissions of a URL skip the fetch and parse.
+# Expired entries are revalidated with the server's ETag/Last-Modified.
+ARTICLE_CACHE_MAX_ENTRIES = 1024
+ARTICLE_CACHE_TTL_SECONDS = 900
+
+
+class _CachedArticle(NamedTuple):
+    text: str
+    stored_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+_ARTICLE_CACHE: "OrderedDict[str, _CachedArticle]" = OrderedDict()
+_ARTICLE_CACHE_LOCK = threading.Lock()
+
+
+# Shared session so repeated fetches (often from the same news site) reuse
+# connections instead of paying a new TCP+TLS handshake each time
+_SESSION = _build_session()
+atexit.register(_SESSION.close)
+
+
+def _get_cached_article(url: str) -> Optional[_CachedArticle]:
+    """Return the cache entry for `url` (possibly expired), or None."""
+    with _ARTICLE_CACHE_LOCK:
+        entry = _ARTICLE_CACHE.get(url)
+        if entry is not None:
+            _ARTICLE_CACHE.move_to_end(url)
+        return entry
+
+
+def _store_article(url: str, text: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+    """Cache parsed article text for `url`, evicting the least recently used entry."""
+    with _ARTICLE_CACHE_LOCK:
+        _ARTICLE_CACHE[url] = _CachedArticle(text, time.monotonic(), etag, last_modified)
+        _ARTICLE_CACHE.move_to_end(url)
+        if len(_ARTICLE_CACHE) > ARTICLE_CACHE_MAX_ENTRIES:
+            _ARTICLE_CACHE.popitem(last=False)
+
+
+def clear_article_cache() -> None:
+    """Drop all cached article texts."""
+    with _ARTICLE_CACHE_LOCK:
+        _ARTICLE_CACHE.clear()
 
 
 class ArticleParserError(Exception):
@@ -34,68 +161,132 @@ class TextInputError(ArticleParserError):
     pass
 
 
-def _validate_url_format(url: str) -> None:
+@lru_cache(maxsize=256)
+def _parse_url(url: str) -> ParseResult:
+    """Parse a URL, caching results for repeatedly submitted URLs."""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=1024)
+def _is_private_ip(hostname: str) -> bool:
+    """True if `hostname` is a private, loopback or link-local IP address literal."""
+    try:
+        ip = ipaddress.ip_address(hostname)
+    except ValueError:
+        # Hostname is not an IP address
+        return False
+    return ip.is_private or ip.is_loopback or ip.is_link_local
+
+
+def _validate_url_format(url: str) -> ParseResult:
     """
     Validate URL format.
     
     Args:
         url: URL string to validate
         
+    Returns:
+        Parsed URL, for reuse by later validation steps
+        
     Raises:
         InvalidURLError: If URL format is invalid
     """
-    if not url or not url.strip():
+    url = url.strip() if url else url
+    if not url:
         raise InvalidURLError("URL cannot be empty")
     
-    url = url.strip()
-    
     # Check if URL starts with http:// or https://
-    if not (url.startswith('http://') or url.startswith('https://')):
+    if not url.startswith(('http://', 'https://')):
         raise InvalidURLError("URL must start with http:// or https://")
     
     # Parse URL to validate structure
     try:
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         if not parsed.netloc:
             raise InvalidURLError("URL must have a valid domain")
     except Exception as e:
         raise InvalidURLError(f"Invalid URL format: {str(e)}")
+    
+    return parsed
 
 
-def _validate_url_security(url: str) -> None:
+def _validate_url_security(url: str, parsed: Optional[ParseResult] = None) -> None:
     """
     Validate URL for security concerns (block private IPs).
     
     Args:
         url: URL string to validate
+        parsed: Already parsed URL (parsed from `url` if not given)
         
     Raises:
         SecurityError: If URL points to private IP or localhost
     """
-    parsed = urlparse(url)
+    if parsed is None:
+        parsed = _parse_url(url)
     hostname = parsed.hostname
     
     if not hostname:
         raise SecurityError("URL must have a valid hostname")
     
     # Check for localhost
-    if hostname.lower() in ['localhost', '127.0.0.1', '::1']:
+    if hostname.lower() in _BLOCKED_HOSTS:
         raise SecurityError("Access to localhost is not allowed")
     
-    # Try to resolve hostname to IP and check if it's private
-    try:
-        # Check if hostname is already an IP address
-        ip = ipaddress.ip_address(hostname)
-        if ip.is_private or ip.is_loopback or ip.is_link_local:
-            raise SecurityError(f"Access to private IP addresses is not allowed: {hostname}")
-    except ValueError:
-        # Hostname is not an IP address, which is fine
-        # We'll let requests handle DNS resolution
-        # Note: In production, you might want to resolve DNS and check the IP
-        pass
+    # Check if hostname is an IP address in a private range; other hostnames
+    # are left to requests for DNS resolution
+    # Note: In production, you might want to resolve DNS and check the IP
+    if _is_private_ip(hostname):
+        raise SecurityError(f"Access to private IP addresses is not allowed: {hostname}")
 
 
-def _fetch_url_content(url: str, timeout: int = 10, max_redirects: int = 3) -> str:
+def _validate_url(url: str) -> str:
+    """
+    Validate URL format and security with a single parse.
+    
+    Args:
+        url: URL string to validate
+        
+    Returns:
+        The URL with surrounding whitespace removed
+        
+    Raises:
+        InvalidURLError: If URL format is invalid
+        SecurityError: If URL points to private IP or localhost
+    """
+    parsed = _validate_url_format(url)
+    url = url.strip()
+    _validate_url_security(url, parsed)
+    return url
+
+
+def _declared_charset(content_type: str, body: bytes) -> str:
+    """
+    Find the character encoding declared for an HTML response.
+    
+    Uses the Content-Type charset if present, otherwise a <meta charset> (or
+    http-equiv) declaration near the start of the document, and UTF-8 when
+    neither exists. This avoids requests' default of ISO-8859-1 for text/*
+    responses without a charset and never runs statistical detection.
+    
+    Args:
+        content_type: Lowercased Content-Type header value
+        body: Raw response body
+        
+    Returns:
+        Encoding name to decode the body with
+    """
+    match = _CHARSET_RE.search(content_type.encode('latin-1', errors='ignore'))
+    if match is None:
+        match = _CHARSET_RE.search(body[:4096])
+    return match.group(1).decode('ascii') if match else 'utf-8'
+
+
+def _fetch_url_content(
+    url: str,
+    timeout: int = 10,
+    max_redirects: int = _MAX_REDIRECTS,
+    validators: Optional[Dict[str, str]] = None
+) -> Tuple[Optional[str], Dict[str, str]]:
     """
     Fetch content from URL with timeout and redirect limits.
     
@@ -103,32 +294,54 @@ def _fetch_url_content(url: str, timeout: int = 10, max_redirects: int = 3) -> s
         url: URL to fetch
         timeout: Request timeout in seconds (default: 10)
         max_redirects: Maximum number of redirects to follow (default: 3)
+        validators: Conditional request headers (If-None-Match/If-Modified-Since)
         
     Returns:
-        Raw HTML content from the URL
+        Tuple of (raw HTML content, response headers); the content is None when
+        the server answers 304 Not Modified to a conditional request
         
     Raises:
         InvalidURLError: If URL is inaccessible or returns error
     """
+    # Use the shared pooled session unless a different redirect limit is requested
+    session = _SESSION if max_redirects == _SESSION.max_redirects else _build_session(max_redirects)
+    
     try:
-        # Configure session with redirect limits
-        session = requests.Session()
-        session.max_redirects = max_redirects
-        
-        # Make request with timeout
+        # Make request with timeout, streaming the body so its size can be capped
         response = session.get(
-            url,
-            timeout=timeout,
-            allow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; FakeNewsDetector/1.0)'
-            }
+            url, timeout=timeout, allow_redirects=True, stream=True, headers=validators
         )
         
-        # Check for HTTP errors
-        response.raise_for_status()
-        
-        return response.text
+        try:
+            if response.status_code == 304:
+                return None, response.headers
+            
+            # Check for HTTP errors
+            response.raise_for_status()
+            
+            # Reject PDFs, JSON, media, etc. before downloading the body
+            content_type = response.headers.get('Content-Type', '').lower()
+            if content_type and 'html' not in content_type and 'xml' not in content_type:
+                raise InvalidURLError(f"Unsupported content type: {content_type}")
+            
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(65536):
+                total += len(chunk)
+                if total > _MAX_RESPONSE_BYTES:
+                    raise InvalidURLError("Response too large")
+                chunks.append(chunk)
+            
+            body = b''.join(chunks)
+            encoding = _declared_charset(content_type, body)
+            try:
+                content = body.decode(encoding, errors='replace')
+            except LookupError:
+                # Unknown charset declared by the page
+                content = body.decode('utf-8', errors='replace')
+            return content, response.headers
+        finally:
+            response.close()
         
     except requests.exceptions.Timeout:
         raise InvalidURLError(f"Request timed out after {timeout} seconds")
@@ -152,28 +365,19 @@ def _extract_article_text(html_content: str) -> str:
     Returns:
         Extracted and cleaned article text
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, _HTML_PARSER, parse_only=_CONTENT_STRAINER)
     
-    # Remove script and style elements
+    # Remove script, style and page chrome elements inside the body
     for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
         element.decompose()
     
     # Try to find main content areas (common article containers)
-    article_selectors = [
-        'article',
-        '[role="main"]',
-        '.article-content',
-        '.post-content',
-        '.entry-content',
-        'main',
-    ]
-    
     article_text = ""
-    for selector in article_selectors:
-        elements = soup.select(selector)
-        if elements:
+    for query in _ARTICLE_CONTAINERS:
+        element = soup.find(**query)
+        if element is not None:
             # Get text from the first matching element
-            article_text = elements[0].get_text(separator=' ', strip=True)
+            article_text = element.get_text(separator=' ', strip=True)
             break
     
     # If no article container found, get all paragraph text
@@ -211,7 +415,7 @@ def _normalize_text(text: str) -> str:
     
     # Normalize whitespace
     # Replace multiple spaces with single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     
     # Remove leading/trailing whitespace
     text = text.strip()
@@ -225,6 +429,8 @@ def parseArticleFromURL(url: str) -> str:
     
     This function fetches content from the provided URL, validates it for security,
     extracts the main article text, and returns cleaned text suitable for claim extraction.
+    Parsed text is cached per URL; after ARTICLE_CACHE_TTL_SECONDS the entry is
+    revalidated with a conditional request instead of being fetched again.
     
     Args:
         url: URL of the article to parse
@@ -241,14 +447,30 @@ def parseArticleFromURL(url: str) -> str:
         >>> print(text[:100])
         This is the article content...
     """
-    # Step 1: Validate URL format
-    _validate_url_format(url)
+    # Steps 1-2: Validate URL format and security (block private IPs)
+    url = _validate_url(url)
     
-    # Step 2: Validate URL security (block private IPs)
-    _validate_url_security(url)
+    # Serve repeat submissions from the cache while fresh
+    cached = _get_cached_article(url)
+    if cached is not None and time.monotonic() - cached.stored_at <= ARTICLE_CACHE_TTL_SECONDS:
+        return cached.text
+    
+    validators = {}
+    if cached is not None:
+        if cached.etag:
+            validators['If-None-Match'] = cached.etag
+        if cached.last_modified:
+            validators['If-Modified-Since'] = cached.last_modified
     
     # Step 3: Fetch content with timeout and redirect limits
-    html_content = _fetch_url_content(url, timeout=10, max_redirects=3)
+    html_content, headers = _fetch_url_content(url, timeout=10, validators=validators or None)
+    
+    if html_content is None:
+        if cached is None:
+            raise InvalidURLError("No article text could be extracted from the URL")
+        # 304 Not Modified: the cached text is still current
+        _store_article(url, cached.text, cached.etag, cached.last_modified)
+        return cached.text
     
     # Step 4: Extract main article text
     article_text = _extract_article_text(html_content)
@@ -259,6 +481,8 @@ def parseArticleFromURL(url: str) -> str:
     if not normalized_text:
         raise InvalidURLError("No article text could be extracted from the URL")
     
+    _store_article(url, normalized_text, headers.get('ETag'), headers.get('Last-Modified'))
+    
     return normalized_text
 
 
@@ -270,25 +494,25 @@ def _sanitize_html(text: str) -> str:
         text: Text to sanitize
         
     Returns:
-        Text with HTML and script tags removed
+        Text with HTML and script tags removed (whitespace not normalized)
     """
     if not text:
         return ""
     
-    # Use BeautifulSoup to parse and strip HTML tags
+    # Plain text with no tags or entities needs no parsing
+    if '<' not in text and '&' not in text:
+        return text
+    
+    # Use BeautifulSoup to parse and strip HTML tags. Always html.parser here:
+    # lxml drops everything after a bare '<' in plain text (e.g. "x<y")
     soup = BeautifulSoup(text, 'html.parser')
     
     # Remove script and style tags completely
     for element in soup(['script', 'style']):
         element.decompose()
     
-    # Get text content without HTML tags
-    sanitized = soup.get_text(separator=' ')
-    
-    # Normalize whitespace after sanitization
-    sanitized = re.sub(r'\s+', ' ', sanitized).strip()
-    
-    return sanitized
+    # Get text content without HTML tags; whitespace is normalized by the caller
+    return soup.get_text(separator=' ')
 
 
 def _validate_utf8_encoding(text: str) -> str:
@@ -307,19 +531,22 @@ def _validate_utf8_encoding(text: str) -> str:
     if not text:
         return ""
     
-    try:
-        # If text is bytes, decode it
-        if isinstance(text, bytes):
-            text = text.decode('utf-8', errors='strict')
-        
-        # Ensure text can be encoded as UTF-8
-        text.encode('utf-8')
-        
-        return text
-    except UnicodeDecodeError as e:
-        raise TextInputError(f"Invalid UTF-8 encoding: {str(e)}")
-    except UnicodeEncodeError as e:
-        raise TextInputError(f"Text contains characters that cannot be encoded as UTF-8: {str(e)}")
+    if isinstance(text, bytes):
+        try:
+            return text.decode('utf-8', errors='strict')
+        except UnicodeDecodeError as e:
+            raise TextInputError(f"Invalid UTF-8 encoding: {str(e)}")
+    
+    # A str can only fail to encode as UTF-8 if it holds lone surrogates;
+    # scan for them instead of allocating an encoded copy of the whole text
+    surrogate = _SURROGATE_RE.search(text)
+    if surrogate:
+        raise TextInputError(
+            f"Text contains characters that cannot be encoded as UTF-8: "
+            f"lone surrogate at position {surrogate.start()}"
+        )
+    
+    return text
 
 
 def processTextInput(text: str, max_length: int = 50000) -> str:
@@ -362,8 +589,8 @@ def processTextInput(text: str, max_length: int = 50000) -> str:
     # Step 4: Sanitize HTML and script tags
     sanitized_text = _sanitize_html(text)
     
-    # Step 5: Normalize whitespace
-    normalized_text = _normalize_text(sanitized_text)
+    # Step 5: Normalize whitespace (single pass over the sanitized text)
+    normalized_text = _WS_RE.sub(' ', sanitized_text).strip()
     
     # Step 6: Validate that sanitization didn't remove all content
     if not normalized_text:
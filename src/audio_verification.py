@@ -8,12 +8,36 @@ Handles verification of audio content including:
 - Voice authentication
 """
 
+import io
 import logging
-from typing import Optional, List, Dict, Any
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Literal, Union
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Verdicts for audio verification results
+VERDICT_AUTHENTIC = "AUTHENTIC"
+VERDICT_DEEPFAKE = "DEEPFAKE"
+VERDICT_MANIPULATED = "MANIPULATED"
+VERDICT_UNVERIFIED = "UNVERIFIED"
+VERDICT_ERROR = "ERROR"
+
+AudioVerdict = Literal["AUTHENTIC", "DEEPFAKE", "MANIPULATED", "UNVERIFIED", "ERROR"]
+
+# Detection method names reported in DeepfakeAnalysis
+DETECTION_METHOD_BASIC = "Basic analysis"
+DETECTION_METHOD_ERROR = "Error"
+
+# Whisper speech-to-text model, loaded on first transcription
+WHISPER_MODEL_NAME = "base"
+_whisper_model_cache = None
+_whisper_model_load_failed: bool = False
+
+# Worker threads for running the independent audio analyses concurrently
+_AUDIO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="audio-verify")
+
 
 class AudioTranscription(BaseModel):
     """Transcription result from speech-to-text"""
@@ -50,17 +74,138 @@ class AudioVerificationResult(BaseModel):
     deepfakeAnalysis: DeepfakeAnalysis
     audioQuality: AudioQuality
     textVerification: Optional[Dict[str, Any]] = None  # Result from text verification
-    verdict: str  # AUTHENTIC, DEEPFAKE, MANIPULATED, UNVERIFIED
+    verdict: AudioVerdict
     confidence: float
     explanation: str
 
 
-def transcribeAudio(audioData: bytes, language: str = "en") -> AudioTranscription:
+# Results below are assembled by this module from known-good values, so they
+# are built with model_construct, which skips validation; callers building
+# them from outside input still get the validating constructors.
+
+# Error result templates; error paths copy these with model_copy() and fill in the message
+_ERROR_TRANSCRIPTION = AudioTranscription.model_construct(
+    text="",
+    confidence=0.0,
+    language="en",
+    duration=0.0,
+    words=None
+)
+
+_ERROR_DEEPFAKE_ANALYSIS = DeepfakeAnalysis.model_construct(
+    isDeepfake=False,
+    confidence=0.0,
+    detectionMethod=DETECTION_METHOD_ERROR,
+    artifacts=[],
+    explanation=""
+)
+
+_ERROR_AUDIO_QUALITY = AudioQuality.model_construct(
+    sampleRate=0,
+    bitrate=0,
+    channels=0,
+    duration=0.0,
+    format="error",
+    noiseLevel=None,
+    clarity=None
+)
+
+
+class _AudioSamples:
+    """Decoded audio shared by the analyses"""
+
+    __slots__ = ('samples', 'sampleRate', 'channels', 'duration', 'format')
+
+    def __init__(self, samples: Any, sampleRate: int, channels: int, duration: float, format: str):
+        self.samples = samples  # float32 numpy array, (frames,) or (frames, channels)
+        self.sampleRate = sampleRate
+        self.channels = channels
+        self.duration = duration  # seconds
+        self.format = format
+
+
+class _DecodedAudio:
+    """
+    Raw audio bytes with their samples decoded at most once.
+
+    verifyAudio wraps the input once and hands the same object to every
+    analysis, so the container is decoded by whichever analysis needs samples
+    first and the array is reused by the rest.
+    """
+
+    __slots__ = ('data', '_samples', '_lock')
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self._samples: Optional[_AudioSamples] = None
+        self._lock = threading.Lock()
+
+    def decode(self) -> _AudioSamples:
+        """Decode to float32 samples on first call (requires soundfile) and cache them."""
+        with self._lock:
+            if self._samples is None:
+                # Import here so the module loads without audio dependencies
+                import soundfile
+
+                with soundfile.SoundFile(io.BytesIO(self.data)) as audioFile:
+                    samples = audioFile.read(dtype='float32', always_2d=False)
+                    self._samples = _AudioSamples(
+                        samples=samples,
+                        sampleRate=audioFile.samplerate,
+                        channels=audioFile.channels,
+                        duration=audioFile.frames / audioFile.samplerate,
+                        format=audioFile.format
+                    )
+            return self._samples
+
+
+AudioInput = Union[bytes, _DecodedAudio]
+
+
+def _asDecodedAudio(audioData: AudioInput) -> _DecodedAudio:
+    """Wrap raw bytes for shared decoding; pass through already wrapped input."""
+    return audioData if isinstance(audioData, _DecodedAudio) else _DecodedAudio(audioData)
+
+
+def loadWhisperModel():
+    """
+    Load and cache the Whisper speech-to-text model.
+    
+    whisper (and torch with it) is imported here rather than at module level so
+    importing this module stays cheap for processes that never transcribe. If
+    loading fails, the failure is remembered and None is returned.
+    
+    Returns:
+        The loaded Whisper model, or None if unavailable.
+    """
+    global _whisper_model_cache, _whisper_model_load_failed
+    
+    if _whisper_model_cache is not None:
+        return _whisper_model_cache
+    
+    if _whisper_model_load_failed:
+        return None
+    
+    try:
+        # Import here to avoid import errors if not installed
+        import whisper
+        
+        logger.info(f"Loading Whisper model: {WHISPER_MODEL_NAME}")
+        _whisper_model_cache = whisper.load_model(WHISPER_MODEL_NAME)
+        return _whisper_model_cache
+        
+    except Exception as e:
+        logger.warning(f"Whisper model unavailable: {e}")
+        _whisper_model_load_failed = True
+        return None
+
+
+def transcribeAudio(audioData: AudioInput, language: str = "en") -> AudioTranscription:
     """
     Transcribe audio to text using speech-to-text
     
     Args:
-        audioData: Raw audio bytes
+        audioData: Raw audio bytes (or audio already wrapped by verifyAudio)
         language: Language code (default: "en")
         
     Returns:
@@ -79,15 +224,15 @@ def transcribeAudio(audioData: bytes, language: str = "en") -> AudioTranscriptio
         # In production, call actual speech-to-text API
         
         # TODO: Implement actual transcription
-        # Example with Whisper:
-        # import whisper
-        # model = whisper.load_model("base")
-        # result = model.transcribe(audio_file)
+        # Example with Whisper (reusing the shared decode):
+        # audio = _asDecodedAudio(audioData).decode()
+        # model = loadWhisperModel()
+        # result = model.transcribe(audio.samples)
         # text = result["text"]
         
         logger.warning("Audio transcription not yet implemented - returning placeholder")
         
-        return AudioTranscription(
+        return AudioTranscription.model_construct(
             text="[Audio transcription will be available soon]",
             confidence=0.0,
             language=language,
@@ -97,79 +242,182 @@ def transcribeAudio(audioData: bytes, language: str = "en") -> AudioTranscriptio
         
     except Exception as e:
         logger.error(f"Error transcribing audio: {str(e)}")
-        return AudioTranscription(
-            text=f"Error: {str(e)}",
-            confidence=0.0,
-            language=language,
-            duration=0.0,
-            words=None
-        )
+        return _ERROR_TRANSCRIPTION.model_copy(update={"text": f"Error: {str(e)}", "language": language})
 
 
-def detectDeepfakeAudio(audioData: bytes) -> DeepfakeAnalysis:
+class _MicroBatcher:
     """
-    Detect if audio is AI-generated or manipulated
+    Coalesces concurrent single-item calls into batched calls.
+    
+    Callers queue their item; whichever waiting caller finds no batch running
+    takes up to `maxBatchSize` queued items and runs them as one batch, while
+    callers arriving in the meantime queue for the next one. An idle caller is
+    served immediately, so batching adds no latency without concurrency.
+    """
+    
+    def __init__(self, batchFunction, maxBatchSize: int = 8):
+        self._batchFunction = batchFunction
+        self._maxBatchSize = maxBatchSize
+        self._pending: List[tuple] = []
+        self._running = False
+        self._condition = threading.Condition()
+    
+    def submit(self, item):
+        """Process `item` as part of a batch and return its result (or raise its error)."""
+        future: Future = Future()
+        
+        with self._condition:
+            self._pending.append((item, future))
+        
+        while True:
+            with self._condition:
+                while self._running and not future.done():
+                    self._condition.wait()
+                if future.done():
+                    return future.result()
+                self._running = True
+                batch = self._pending[:self._maxBatchSize]
+                del self._pending[:self._maxBatchSize]
+            
+            try:
+                results = list(self._batchFunction([batchItem for batchItem, _ in batch]))
+                if len(results) != len(batch):
+                    raise RuntimeError(f"Batch returned {len(results)} results for {len(batch)} items")
+            except BaseException as e:
+                # Every caller in the batch waits on its future, so even
+                # KeyboardInterrupt/SystemExit must reach them; those are
+                # re-raised here too rather than swallowed by this thread
+                for _, batchFuture in batch:
+                    batchFuture.set_exception(e)
+                if not isinstance(e, Exception):
+                    raise
+            else:
+                for (_, batchFuture), result in zip(batch, results):
+                    batchFuture.set_result(result)
+            finally:
+                with self._condition:
+                    self._running = False
+                    self._condition.notify_all()
+
+
+def _optimizeDeepfakeModel(model):
+    """
+    Prepare a loaded PyTorch deepfake detector for inference
+    
+    On CPU, Linear and LSTM weights are dynamically quantized to int8, which
+    roughly halves memory traffic per forward pass. On GPU the model is cast to
+    bfloat16 (mel-spectrogram inputs must be cast to match). The
+    model is returned unchanged if the conversion fails.
     
     Args:
-        audioData: Raw audio bytes
+        model: Detector model, e.g. right after torch.load / from_pretrained
         
     Returns:
-        Deepfake analysis with confidence score
-        
-    Detection methods:
-    - Spectral analysis
-    - Voice consistency check
-    - Artifact detection
-    - Neural network detection
+        The model, converted and in evaluation mode
     """
-    logger.info("Analyzing audio for deepfake detection")
+    # Import here to avoid import errors if not installed
+    import torch
     
+    model.eval()
     try:
-        # Placeholder implementation
-        # In production, implement actual detection
+        if next(model.parameters()).is_cuda:
+            return model.to(torch.bfloat16)
+        return torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+        )
+    except Exception as e:
+        logger.warning(f"Could not optimize deepfake model, using full precision: {e}")
+        return model
+
+
+def _detectDeepfakeBatch(audios: List[_DecodedAudio]) -> List[DeepfakeAnalysis]:
+    """
+    Run deepfake detection over a batch of audio clips
+    
+    Args:
+        audios: Audio clips collected by the deepfake batcher
         
+    Returns:
+        One analysis per clip, in order
+    """
+    # Placeholder implementation
+    # In production, implement actual detection
+    
+    # TODO: Implement actual deepfake detection on [audio.decode() for audio in audios]
+    # 1. Spectral analysis
+    # 2. Voice consistency
+    # 3. Breathing pattern analysis
+    # 4. Background noise consistency
+    # 5. Neural network detection (load the model once through
+    #    _optimizeDeepfakeModel, stack the clips' mel-spectrograms and run one
+    #    forward pass under torch.inference_mode() for the whole batch)
+    
+    results = []
+    for _ in audios:
         artifacts = []
         isDeepfake = False
         confidence = 50.0
-        detectionMethod = "Basic analysis"
-        
-        # TODO: Implement actual deepfake detection
-        # 1. Spectral analysis
-        # 2. Voice consistency
-        # 3. Breathing pattern analysis
-        # 4. Background noise consistency
-        # 5. Neural network detection
+        detectionMethod = DETECTION_METHOD_BASIC
         
         explanation = "Audio analysis complete. No obvious deepfake indicators detected."
         
         if isDeepfake:
             explanation = f"Audio shows signs of AI generation. Detected artifacts: {', '.join(artifacts)}"
         
-        return DeepfakeAnalysis(
+        results.append(DeepfakeAnalysis.model_construct(
             isDeepfake=isDeepfake,
             confidence=confidence,
             detectionMethod=detectionMethod,
             artifacts=artifacts,
             explanation=explanation
-        )
+        ))
+    
+    return results
+
+
+# Batches concurrent detectDeepfakeAudio calls into one model invocation
+DEEPFAKE_MAX_BATCH_SIZE = 8
+_DEEPFAKE_BATCHER = _MicroBatcher(_detectDeepfakeBatch, maxBatchSize=DEEPFAKE_MAX_BATCH_SIZE)
+
+
+def detectDeepfakeAudio(audioData: AudioInput) -> DeepfakeAnalysis:
+    """
+    Detect if audio is AI-generated or manipulated
+    
+    Concurrent calls (e.g. from parallel verifyAudio requests) are grouped and
+    analyzed together, so a neural detector runs one batched forward pass
+    instead of one pass per clip.
+    
+    Args:
+        audioData: Raw audio bytes (or audio already wrapped by verifyAudio)
+        
+    Returns:
+        Deepfake analysis with confidence score
+        
+    Detection methods:
+    - Spectral analysis
+    - Voice consistency check
+    - Artifact detection
+    - Neural network detection
+    """
+    logger.info("Analyzing audio for deepfake detection")
+    
+    try:
+        return _DEEPFAKE_BATCHER.submit(_asDecodedAudio(audioData))
         
     except Exception as e:
         logger.error(f"Error detecting deepfake audio: {str(e)}")
-        return DeepfakeAnalysis(
-            isDeepfake=False,
-            confidence=0.0,
-            detectionMethod="Error",
-            artifacts=[],
-            explanation=f"Error during analysis: {str(e)}"
+        return _ERROR_DEEPFAKE_ANALYSIS.model_copy(
+            update={"artifacts": [], "explanation": f"Error during analysis: {str(e)}"}
         )
 
 
-def analyzeAudioQuality(audioData: bytes) -> AudioQuality:
+def analyzeAudioQuality(audioData: AudioInput) -> AudioQuality:
     """
     Analyze audio quality and extract metadata
     
     Args:
-        audioData: Raw audio bytes
+        audioData: Raw audio bytes (or audio already wrapped by verifyAudio)
         
     Returns:
         Audio quality metrics
@@ -178,16 +426,17 @@ def analyzeAudioQuality(audioData: bytes) -> AudioQuality:
     
     try:
         # Placeholder implementation
-        # In production, use librosa or pydub
+        # In production, use librosa or pydub, imported inside this function
+        # (never at module level) so the audio stack loads only when needed
         
         # TODO: Implement actual quality analysis
-        # import librosa
-        # y, sr = librosa.load(audio_file)
-        # duration = librosa.get_duration(y=y, sr=sr)
+        # audio = _asDecodedAudio(audioData).decode()
+        # sampleRate, channels = audio.sampleRate, audio.channels
+        # duration, format = audio.duration, audio.format
         
         logger.warning("Audio quality analysis not yet implemented - returning placeholder")
         
-        return AudioQuality(
+        return AudioQuality.model_construct(
             sampleRate=44100,
             bitrate=128,
             channels=2,
@@ -199,15 +448,7 @@ def analyzeAudioQuality(audioData: bytes) -> AudioQuality:
         
     except Exception as e:
         logger.error(f"Error analyzing audio quality: {str(e)}")
-        return AudioQuality(
-            sampleRate=0,
-            bitrate=0,
-            channels=0,
-            duration=0.0,
-            format="error",
-            noiseLevel=None,
-            clarity=None
-        )
+        return _ERROR_AUDIO_QUALITY.model_copy()
 
 
 def verifyAudio(audioData: bytes, verifyText: bool = True) -> AudioVerificationResult:
@@ -225,20 +466,29 @@ def verifyAudio(audioData: bytes, verifyText: bool = True) -> AudioVerificationR
     1. Transcribe audio to text
     2. Detect deepfake/manipulation
     3. Analyze audio quality
+       (steps 1-3 run concurrently)
     4. Verify transcribed text (optional)
     5. Determine verdict
     """
     logger.info("Starting audio verification")
     
     try:
+        # Wrap once so the analyses share a single decode of the audio
+        audio = _asDecodedAudio(audioData)
+        
+        # Steps 1-3 are independent: detect deepfake and analyze quality on
+        # worker threads while transcribing on this one
+        deepfakeFuture = _AUDIO_POOL.submit(detectDeepfakeAudio, audio)
+        qualityFuture = _AUDIO_POOL.submit(analyzeAudioQuality, audio)
+        
         # Step 1: Transcribe audio
-        transcription = transcribeAudio(audioData)
+        transcription = transcribeAudio(audio)
         
         # Step 2: Detect deepfake
-        deepfakeAnalysis = detectDeepfakeAudio(audioData)
+        deepfakeAnalysis = deepfakeFuture.result()
         
         # Step 3: Analyze quality
-        audioQuality = analyzeAudioQuality(audioData)
+        audioQuality = qualityFuture.result()
         
         # Step 4: Verify transcribed text (if enabled)
         textVerification = None
@@ -249,16 +499,16 @@ def verifyAudio(audioData: bytes, verifyText: bool = True) -> AudioVerificationR
             pass
         
         # Step 5: Determine verdict
-        verdict = "UNVERIFIED"
+        verdict = VERDICT_UNVERIFIED
         confidence = 50.0
         explanation = "Audio verification is in development. "
         
         if deepfakeAnalysis.isDeepfake:
-            verdict = "DEEPFAKE"
+            verdict = VERDICT_DEEPFAKE
             confidence = deepfakeAnalysis.confidence
             explanation += f"Deepfake detected: {deepfakeAnalysis.explanation}"
         elif transcription.confidence > 80:
-            verdict = "AUTHENTIC"
+            verdict = VERDICT_AUTHENTIC
             confidence = transcription.confidence
             explanation += f"Audio transcribed successfully. "
             if textVerification:
@@ -266,7 +516,7 @@ def verifyAudio(audioData: bytes, verifyText: bool = True) -> AudioVerificationR
         else:
             explanation += "Audio quality or transcription confidence is low. Further verification recommended."
         
-        return AudioVerificationResult(
+        return AudioVerificationResult.model_construct(
             transcription=transcription,
             deepfakeAnalysis=deepfakeAnalysis,
             audioQuality=audioQuality,
@@ -280,29 +530,14 @@ def verifyAudio(audioData: bytes, verifyText: bool = True) -> AudioVerificationR
         logger.error(f"Error verifying audio: {str(e)}", exc_info=True)
         
         # Return error result
-        return AudioVerificationResult(
-            transcription=AudioTranscription(
-                text=f"Error: {str(e)}",
-                confidence=0.0,
-                language="en",
-                duration=0.0
-            ),
-            deepfakeAnalysis=DeepfakeAnalysis(
-                isDeepfake=False,
-                confidence=0.0,
-                detectionMethod="Error",
-                artifacts=[],
-                explanation=f"Error during analysis: {str(e)}"
-            ),
-            audioQuality=AudioQuality(
-                sampleRate=0,
-                bitrate=0,
-                channels=0,
-                duration=0.0,
-                format="error"
+        return AudioVerificationResult.model_construct(
+            transcription=_ERROR_TRANSCRIPTION.model_copy(update={"text": f"Error: {str(e)}"}),
+            deepfakeAnalysis=_ERROR_DEEPFAKE_ANALYSIS.model_copy(
+                update={"artifacts": [], "explanation": f"Error during analysis: {str(e)}"}
             ),
+            audioQuality=_ERROR_AUDIO_QUALITY.model_copy(),
             textVerification=None,
-            verdict="ERROR",
+            verdict=VERDICT_ERROR,
             confidence=0.0,
             explanation=f"Error during audio verification: {str(e)}"
         )
@@ -0,0 +1,132 @@
+"""
+Persistent Embedding Cache.
+
+This module stores text embeddings in a small SQLite database so the same
+claim or query is only embedded once across runs. Entries are keyed by
+SHA-256 of the model name and text, so switching models never returns stale
+vectors, and vectors are stored as half-precision floats to halve disk usage.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import struct
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+Embedding = List[float]
+
+
+def _pack(vector: Embedding) -> bytes:
+    """Serialize a vector as little-endian float16."""
+    return struct.pack(f"<{len(vector)}e", *vector)
+
+
+def _unpack(blob: bytes) -> Embedding:
+    """Deserialize a little-endian float16 vector."""
+    return list(struct.unpack(f"<{len(blob) // 2}e", blob))
+
+
+class EmbeddingCache:
+    """SQLite-backed cache of text embeddings keyed by (model name, text)."""
+
+    def __init__(self, db_path: Union[str, Path], model_name: str):
+        """
+        Initialize the cache. The database is opened on first use.
+
+        Args:
+            db_path: Path to the SQLite database file
+            model_name: Embedding model name, part of every key
+        """
+        self.db_path = Path(db_path)
+        self.model_name = model_name
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, text: str) -> Optional[Embedding]:
+        """
+        Look up the cached embedding for a text.
+
+        Args:
+            text: Embedded text
+
+        Returns:
+            Cached embedding, or None on a miss.
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT vec FROM embeddings WHERE key = ?", (self._key(text),)
+            ).fetchone()
+        return _unpack(row[0]) if row else None
+
+    def put(self, text: str, vector: Embedding) -> None:
+        """
+        Store the embedding for a text.
+
+        Args:
+            text: Embedded text
+            vector: Its embedding
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)",
+                (self._key(text), _pack(vector))
+            )
+            conn.commit()
+
+    def get_or_compute(self, text: str, compute: Callable[[str], Optional[Embedding]]) -> Optional[Embedding]:
+        """
+        Return the cached embedding for a text, computing and storing it on a miss.
+
+        Cache read/write errors are logged and do not prevent computing the
+        embedding.
+
+        Args:
+            text: Text to embed
+            compute: Function that embeds the text
+
+        Returns:
+            Embedding, or None if `compute` returned None.
+        """
+        try:
+            cached = self.get(text)
+            if cached is not None:
+                return cached
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+
+        vector = compute(text)
+        if vector is not None:
+            try:
+                self.put(text, vector)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+        return vector
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+__all__ = ['EmbeddingCache']
@@ -7,16 +7,38 @@ It supports Serper.dev and Tavily APIs with rate limit handling and error recove
 Requirements: 3.1, 11.3, 16.2
 """
 
+import asyncio
+import atexit
+import heapq
 import logging
+import math
+import re
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, FrozenSet, Iterator, NamedTuple, Optional, Tuple
 from datetime import datetime
-from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 
 from config.settings import settings
 from src.models import Evidence, Claim
+from src.rate_limiter import CircuitBreaker, TokenBucket, backoff_with_jitter
+from src._relevance_core import (
+    content_words as _content_words,
+    tokenize as _tokenize,
+    jaccard_relevance as _relevance
+)
+
+# Prefer orjson's faster parser for search API responses when installed
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 
 # Configure logging
@@ -33,28 +55,98 @@ class RateLimitError(Exception):
     pass
 
 
+# Throttles for outbound search API requests, one per provider, each adapting
+# its rate to that provider's 429 responses
+_search_rate_limiters = {
+    "serper": TokenBucket(settings.SEARCH_REQUESTS_PER_MINUTE),
+    "tavily": TokenBucket(settings.SEARCH_REQUESTS_PER_MINUTE),
+}
+
+# Per-provider circuit breakers: after repeated failures (timeouts, errors)
+# a provider is skipped for a cooldown instead of each search waiting it out
+SEARCH_BREAKER_FAILURE_THRESHOLD = 5
+SEARCH_BREAKER_COOLDOWN_SECONDS = 30
+
+_search_circuit_breakers = {
+    provider: CircuitBreaker(SEARCH_BREAKER_FAILURE_THRESHOLD, SEARCH_BREAKER_COOLDOWN_SECONDS)
+    for provider in ("serper", "tavily")
+}
+
+# Shared HTTP session so search requests reuse pooled TCP/TLS connections
+# instead of paying a fresh handshake per query; closed at interpreter exit.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+# Ask for compressed JSON bodies; urllib3 only offers br/zstd when their
+# decoders are installed, so whatever the provider picks can be decoded
+_SESSION.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+atexit.register(_SESSION.close)
+
+
+# Search result cache: repeated queries to the same provider skip the API call
+SEARCH_RESULT_CACHE_MAX_ENTRIES = 4096
+SEARCH_RESULT_CACHE_TTL_SECONDS = 3600
+
+_SEARCH_RESULT_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, Tuple[SearchResult, ...]]]" = OrderedDict()
+_SEARCH_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _search_cache_key(provider: str, query: str) -> Tuple[str, str]:
+    """Cache key for a provider and query, ignoring case and whitespace differences."""
+    return provider, " ".join(query.lower().split())
+
+
+def _get_cached_results(key: Tuple[str, str]) -> Optional[List["SearchResult"]]:
+    """Return cached results for `key`, or None if missing or expired."""
+    with _SEARCH_RESULT_CACHE_LOCK:
+        entry = _SEARCH_RESULT_CACHE.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > SEARCH_RESULT_CACHE_TTL_SECONDS:
+            del _SEARCH_RESULT_CACHE[key]
+            return None
+        _SEARCH_RESULT_CACHE.move_to_end(key)
+        return list(entry[1])
+
+
+def _store_results(key: Tuple[str, str], results: List["SearchResult"]) -> None:
+    """Cache provider results for `key`, evicting the least recently used entry."""
+    with _SEARCH_RESULT_CACHE_LOCK:
+        _SEARCH_RESULT_CACHE[key] = (time.monotonic(), tuple(results))
+        _SEARCH_RESULT_CACHE.move_to_end(key)
+        if len(_SEARCH_RESULT_CACHE) > SEARCH_RESULT_CACHE_MAX_ENTRIES:
+            _SEARCH_RESULT_CACHE.popitem(last=False)
+
+
+# Searches currently awaiting a provider response, keyed by (event loop, cache
+# key); concurrent callers with the same query share one request
+_INFLIGHT_SEARCHES: Dict[Tuple[asyncio.AbstractEventLoop, Tuple[str, str]], "asyncio.Future[List[SearchResult]]"] = {}
+
+
+def clearSearchCache() -> None:
+    """Drop all cached search API results."""
+    with _SEARCH_RESULT_CACHE_LOCK:
+        _SEARCH_RESULT_CACHE.clear()
+
+
 class SearchResult:
     """Intermediate representation of a search result."""
     
+    # One instance per search hit; no per-instance __dict__
+    __slots__ = ('url', 'snippet', 'title', 'date', 'domain')
+    
     def __init__(self, url: str, snippet: str, title: str = "", date: Optional[str] = None):
         self.url = url
         self.snippet = snippet
         self.title = title
         self.date = date
-        self.domain = self._extract_domain(url)
+        # Resolved through extractDomain's cache; no per-instance method dispatch
+        self.domain = extractDomain(url)
+
+
+class MockSearchResult(SearchResult):
+    """Search result served from mock data because no search API answered."""
     
-    def _extract_domain(self, url: str) -> str:
-        """Extract domain from URL."""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc
-            # Remove www. prefix if present
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            return domain
-        except Exception as e:
-            logger.warning(f"Failed to extract domain from {url}: {e}")
-            return ""
+    __slots__ = ()
 
 
 def callSearchAPI(query: str) -> List[SearchResult]:
@@ -63,7 +155,10 @@ def callSearchAPI(query: str) -> List[SearchResult]:
     
     This function attempts to use the configured search API to find relevant
     information for the given query. It handles API errors, rate limits, and
-    parses results into a standardized format.
+    parses results into a standardized format. Results returned by the API are
+    cached per provider and query for SEARCH_RESULT_CACHE_TTL_SECONDS. A
+    provider that keeps failing is skipped (failing over to the other
+    configured provider) until its circuit breaker's cooldown has passed.
     
     Args:
         query: The search query string
@@ -81,23 +176,224 @@ def callSearchAPI(query: str) -> List[SearchResult]:
         logger.warning("Empty query provided to callSearchAPI")
         return []
     
+    # Determine which API to use
+    selected = _select_search_provider()
+    if selected is None:
+        return _call_mock_search(query)
+    provider, call = selected
+    
+    # Serve repeated queries from the cache
+    key = _search_cache_key(provider, query)
+    cached = _get_cached_results(key)
+    if cached is not None:
+        logger.debug("Search result cache hit for '%s'", query)
+        return cached
+    
     # Try real APIs first
+    breaker = _search_circuit_breakers[provider]
     try:
-        # Determine which API to use
-        if settings.SERPER_API_KEY:
-            return _call_serper_api(query)
-        elif settings.TAVILY_API_KEY:
-            return _call_tavily_api(query)
-        else:
-            logger.warning("No search API key configured - using mock results")
-            return _call_mock_search(query)
+        _search_rate_limiters[provider].acquire()
+        results = call(query)
+        breaker.record_success()
+        _store_results(key, results)
+        return results
     except (SearchAPIError, RateLimitError) as e:
+        # Throttling means the provider is up; anything else counts toward
+        # opening its circuit breaker
+        if not isinstance(e, RateLimitError):
+            breaker.record_failure()
         # If API fails, fall back to mock results
-        logger.warning(f"Search API failed: {e}")
+        logger.warning("Search API failed: %s", e)
         logger.warning("Falling back to mock search results for testing")
         return _call_mock_search(query)
 
 
+def _select_search_provider() -> Optional[Tuple[str, Any]]:
+    """
+    Pick the search provider to call: the first configured one (Serper, then
+    Tavily) whose circuit breaker allows a request.
+    
+    Returns:
+        (provider name, provider call function), or None if no provider is
+        configured or every configured provider's breaker is open
+    """
+    configured = []
+    if settings.SERPER_API_KEY:
+        configured.append(("serper", _call_serper_api))
+    if settings.TAVILY_API_KEY:
+        configured.append(("tavily", _call_tavily_api))
+    
+    if not configured:
+        logger.warning("No search API key configured - using mock results")
+        return None
+    
+    for provider, call in configured:
+        if _search_circuit_breakers[provider].allow():
+            return provider, call
+        logger.debug("Search provider %s circuit is open, skipping", provider)
+    
+    logger.warning("All search providers are failing - using mock results")
+    return None
+
+
+async def callSearchAPIAsync(query: str) -> List[SearchResult]:
+    """
+    Asynchronous variant of callSearchAPI for concurrent multi-claim searches.
+    
+    Requests are throttled by the shared token bucket before being sent
+    without blocking the event loop; throttled or transiently failing requests
+    are retried by the provider call (see _post_with_backoff) before falling
+    back to mock results like callSearchAPI. Concurrent calls for the same
+    provider and query share a single request.
+    
+    Args:
+        query: The search query string
+    
+    Returns:
+        List of SearchResult objects containing URL, snippet, and domain
+    
+    Requirements: 3.1, 11.3, 16.2
+    """
+    if not query or not query.strip():
+        logger.warning("Empty query provided to callSearchAPIAsync")
+        return []
+    
+    selected = _select_search_provider()
+    if selected is None:
+        return _call_mock_search(query)
+    provider, call = selected
+    
+    # Serve repeated queries from the cache
+    key = _search_cache_key(provider, query)
+    cached = _get_cached_results(key)
+    if cached is not None:
+        logger.debug("Search result cache hit for '%s'", query)
+        return cached
+    
+    # Join an identical search already in flight on this event loop instead
+    # of sending a duplicate request (no await between check and register,
+    # so no lock is needed)
+    loop = asyncio.get_running_loop()
+    flight_key = (loop, key)
+    pending = _INFLIGHT_SEARCHES.get(flight_key)
+    if pending is not None:
+        logger.debug("Joining in-flight search for '%s'", query)
+        # Shield so a cancelled follower does not cancel the shared search
+        return list(await asyncio.shield(pending))
+    
+    future = loop.create_future()
+    _INFLIGHT_SEARCHES[flight_key] = future
+    try:
+        results = await _fetch_search_results_async(provider, call, query, key)
+        future.set_result(results)
+        return results
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark the exception retrieved; followers still receive it
+        future.exception()
+        raise
+    finally:
+        del _INFLIGHT_SEARCHES[flight_key]
+
+
+async def _fetch_search_results_async(
+    provider: str,
+    call,
+    query: str,
+    key: Tuple[str, str]
+) -> List[SearchResult]:
+    """Throttle, call the provider in a worker thread and cache the results, falling back to mock results."""
+    breaker = _search_circuit_breakers[provider]
+    await _search_rate_limiters[provider].acquire_async()
+    try:
+        # requests is blocking, so run the call in a worker thread
+        results = await asyncio.to_thread(call, query)
+        breaker.record_success()
+        _store_results(key, results)
+        return results
+    except (SearchAPIError, RateLimitError) as e:
+        if not isinstance(e, RateLimitError):
+            breaker.record_failure()
+        logger.warning("Search API failed: %s", e)
+    
+    logger.warning("Falling back to mock search results for testing")
+    return _call_mock_search(query)
+
+
+# Statuses worth retrying: throttling and transient gateway errors
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Delay requested by a numeric Retry-After header, or None if absent or not numeric."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _post_with_backoff(
+    url: str,
+    limiter: TokenBucket,
+    *,
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    cap: float = 30.0,
+    **kwargs
+) -> requests.Response:
+    """
+    POST through the shared session, retrying 429/502/503/504 responses.
+    
+    The delay before each retry is the server's Retry-After when it gives a
+    number of seconds, otherwise jittered exponential backoff; both are capped
+    at `cap`. Retries also wait for the provider's rate limiter (the caller
+    paces the first attempt), and every response feeds the limiter's adaptive
+    rate. The last response is returned as-is once retries are exhausted, so
+    callers still map a final 429 to RateLimitError.
+    
+    Args:
+        url: Request URL
+        limiter: Rate limiter of the provider being called
+        max_retries: Maximum number of retries after the first attempt
+        base_delay: Backoff scale in seconds
+        cap: Maximum delay between attempts in seconds
+        **kwargs: Passed to requests.Session.post
+    
+    Returns:
+        The final response
+    """
+    attempt = 0
+    while True:
+        response = _SESSION.post(url, **kwargs)
+        
+        # Adapt the throttle to the provider's reported quota and throttling
+        limiter.update_from_headers(response.headers)
+        if response.status_code == 429:
+            limiter.record_throttled()
+        elif response.status_code == 200:
+            limiter.record_success()
+        
+        if response.status_code not in _RETRY_STATUSES or attempt >= max_retries:
+            return response
+        
+        delay = _retry_after_seconds(response)
+        delay = backoff_with_jitter(attempt, base_delay, cap) if delay is None else min(delay, cap)
+        logger.warning(
+            "Search API returned %s, retrying in %.1f seconds (attempt %d/%d)...",
+            response.status_code, delay, attempt + 1, max_retries
+        )
+        time.sleep(delay)
+        attempt += 1
+        limiter.acquire()
+
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+    if _orjson is not None:
+        return _orjson.loads(response.content)
+    return response.json()
+
+
 def _call_mock_search(query: str) -> List[SearchResult]:
     """
     Use mock search results when real API is unavailable.
@@ -114,7 +410,7 @@ def _call_mock_search(query: str) -> List[SearchResult]:
     
     search_results = []
     for result in mock_results:
-        search_results.append(SearchResult(
+        search_results.append(MockSearchResult(
             url=result.get('link', ''),
             snippet=result.get('snippet', ''),
             title=result.get('title', ''),
@@ -149,8 +445,9 @@ def _call_serper_api(query: str) -> List[SearchResult]:
     }
     
     try:
-        response = requests.post(
+        response = _post_with_backoff(
             url,
+            _search_rate_limiters["serper"],
             json=payload,
             headers=headers,
             timeout=settings.REQUEST_TIMEOUT_SECONDS
@@ -158,28 +455,28 @@ def _call_serper_api(query: str) -> List[SearchResult]:
         
         # Handle rate limiting
         if response.status_code == 429:
-            logger.warning(f"Serper API rate limit exceeded for query: {query}")
+            logger.warning("Serper API rate limit exceeded for query: %s", query)
             raise RateLimitError("Serper API rate limit exceeded")
         
         # Handle other errors
         if response.status_code != 200:
-            logger.error(f"Serper API error {response.status_code}: {response.text}")
+            logger.error("Serper API error %s: %s", response.status_code, response.text)
             raise SearchAPIError(f"Serper API returned status {response.status_code}")
         
-        data = response.json()
+        data = _response_json(response)
         return _parse_serper_results(data)
     
     except RateLimitError:
         # Re-raise RateLimitError without wrapping
         raise
     except requests.Timeout:
-        logger.error(f"Serper API timeout for query: {query}")
+        logger.error("Serper API timeout for query: %s", query)
         raise SearchAPIError("Search API request timed out")
     except requests.RequestException as e:
-        logger.error(f"Serper API request failed: {e}")
+        logger.error("Serper API request failed: %s", e)
         raise SearchAPIError(f"Search API request failed: {e}")
     except Exception as e:
-        logger.error(f"Unexpected error calling Serper API: {e}")
+        logger.error("Unexpected error calling Serper API: %s", e)
         raise SearchAPIError(f"Unexpected error: {e}")
 
 
@@ -196,27 +493,28 @@ def _parse_serper_results(data: Dict[str, Any]) -> List[SearchResult]:
     results = []
     
     # Serper returns results in 'organic' field
-    organic_results = data.get('organic', [])
+    organic_results = data.get('organic') or []
     
     for item in organic_results:
         try:
-            url = item.get('link', '')
-            snippet = item.get('snippet', '')
-            title = item.get('title', '')
-            date = item.get('date')  # May be None
+            # Reject items without a URL or snippet (missing or null) before
+            # reading the other fields or extracting the domain
+            url = item.get('link') or ''
+            snippet = item.get('snippet') or ''
+            if not (url and snippet):
+                continue
             
-            if url and snippet:
-                results.append(SearchResult(
-                    url=url,
-                    snippet=snippet,
-                    title=title,
-                    date=date
-                ))
+            results.append(SearchResult(
+                url=url,
+                snippet=snippet,
+                title=item.get('title') or '',
+                date=item.get('date')  # May be None
+            ))
         except Exception as e:
-            logger.warning(f"Failed to parse Serper result: {e}")
+            logger.warning("Failed to parse Serper result: %s", e)
             continue
     
-    logger.info(f"Parsed {len(results)} results from Serper API")
+    logger.info("Parsed %d results from Serper API", len(results))
     return results
 
 
@@ -248,8 +546,9 @@ def _call_tavily_api(query: str) -> List[SearchResult]:
     }
     
     try:
-        response = requests.post(
+        response = _post_with_backoff(
             url,
+            _search_rate_limiters["tavily"],
             json=payload,
             headers=headers,
             timeout=settings.REQUEST_TIMEOUT_SECONDS
@@ -257,28 +556,28 @@ def _call_tavily_api(query: str) -> List[SearchResult]:
         
         # Handle rate limiting
         if response.status_code == 429:
-            logger.warning(f"Tavily API rate limit exceeded for query: {query}")
+            logger.warning("Tavily API rate limit exceeded for query: %s", query)
             raise RateLimitError("Tavily API rate limit exceeded")
         
         # Handle other errors
         if response.status_code != 200:
-            logger.error(f"Tavily API error {response.status_code}: {response.text}")
+            logger.error("Tavily API error %s: %s", response.status_code, response.text)
             raise SearchAPIError(f"Tavily API returned status {response.status_code}")
         
-        data = response.json()
+        data = _response_json(response)
         return _parse_tavily_results(data)
     
     except RateLimitError:
         # Re-raise RateLimitError without wrapping
         raise
     except requests.Timeout:
-        logger.error(f"Tavily API timeout for query: {query}")
+        logger.error("Tavily API timeout for query: %s", query)
         raise SearchAPIError("Search API request timed out")
     except requests.RequestException as e:
-        logger.error(f"Tavily API request failed: {e}")
+        logger.error("Tavily API request failed: %s", e)
         raise SearchAPIError(f"Search API request failed: {e}")
     except Exception as e:
-        logger.error(f"Unexpected error calling Tavily API: {e}")
+        logger.error("Unexpected error calling Tavily API: %s", e)
         raise SearchAPIError(f"Unexpected error: {e}")
 
 
@@ -295,53 +594,59 @@ def _parse_tavily_results(data: Dict[str, Any]) -> List[SearchResult]:
     results = []
     
     # Tavily returns results in 'results' field
-    search_results = data.get('results', [])
+    search_results = data.get('results') or []
     
     for item in search_results:
         try:
-            url = item.get('url', '')
-            snippet = item.get('content', '')
-            title = item.get('title', '')
-            # Tavily may include published_date
-            date = item.get('published_date')
+            # Reject items without a URL or snippet (missing or null) before
+            # reading the other fields or extracting the domain
+            url = item.get('url') or ''
+            snippet = item.get('content') or ''
+            if not (url and snippet):
+                continue
             
-            if url and snippet:
-                results.append(SearchResult(
-                    url=url,
-                    snippet=snippet,
-                    title=title,
-                    date=date
-                ))
+            results.append(SearchResult(
+                url=url,
+                snippet=snippet,
+                title=item.get('title') or '',
+                date=item.get('published_date')  # May be None
+            ))
         except Exception as e:
-            logger.warning(f"Failed to parse Tavily result: {e}")
+            logger.warning("Failed to parse Tavily result: %s", e)
             continue
     
-    logger.info(f"Parsed {len(results)} results from Tavily API")
+    logger.info("Parsed %d results from Tavily API", len(results))
     return results
 
 
+# Network location of a URL: everything after "scheme://" (or "//") up to the path
+_DOMAIN_RE = re.compile(r"^(?:[a-z][a-z0-9+.-]*:)?//([^/?#]*)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=16384)
 def extractDomain(url: str) -> str:
     """
     Extract domain name from a URL.
     
+    Results are cached since the same URLs recur across searches; the cache
+    is sized to hold every result URL seen over a long batch run.
+    
     Args:
         url: The URL to extract domain from
     
     Returns:
-        Domain name (without www. prefix)
+        Domain name (without www. prefix), or "" if the URL has no domain
     
     Requirements: 3.1
     """
-    try:
-        parsed = urlparse(url)
-        domain = parsed.netloc
-        # Remove www. prefix if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        return domain.lower()
-    except Exception as e:
-        logger.warning(f"Failed to extract domain from {url}: {e}")
+    match = _DOMAIN_RE.match(url or "")
+    if not match:
         return ""
+    domain = match.group(1).lower()
+    # Remove www. prefix if present
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
 
 
 def optimizeQueryForSearch(claimText: str) -> str:
@@ -359,24 +664,71 @@ def optimizeQueryForSearch(claimText: str) -> str:
     
     Requirements: 3.1
     """
+    # Short-circuit empty input so it never occupies a cache slot
     if not claimText or not claimText.strip():
         return ""
     
+    return _optimize_query(claimText)
+
+
+@lru_cache(maxsize=2048)
+def _optimize_query(claimText: str) -> str:
+    """Cached body of optimizeQueryForSearch for non-empty claims."""
     # For now, use the claim text as-is with some basic cleanup
     # In a production system, this could use NLP to extract key entities
-    query = claimText.strip()
-    
-    # Remove quotes that might interfere with search
-    query = query.replace('"', '').replace("'", "")
+    # Remove quotes that might interfere with search (two str.replace calls
+    # beat a character-class regex or str.translate here, and return the
+    # string unchanged without copying when it has no quotes). Strip after
+    # removing them, so a quoted claim leaves no edge whitespace behind
+    query = claimText.replace('"', '').replace("'", "").strip()
     
     # Limit query length to avoid API issues
     max_length = 200
     if len(query) > max_length:
-        query = query[:max_length].rsplit(' ', 1)[0]  # Cut at word boundary
+        query = query[:max_length].rsplit(' ', 1)[0].rstrip()  # Cut at word boundary
     
     return query
 
 
+class PreparedClaim(NamedTuple):
+    """A claim normalized and tokenized once for scoring against many snippets."""
+    text_lower: str
+    words: FrozenSet[str]
+
+
+@lru_cache(maxsize=1024)
+def prepareClaim(claimText: str) -> PreparedClaim:
+    """
+    Normalize and tokenize a claim for use with calculateRelevancePrepared.
+    
+    Results are cached, so scoring the same claim repeatedly only tokenizes it once.
+    
+    Args:
+        claimText: The claim text
+    
+    Returns:
+        PreparedClaim with the lowercased text and its content-word set
+    """
+    claim_lower = claimText.lower()
+    return PreparedClaim(claim_lower, frozenset(_content_words(claim_lower)))
+
+
+def calculateRelevancePrepared(claim: PreparedClaim, snippet: str) -> float:
+    """
+    Calculate relevance score between a prepared claim and an evidence snippet.
+    
+    Args:
+        claim: Claim returned by prepareClaim
+        snippet: The evidence snippet
+    
+    Returns:
+        Relevance score between 0.0 and 1.0
+    
+    Requirements: 19.1, 19.2, 19.3
+    """
+    return _relevance(claim.text_lower, claim.words, snippet)
+
+
 def calculateRelevance(claimText: str, snippet: str) -> float:
     """
     Calculate relevance score between a claim and an evidence snippet.
@@ -396,43 +748,244 @@ def calculateRelevance(claimText: str, snippet: str) -> float:
     if not claimText or not snippet:
         return 0.0
     
-    # Normalize text to lowercase for comparison
-    claim_lower = claimText.lower()
-    snippet_lower = snippet.lower()
-    
-    # Split into words
-    claim_words = set(claim_lower.split())
-    snippet_words = set(snippet_lower.split())
-    
-    # Remove common stop words
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-        'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
-        'those', 'it', 'its', 'they', 'them', 'their'
-    }
+    return calculateRelevancePrepared(prepareClaim(claimText), snippet)
+
+
+def _bm25_scores(claimText: str, snippets: List[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
+    """
+    Score snippets against a claim with Okapi BM25.
+    
+    The snippets themselves form the corpus for document frequencies, so each
+    claim term is weighted by how discriminative it is among the candidates.
+    Scores are divided by the best attainable score for the claim (every
+    term saturated) so they stay within 0.0-1.0 like the Jaccard scores.
+    """
+    query_terms = set(_tokenize(claimText))
+    documents = [Counter(_tokenize(snippet)) for snippet in snippets]
+    if not query_terms or not documents:
+        return [0.0] * len(snippets)
+    
+    doc_lengths = [sum(document.values()) for document in documents]
+    avgdl = (sum(doc_lengths) / len(documents)) or 1.0
+    
+    n_docs = len(documents)
+    idf = {}
+    for term in query_terms:
+        df = sum(1 for document in documents if term in document)
+        idf[term] = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+    max_score = (k1 + 1.0) * sum(idf.values())
+    
+    scores = []
+    for document, length in zip(documents, doc_lengths):
+        norm = k1 * (1.0 - b + b * length / avgdl)
+        score = 0.0
+        for term in query_terms:
+            tf = document.get(term)
+            if tf:
+                score += idf[term] * tf * (k1 + 1.0) / (tf + norm)
+        scores.append(min(1.0, score / max_score))
+    return scores
+
+
+# scikit-learn's TfidfVectorizer class, imported on first use of the TF-IDF scorer
+_tfidf_vectorizer_cls = None
+_tfidf_load_failed: bool = False
+
+
+def _load_tfidf_vectorizer():
+    """Return sklearn's TfidfVectorizer, or None if scikit-learn is not installed."""
+    global _tfidf_vectorizer_cls, _tfidf_load_failed
     
-    claim_words = claim_words - stop_words
-    snippet_words = snippet_words - stop_words
+    if _tfidf_vectorizer_cls is not None or _tfidf_load_failed:
+        return _tfidf_vectorizer_cls
     
-    # Calculate Jaccard similarity (intersection over union)
-    if not claim_words or not snippet_words:
-        return 0.0
+    try:
+        # Import here to avoid import errors if not installed
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        _tfidf_vectorizer_cls = TfidfVectorizer
+    except ImportError as e:
+        logger.info("scikit-learn unavailable, using pure-Python TF-IDF scoring: %s", e)
+        _tfidf_load_failed = True
+    return _tfidf_vectorizer_cls
+
+
+def _ngrams(text: str) -> List[str]:
+    """Unigram and bigram terms of a text, using the relevance tokenizer."""
+    tokens = _tokenize(text)
+    return tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+
+
+def _tfidf_scores(claimText: str, snippets: List[str]) -> List[float]:
+    """
+    Score snippets against a claim by TF-IDF cosine similarity.
     
-    intersection = len(claim_words & snippet_words)
-    union = len(claim_words | snippet_words)
+    The claim and snippets are vectorized together over unigrams and bigrams
+    (smoothed IDF, L2-normalized rows), so the claim row's inner product with
+    each snippet row is their cosine similarity. With scikit-learn installed
+    this runs as one sparse matrix product; otherwise the same weights are
+    computed in Python.
+    """
+    documents = [claimText] + snippets
     
-    if union == 0:
-        return 0.0
+    vectorizer_cls = _load_tfidf_vectorizer()
+    if vectorizer_cls is not None:
+        # A fresh vectorizer per call: fitting mutates it, so one shared
+        # instance would not be safe across threads
+        vectorizer = vectorizer_cls(analyzer=_ngrams)
+        try:
+            matrix = vectorizer.fit_transform(documents)
+        except ValueError:
+            # Empty vocabulary: nothing but stop words
+            return [0.0] * len(snippets)
+        similarities = (matrix[1:] @ matrix[0].T).toarray().ravel()
+        return [min(1.0, float(value)) for value in similarities]
+    
+    counts = [Counter(_ngrams(document)) for document in documents]
+    n_docs = len(documents)
+    df = Counter(term for document in counts for term in document)
+    idf = {term: math.log((1 + n_docs) / (1 + freq)) + 1.0 for term, freq in df.items()}
+    
+    vectors = []
+    for document in counts:
+        weights = {term: tf * idf[term] for term, tf in document.items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        vectors.append({term: weight / norm for term, weight in weights.items()} if norm else {})
+    
+    claim_vector = vectors[0]
+    return [
+        min(1.0, sum(weight * claim_vector.get(term, 0.0) for term, weight in vector.items()))
+        for vector in vectors[1:]
+    ]
+
+
+def calculateRelevanceBatch(claimText: str, snippets: List[str]) -> List[float]:
+    """
+    Calculate relevance scores between a claim and several evidence snippets.
+    
+    Uses the scorer selected by settings.RELEVANCE_SCORER: "jaccard" (default)
+    gives the same scores as calling calculateRelevance for each snippet, but
+    tokenizes the claim only once; "bm25" ranks with Okapi BM25 using
+    per-term IDF over the given snippets; "tfidf" uses TF-IDF cosine
+    similarity over unigrams and bigrams, vectorized with scikit-learn when
+    it is installed.
+    
+    Args:
+        claimText: The claim text
+        snippets: The evidence snippets
+    
+    Returns:
+        Relevance scores between 0.0 and 1.0, one per snippet
+    
+    Requirements: 19.1, 19.2, 19.3
+    """
+    if not claimText:
+        return [0.0] * len(snippets)
+    
+    if settings.RELEVANCE_SCORER == "bm25":
+        return _bm25_scores(claimText, snippets)
+    if settings.RELEVANCE_SCORER == "tfidf":
+        return _tfidf_scores(claimText, snippets) if snippets else []
+    
+    claim = prepareClaim(claimText)
+    return [calculateRelevancePrepared(claim, snippet) for snippet in snippets]
+
+
+def _trusted_results(results: List[SearchResult]) -> List[Tuple[SearchResult, float]]:
+    """
+    Pair search results with their credibility score, dropping those below the
+    threshold and those that cannot become Evidence (no domain or blank snippet).
+    """
+    from src.source_credibility import get_credibility_scores
+    
+    # One lookup per distinct domain; results often repeat the same outlet
+    scores = get_credibility_scores(result.domain for result in results)
+    threshold = settings.MINIMUM_CREDIBILITY_THRESHOLD
+    
+    trusted = []
+    for result in results:
+        # Reject invalid hits here, before they are scored and can take a
+        # top-ranked slot only to be discarded when building Evidence
+        if not result.domain or not result.snippet.strip():
+            logger.debug("Skipped search result without domain or snippet: %s", result.url)
+            continue
+        
+        score = scores[result.domain]
+        
+        # Filter by credibility threshold
+        if score < threshold:
+            logger.debug(
+                "Filtered out %s with credibility %s < %s", result.domain, score, threshold
+            )
+            continue
+        
+        trusted.append((result, score))
+    
+    return trusted
+
+
+# Date layouts search APIs return besides ISO 8601, e.g. "Jan 5, 2024"
+_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%d %b %Y")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date: str) -> Optional[datetime]:
+    """
+    Parse a search result date string, or return None if it cannot be parsed.
     
-    jaccard_score = intersection / union
+    ISO 8601 and a few common fixed layouts are tried first; dateutil's much
+    slower heuristic parser is only used for anything else. Results are cached
+    since the same dates recur across results and claims.
+    """
+    try:
+        return datetime.fromisoformat(date.replace("Z", "+00:00"))
+    except ValueError:
+        pass
     
-    # Boost score if claim appears as substring in snippet
-    if claim_lower in snippet_lower or snippet_lower in claim_lower:
-        jaccard_score = min(1.0, jaccard_score * 1.5)
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date, date_format)
+        except ValueError:
+            continue
     
-    return jaccard_score
+    try:
+        from dateutil import parser
+        return parser.parse(date)
+    except Exception as e:
+        logger.debug("Failed to parse date '%s': %s", date, e)
+        return None
+
+
+def _to_evidence(
+    result: SearchResult,
+    credibility: float,
+    relevance: float = 0.0,
+    combined: float = 0.0,
+    max_snippet_chars: Optional[int] = None
+) -> Optional[Evidence]:
+    """Build an Evidence object from a search result, or None if it is invalid."""
+    try:
+        # Create Evidence object
+        evidence = Evidence(
+            sourceURL=result.url,
+            sourceDomain=result.domain,
+            snippet=result.snippet[:max_snippet_chars] if max_snippet_chars else result.snippet,
+            publishDate=None,  # Will be set if available
+            credibilityScore=credibility,
+            relevanceScore=relevance,
+            combinedScore=combined
+        )
+    except Exception as e:
+        logger.warning("Error processing search result from %s: %s", result.domain, e)
+        return None
+    
+    # Parse date if available
+    if result.date:
+        if isinstance(result.date, str):
+            evidence.publishDate = _parse_date(result.date)
+        elif isinstance(result.date, datetime):
+            evidence.publishDate = result.date
+    
+    return evidence
 
 
 def filterTrustedSources(results: List[SearchResult]) -> List[Evidence]:
@@ -440,8 +993,8 @@ def filterTrustedSources(results: List[SearchResult]) -> List[Evidence]:
     Filter search results to include only trusted sources above credibility threshold.
     
     This function looks up the credibility score for each search result and filters
-    out sources that don't meet the minimum credibility threshold. It also calculates
-    relevance scores for the filtered results.
+    out sources that don't meet the minimum credibility threshold. Relevance scores
+    are left at 0.0 for the caller to fill in.
     
     Args:
         results: List of SearchResult objects from search API
@@ -451,75 +1004,93 @@ def filterTrustedSources(results: List[SearchResult]) -> List[Evidence]:
     
     Requirements: 3.2, 3.3, 12.5
     """
-    from src.source_credibility import lookup_source_credibility
-    
     trusted_evidence = []
     
-    for result in results:
-        try:
-            # Look up source credibility
-            credibility = lookup_source_credibility(result.domain)
-            
-            # Filter by credibility threshold
-            if credibility.credibilityScore >= settings.MINIMUM_CREDIBILITY_THRESHOLD:
-                # Create Evidence object
-                evidence = Evidence(
-                    sourceURL=result.url,
-                    sourceDomain=result.domain,
-                    snippet=result.snippet,
-                    publishDate=None,  # Will be set if available
-                    credibilityScore=credibility.credibilityScore,
-                    relevanceScore=0.0  # Will be calculated later
-                )
-                
-                # Parse date if available
-                if result.date:
-                    try:
-                        # Try to parse date string
-                        if isinstance(result.date, str):
-                            from dateutil import parser
-                            evidence.publishDate = parser.parse(result.date)
-                        elif isinstance(result.date, datetime):
-                            evidence.publishDate = result.date
-                    except Exception as e:
-                        logger.debug(f"Failed to parse date '{result.date}': {e}")
-                
-                trusted_evidence.append(evidence)
-            else:
-                logger.debug(
-                    f"Filtered out {result.domain} with credibility "
-                    f"{credibility.credibilityScore} < {settings.MINIMUM_CREDIBILITY_THRESHOLD}"
-                )
-        
-        except Exception as e:
-            logger.warning(f"Error processing search result from {result.domain}: {e}")
-            continue
+    for result, credibility in _trusted_results(results):
+        evidence = _to_evidence(result, credibility)
+        if evidence is not None:
+            trusted_evidence.append(evidence)
     
     logger.info(
-        f"Filtered {len(results)} results to {len(trusted_evidence)} trusted sources "
-        f"(threshold: {settings.MINIMUM_CREDIBILITY_THRESHOLD})"
+        "Filtered %d results to %d trusted sources (threshold: %s)",
+        len(results), len(trusted_evidence), settings.MINIMUM_CREDIBILITY_THRESHOLD
     )
     
     return trusted_evidence
 
 
-def searchEvidence(claim) -> List[Evidence]:
+def _rankEvidence(
+    claim,
+    search_results: List[SearchResult],
+    max_snippet_chars: Optional[int] = None
+) -> Iterator[Evidence]:
+    """Filter, score and rank search results for a claim, yielding Evidence best first."""
+    # Step 3: Filter by credibility threshold
+    trusted = _trusted_results(search_results)
+    
+    if not trusted:
+        logger.warning(
+            "No trusted sources found for claim: %s (threshold: %s)",
+            claim.text, settings.MINIMUM_CREDIBILITY_THRESHOLD
+        )
+        return
+    
+    # Work on parallel columns from here on rather than (result, score) pairs
+    results, credibilities = zip(*trusted)
+    
+    # Step 4: Calculate relevance scores
+    relevance_scores = calculateRelevanceBatch(
+        claim.text, [result.snippet for result in results]
+    )
+    
+    # Step 5: Rank by combined score (70% relevance + 30% credibility)
+    combined_scores = [
+        0.7 * relevance + 0.3 * credibility
+        for relevance, credibility in zip(relevance_scores, credibilities)
+    ]
+    
+    # Step 6: Keep the top MAX_EVIDENCE_PER_CLAIM with a bounded heap;
+    # only these are turned into Evidence objects
+    top_indices = heapq.nlargest(
+        settings.MAX_EVIDENCE_PER_CLAIM,
+        range(len(combined_scores)),
+        key=combined_scores.__getitem__
+    )
+    
+    logger.info(
+        "Found %d evidence candidates for claim (from %d search results)",
+        len(top_indices), len(search_results)
+    )
+    
+    for index in top_indices:
+        evidence = _to_evidence(
+            results[index], credibilities[index], relevance_scores[index],
+            combined_scores[index], max_snippet_chars
+        )
+        if evidence is not None:
+            yield evidence
+
+
+def iterEvidence(claim, max_snippet_chars: Optional[int] = None) -> Iterator[Evidence]:
     """
-    Main function to search for evidence, filter by credibility, and rank by relevance.
+    Search for evidence and yield it one item at a time, best first.
     
-    This function orchestrates the complete evidence retrieval process:
+    Same pipeline as searchEvidence, but Evidence objects are only built as
+    they are consumed, so a caller that stops early or processes items as they
+    arrive never holds the full ranked list. This function orchestrates:
     1. Optimize the claim text for search
     2. Query the search API
     3. Filter results by source credibility
     4. Calculate relevance scores
     5. Rank by combined score (70% relevance + 30% credibility)
-    6. Return top MAX_EVIDENCE_PER_CLAIM results
+    6. Yield top MAX_EVIDENCE_PER_CLAIM results
     
     Args:
         claim: Claim object to search evidence for
+        max_snippet_chars: Truncate yielded snippets to this many characters
     
-    Returns:
-        List of Evidence objects, ranked by combined score
+    Yields:
+        Evidence objects, in descending combined-score order
     
     Raises:
         SearchAPIError: If search API fails
@@ -529,87 +1100,216 @@ def searchEvidence(claim) -> List[Evidence]:
     """
     if not claim or not claim.text:
         logger.warning("Empty claim provided to searchEvidence")
-        return []
+        return
     
     try:
         # Step 1: Optimize query for search
         search_query = optimizeQueryForSearch(claim.text)
         if not search_query:
-            logger.warning(f"Failed to create search query for claim: {claim.text}")
-            return []
+            logger.warning("Failed to create search query for claim: %s", claim.text)
+            return
         
-        logger.info(f"Searching for evidence: '{search_query}'")
+        logger.info("Searching for evidence: '%s'", search_query)
         
         # Step 2: Query search API
         search_results = callSearchAPI(search_query)
         
         if not search_results:
-            logger.warning(f"No search results found for claim: {claim.text}")
-            return []
-        
-        # Step 3: Filter by credibility threshold
-        trusted_evidence = filterTrustedSources(search_results)
-        
-        if not trusted_evidence:
-            logger.warning(
-                f"No trusted sources found for claim: {claim.text} "
-                f"(threshold: {settings.MINIMUM_CREDIBILITY_THRESHOLD})"
-            )
-            return []
-        
-        # Step 4: Calculate relevance scores
-        for evidence in trusted_evidence:
-            evidence.relevanceScore = calculateRelevance(claim.text, evidence.snippet)
-        
-        # Step 5: Rank by combined score (70% relevance + 30% credibility)
-        for evidence in trusted_evidence:
-            combined_score = (0.7 * evidence.relevanceScore + 
-                            0.3 * evidence.credibilityScore)
-            # Store combined score as a temporary attribute for sorting
-            evidence._combined_score = combined_score
-        
-        # Sort by combined score (descending)
-        trusted_evidence.sort(key=lambda e: e._combined_score, reverse=True)
-        
-        # Step 6: Limit to MAX_EVIDENCE_PER_CLAIM top results
-        top_evidence = trusted_evidence[:settings.MAX_EVIDENCE_PER_CLAIM]
+            logger.warning("No search results found for claim: %s", claim.text)
+            return
         
-        # Clean up temporary attribute
-        for evidence in top_evidence:
-            if hasattr(evidence, '_combined_score'):
-                delattr(evidence, '_combined_score')
-        
-        logger.info(
-            f"Found {len(top_evidence)} evidence items for claim "
-            f"(from {len(search_results)} search results)"
-        )
-        
-        return top_evidence
+        # Steps 3-6: Filter, score and rank
+        yield from _rankEvidence(claim, search_results, max_snippet_chars)
     
     except RateLimitError:
         # Re-raise rate limit errors for special handling
-        logger.error(f"Rate limit exceeded while searching for claim: {claim.text}")
+        logger.error("Rate limit exceeded while searching for claim: %s", claim.text)
         raise
     
     except SearchAPIError as e:
         # Log and re-raise search API errors
-        logger.error(f"Search API error for claim '{claim.text}': {e}")
+        logger.error("Search API error for claim '%s': %s", claim.text, e)
         raise
     
     except Exception as e:
         # Catch unexpected errors
-        logger.error(f"Unexpected error searching evidence for claim '{claim.text}': {e}")
+        logger.error("Unexpected error searching evidence for claim '%s': %s", claim.text, e)
+        raise SearchAPIError(f"Unexpected error during evidence search: {e}")
+
+
+def searchEvidence(claim) -> List[Evidence]:
+    """
+    Main function to search for evidence, filter by credibility, and rank by relevance.
+    
+    This function orchestrates the complete evidence retrieval process:
+    1. Optimize the claim text for search
+    2. Query the search API
+    3. Filter results by source credibility
+    4. Calculate relevance scores
+    5. Rank by combined score (70% relevance + 30% credibility)
+    6. Return top MAX_EVIDENCE_PER_CLAIM results
+    
+    See iterEvidence for a streaming variant.
+    
+    Args:
+        claim: Claim object to search evidence for
+    
+    Returns:
+        List of Evidence objects, ranked by combined score
+    
+    Raises:
+        SearchAPIError: If search API fails
+        RateLimitError: If rate limit is exceeded
+    
+    Requirements: 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7, 12.5, 19.1, 19.2, 19.3, 19.4
+    """
+    return list(iterEvidence(claim))
+
+
+async def searchEvidenceAsync(claim) -> List[Evidence]:
+    """
+    Asynchronous variant of searchEvidence.
+    
+    The search request goes through callSearchAPIAsync, so many claims can be
+    searched concurrently from one event loop; filtering and ranking are the
+    same as in searchEvidence.
+    
+    Args:
+        claim: Claim object to search evidence for
+    
+    Returns:
+        List of Evidence objects, ranked by combined score
+    
+    Raises:
+        SearchAPIError: If search API fails
+    
+    Requirements: 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7, 12.5, 19.1, 19.2, 19.3, 19.4
+    """
+    if not claim or not claim.text:
+        logger.warning("Empty claim provided to searchEvidenceAsync")
+        return []
+    
+    try:
+        search_query = optimizeQueryForSearch(claim.text)
+        if not search_query:
+            logger.warning("Failed to create search query for claim: %s", claim.text)
+            return []
+        
+        logger.info("Searching for evidence: '%s'", search_query)
+        search_results = await callSearchAPIAsync(search_query)
+        
+        if not search_results:
+            logger.warning("No search results found for claim: %s", claim.text)
+            return []
+        
+        return list(_rankEvidence(claim, search_results))
+    
+    except (RateLimitError, SearchAPIError) as e:
+        logger.error("Search API error for claim '%s': %s", claim.text, e)
+        raise
+    
+    except Exception as e:
+        logger.error("Unexpected error searching evidence for claim '%s': %s", claim.text, e)
         raise SearchAPIError(f"Unexpected error during evidence search: {e}")
 
 
+async def searchEvidenceBatchAsync(claims: List[Any]) -> List[Any]:
+    """
+    Search evidence for several claims concurrently.
+    
+    Total latency is roughly that of the slowest search rather than the sum;
+    outbound requests are still paced by the shared search rate limiter.
+    
+    Args:
+        claims: Claim objects to search evidence for
+    
+    Returns:
+        One entry per claim, in input order: its ranked Evidence list, or the
+        exception raised while searching for it
+    """
+    return list(await asyncio.gather(
+        *(searchEvidenceAsync(claim) for claim in claims),
+        return_exceptions=True
+    ))
+
+
+def searchEvidenceBatch(claims: List[Any]) -> List[Any]:
+    """
+    Search evidence for several claims concurrently from synchronous code.
+    
+    Runs searchEvidenceBatchAsync in a new event loop. When called while an
+    event loop is already running in this thread (a Jupyter cell, an async
+    server handler), a new loop cannot be started, so the claims are searched
+    on worker threads with searchEvidenceMany instead. From async code prefer
+    awaiting searchEvidenceBatchAsync directly.
+    
+    Args:
+        claims: Claim objects to search evidence for
+    
+    Returns:
+        One entry per claim, in input order: its ranked Evidence list, or the
+        exception raised while searching for it
+    """
+    if not claims:
+        return []
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(searchEvidenceBatchAsync(claims))
+    return searchEvidenceMany(claims)
+
+
+def _searchEvidenceOrError(claim) -> Any:
+    """Run searchEvidence, returning the exception instead of raising it."""
+    try:
+        return searchEvidence(claim)
+    except Exception as e:
+        return e
+
+
+def searchEvidenceMany(claims: List[Any], max_workers: int = 16) -> List[Any]:
+    """
+    Search evidence for several claims in parallel worker threads.
+    
+    Thread-based alternative to searchEvidenceBatch for callers that cannot
+    start an event loop (for example, code already running inside one).
+    Workers share the pooled search session and rate limiters, and one
+    claim's failure (including RateLimitError) does not affect the others.
+    
+    Args:
+        claims: Claim objects to search evidence for
+        max_workers: Maximum number of concurrent searches
+    
+    Returns:
+        One entry per claim, in input order: its ranked Evidence list, or the
+        exception raised while searching for it
+    """
+    if not claims:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(claims))) as executor:
+        return list(executor.map(_searchEvidenceOrError, claims))
+
+
 __all__ = [
     'callSearchAPI',
+    'callSearchAPIAsync',
+    'clearSearchCache',
     'extractDomain',
     'optimizeQueryForSearch',
     'calculateRelevance',
+    'calculateRelevanceBatch',
+    'calculateRelevancePrepared',
+    'prepareClaim',
+    'PreparedClaim',
     'filterTrustedSources',
     'searchEvidence',
+    'searchEvidenceAsync',
+    'searchEvidenceBatch',
+    'searchEvidenceBatchAsync',
+    'searchEvidenceMany',
+    'iterEvidence',
     'SearchResult',
+    'MockSearchResult',
     'SearchAPIError',
     'RateLimitError'
 ]
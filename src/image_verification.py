@@ -8,27 +8,122 @@ Handles verification of images including:
 - Metadata analysis
 """
 
-import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel
+import asyncio
 import hashlib
+import io
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, Union
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict
 
 logger = logging.getLogger(__name__)
 
+# Perceptual hash (pHash): DCT of a PHASH_IMAGE_SIZE square grayscale image,
+# keeping the top-left PHASH_HASH_SIZE square of low frequencies (64 bits)
+PHASH_IMAGE_SIZE = 32
+PHASH_HASH_SIZE = 8
+
+# Difference hash (dHash): signs of horizontal gradients in a 9x8 grayscale
+# thumbnail (64 bits); a cheap pre-filter before the pHash comparison, with
+# a looser threshold since dHash is less robust
+DHASH_HASH_SIZE = 8
+DHASH_PREFILTER_MAX_DISTANCE = 10
+
+# Hashes at most this many bits apart are treated as the same picture
+SIMILAR_HASH_MAX_DISTANCE = 5
+
+# EXIF tag IDs read by extractMetadata
+_EXIF_IFD = 0x8769
+_EXIF_DATETIME = 306
+_EXIF_MODEL = 272
+_EXIF_SOFTWARE = 305
+_EXIF_DATETIME_ORIGINAL = 36867
+
+# Error Level Analysis: JPEG inputs are resaved at ELA_JPEG_QUALITY and the
+# per-pixel difference is averaged over ELA_BLOCK_SIZE square blocks. Blocks
+# more than ELA_ANOMALY_SIGMA robust standard deviations (scaled MAD) above
+# the median are anomalous; the image is flagged when they make up at least
+# ELA_MANIPULATED_BLOCK_FRACTION of all blocks.
+ELA_JPEG_QUALITY = 90
+ELA_BLOCK_SIZE = 8
+ELA_ANOMALY_SIGMA = 3.0
+ELA_MANIPULATED_BLOCK_FRACTION = 0.05
+# Floors on the anomaly threshold. Screenshots are mostly flat background
+# with zero residual, so the median and MAD are both 0 and every text block
+# would otherwise count; residuals are summed over RGB and averaged per block
+ELA_MIN_SPREAD = 2.0
+ELA_MIN_ANOMALOUS_RESIDUAL = 10.0
+
+# Worker threads for running the CPU-bound image analyses while the reverse
+# image search waits on the network
+_IMAGE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-verify")
+
+# Reverse image search results cached by image URL; concurrent lookups of
+# the same URL share one provider request
+REVERSE_SEARCH_CACHE_MAX_ENTRIES = 4096
+REVERSE_SEARCH_CACHE_TTL_SECONDS = 3600
+
+# EasyOCR text reader, loaded on first OCR call
+OCR_LANGUAGES = ['en']
+_ocr_reader_cache = None
+_ocr_reader_load_failed: bool = False
 
-class ImageMatch(BaseModel):
-    """Represents a match from reverse image search"""
+# libjpeg-turbo bindings (PyTurboJPEG) for JPEG decode and ELA resave,
+# loaded on first use; Pillow is used when they are not installed
+_turbojpeg_cache = None
+_turbojpeg_load_failed: bool = False
+
+# Verification results cached by content digest, so re-checking a viral
+# image skips the pipeline; near-duplicates (by pHash) skip the reverse search
+IMAGE_RESULT_CACHE_MAX_ENTRIES = 10000
+IMAGE_RESULT_CACHE_TTL_SECONDS = 3600
+
+# Content digests feed SHA-256 this many bytes per update; hashlib releases
+# the GIL for each one, so other pipeline threads run in between
+CONTENT_DIGEST_CHUNK_SIZE = 1 << 20
+
+
+# Results are built by the pipeline and never modified afterwards: freeze
+# them and reject unknown fields. verifyImage assembles them from already
+# validated parts with model_construct, which skips re-validation.
+_RESULT_MODEL_CONFIG = ConfigDict(frozen=True, extra='forbid')
+
+
+@dataclass(slots=True, frozen=True)
+class ImageMatch:
+    """
+    Represents a match from reverse image search
+    
+    A plain slotted dataclass rather than a pydantic model: reverse search can
+    return hundreds per image, all built by this module from provider
+    responses. ImageVerificationResult still serializes them as JSON objects.
+    """
     sourceURL: str
     sourceDomain: str
     title: str
-    publishDate: Optional[str] = None
     similarityScore: float  # 0-1
+    publishDate: Optional[int] = None  # Unix epoch milliseconds (UTC)
     thumbnail: Optional[str] = None
 
+    @property
+    def publishedISO(self) -> Optional[str]:
+        """publishDate as an ISO 8601 UTC timestamp"""
+        if self.publishDate is None:
+            return None
+        return datetime.fromtimestamp(self.publishDate / 1000, tz=timezone.utc).isoformat()
+
 
 class ManipulationReport(BaseModel):
     """Report on image manipulation detection"""
+    model_config = _RESULT_MODEL_CONFIG
+
     isManipulated: bool
     confidence: float  # 0-100
     manipulationType: str  # NONE, EDITED, DEEPFAKE, OUT_OF_CONTEXT, AI_GENERATED
@@ -39,6 +134,8 @@ class ManipulationReport(BaseModel):
 
 class ImageMetadata(BaseModel):
     """Image metadata from EXIF and other sources"""
+    model_config = _RESULT_MODEL_CONFIG
+
     width: int
     height: int
     format: str
@@ -51,6 +148,8 @@ class ImageMetadata(BaseModel):
 
 class ImageVerificationResult(BaseModel):
     """Complete image verification result"""
+    model_config = _RESULT_MODEL_CONFIG
+
     imageHash: str
     matches: List[ImageMatch]
     originalSource: Optional[str] = None
@@ -63,68 +162,556 @@ class ImageVerificationResult(BaseModel):
     explanation: str
 
 
-def calculateImageHash(imageData: bytes) -> str:
+def _loadTurboJPEG():
+    """
+    Load and cache the libjpeg-turbo decoder/encoder.
+    
+    Returns:
+        A turbojpeg.TurboJPEG instance, or None if PyTurboJPEG or the
+        libjpeg-turbo shared library is unavailable (the failure is remembered).
+    """
+    global _turbojpeg_cache, _turbojpeg_load_failed
+    
+    if _turbojpeg_cache is not None:
+        return _turbojpeg_cache
+    
+    if _turbojpeg_load_failed:
+        return None
+    
+    try:
+        # Import here to avoid import errors if not installed
+        from turbojpeg import TurboJPEG
+        
+        _turbojpeg_cache = TurboJPEG()
+        return _turbojpeg_cache
+        
+    except Exception as e:
+        logger.info(f"libjpeg-turbo unavailable, decoding JPEG with Pillow: {e}")
+        _turbojpeg_load_failed = True
+        return None
+
+
+class _DecodedImage:
+    """
+    Raw image bytes decoded at most once and shared by every analysis.
+
+    verifyImage wraps the input once and hands the same object to hashing,
+    manipulation detection, OCR and metadata extraction, so the file is parsed
+    and decompressed once and the RGB and grayscale pixel arrays are built
+    only by the first stage that needs them. JPEG pixels are decoded with
+    libjpeg-turbo when it is available; Pillow then only parses the headers
+    (format and EXIF).
+    """
+
+    __slots__ = ('data', 'fileSize', '_image', '_rgb', '_gray', '_lock')
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.fileSize = len(data)
+        self._image = None
+        self._rgb = None
+        self._gray = None
+        self._lock = threading.RLock()
+
+    def isJPEG(self) -> bool:
+        """Whether the bytes start with the JPEG SOI marker."""
+        return self.data[:3] == b"\xff\xd8\xff"
+
+    def image(self):
+        """
+        PIL image (requires Pillow); `format` and EXIF are preserved.
+
+        When libjpeg-turbo will decode the pixels, only the headers are parsed
+        here; otherwise the pixels are loaded now, while holding the lock.
+        """
+        with self._lock:
+            if self._image is None:
+                # Import here so the module loads without image dependencies
+                from PIL import Image
+
+                image = Image.open(io.BytesIO(self.data))
+                if not (self.isJPEG() and _loadTurboJPEG() is not None):
+                    image.load()
+                self._image = image
+            return self._image
+
+    def _turboDecode(self, gray: bool):
+        """Decode a JPEG with libjpeg-turbo, or return None to fall back to Pillow."""
+        turbo = _loadTurboJPEG() if self.isJPEG() else None
+        if turbo is None:
+            return None
+        try:
+            from turbojpeg import TJPF_GRAY, TJPF_RGB
+
+            pixels = turbo.decode(self.data, pixel_format=TJPF_GRAY if gray else TJPF_RGB)
+        except Exception as e:
+            # e.g. CMYK or progressive variants libjpeg-turbo rejects
+            logger.debug(f"libjpeg-turbo decode failed, using Pillow: {e}")
+            return None
+        pixels = pixels[:, :, 0] if gray and pixels.ndim == 3 else pixels
+        pixels.flags.writeable = False
+        return pixels
+
+    def rgb(self):
+        """Pixels as a read-only uint8 NumPy array of shape (height, width, 3)."""
+        with self._lock:
+            if self._rgb is None:
+                import numpy as np
+
+                pixels = self._turboDecode(gray=False)
+                self._rgb = pixels if pixels is not None else np.asarray(self.image().convert("RGB"))
+            return self._rgb
+
+    def gray(self):
+        """Luminance as a read-only uint8 NumPy array of shape (height, width)."""
+        with self._lock:
+            if self._gray is None:
+                import numpy as np
+
+                pixels = self._turboDecode(gray=True)
+                self._gray = pixels if pixels is not None else np.asarray(self.image().convert("L"))
+            return self._gray
+
+    def release(self) -> None:
+        """
+        Drop the bytes, the PIL image and the pixel arrays once every stage
+        is done, so a large image is freed even while a traceback or a
+        pending future still references this object.
+        """
+        with self._lock:
+            if self._image is not None:
+                self._image.close()
+            self.data = b""
+            self._image = self._rgb = self._gray = None
+
+
+ImageInput = Union[bytes, _DecodedImage]
+
+
+def _asDecodedImage(imageData: ImageInput) -> _DecodedImage:
+    """Wrap raw bytes for shared decoding; pass through already wrapped input."""
+    return imageData if isinstance(imageData, _DecodedImage) else _DecodedImage(imageData)
+
+
+@lru_cache(maxsize=None)
+def _dctMatrix(size: int):
+    """
+    Orthonormal DCT-II matrix for `size`-point transforms, built once.
+
+    A 2-D DCT of an image X is then D @ X @ D.T, two small float32 matrix
+    products, with no SciPy dependency.
+    """
+    import numpy as np
+
+    n = np.arange(size, dtype=np.float32)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    matrix *= np.sqrt(2.0 / size)
+    matrix[0] /= np.sqrt(2.0)
+    return matrix.astype(np.float32)
+
+
+def calculateImageHash(imageData: ImageInput) -> str:
     """
     Calculate perceptual hash of image for similarity matching
     
+    Computes a 64-bit pHash: the image is converted to grayscale, resized to
+    32x32, transformed with a 2-D DCT, and each of the 8x8 lowest-frequency
+    coefficients becomes one bit (above or below their median). Visually
+    similar images get hashes that differ in few bits.
+    
     Args:
-        imageData: Raw image bytes
+        imageData: Raw image bytes, or an image already decoded by verifyImage
         
     Returns:
-        Hash string
+        Hash as 16 hex characters, or "" if the image cannot be decoded
+        
+    Note:
+        Requires Pillow and NumPy
     """
     try:
-        # Use SHA256 for now (can be replaced with perceptual hash)
-        return hashlib.sha256(imageData).hexdigest()
+        return _pHashBits(_pHashPixels(_asDecodedImage(imageData))).tobytes().hex()
     except Exception as e:
         logger.error(f"Error calculating image hash: {str(e)}")
         return ""
 
 
-def reverseImageSearch(imageURL: str) -> List[ImageMatch]:
+def _pHashPixels(decoded: _DecodedImage):
+    """Grayscale image resized to PHASH_IMAGE_SIZE square, as float32."""
+    # Import here so the module loads without image dependencies
+    import numpy as np
+    from PIL import Image
+
+    gray = Image.fromarray(decoded.gray())
+    small = gray.resize((PHASH_IMAGE_SIZE, PHASH_IMAGE_SIZE), Image.LANCZOS)
+    return np.asarray(small, dtype=np.float32)
+
+
+def _pHashBits(pixels):
     """
-    Perform reverse image search to find original source
+    pHash bits packed to bytes for one (size, size) image or a stacked
+    (N, size, size) batch, whose DCTs then run as one batched matmul.
+    """
+    import numpy as np
+
+    dct = _dctMatrix(PHASH_IMAGE_SIZE)
+    lowFrequencies = (dct @ pixels @ dct.T)[..., :PHASH_HASH_SIZE, :PHASH_HASH_SIZE]
+    lowFrequencies = lowFrequencies.reshape(*pixels.shape[:-2], PHASH_HASH_SIZE * PHASH_HASH_SIZE)
+    bits = lowFrequencies > np.median(lowFrequencies, axis=-1, keepdims=True)
+    return np.packbits(bits, axis=-1)
+
+
+def _calculateImageHashes(decodedImages: List[Optional[_DecodedImage]]) -> List[str]:
+    """
+    calculateImageHash for many images, with one batched DCT over all of them
+    
+    Returns:
+        One hash per image, "" for missing or undecodable images
+    """
+    import numpy as np
+
+    hashes = [""] * len(decodedImages)
+    indices, stack = [], []
+    for index, decoded in enumerate(decodedImages):
+        if decoded is None:
+            continue
+        try:
+            stack.append(_pHashPixels(decoded))
+            indices.append(index)
+        except Exception as e:
+            logger.error(f"Error calculating image hash: {str(e)}")
+    
+    if stack:
+        for index, packed in zip(indices, _pHashBits(np.stack(stack))):
+            hashes[index] = packed.tobytes().hex()
+    return hashes
+
+
+def calculateDifferenceHash(imageData: ImageInput) -> str:
+    """
+    Calculate difference hash (dHash) of image as a cheap first-pass filter
+    
+    The grayscale image is box-filtered down to 9x8 and each bit records
+    whether a pixel is brighter than its left neighbour. No DCT is needed,
+    so comparing candidates by dHash first and only confirming those within
+    DHASH_PREFILTER_MAX_DISTANCE bits with calculateImageHash skips most of
+    the pHash work.
     
     Args:
-        imageURL: URL of the image to search
+        imageData: Raw image bytes, or an image already decoded by verifyImage
         
     Returns:
-        List of matching images with metadata
+        Hash as 16 hex characters, or "" if the image cannot be decoded
+        
+    Note:
+        Requires Pillow and NumPy
+    """
+    try:
+        # Import here so the module loads without image dependencies
+        import numpy as np
+        from PIL import Image
+
+        gray = Image.fromarray(_asDecodedImage(imageData).gray())
+        pixels = np.asarray(gray.resize((DHASH_HASH_SIZE + 1, DHASH_HASH_SIZE), Image.BOX))
+        return np.packbits(pixels[:, 1:] > pixels[:, :-1]).tobytes().hex()
+    except Exception as e:
+        logger.error(f"Error calculating difference hash: {str(e)}")
+        return ""
+
+
+def contentDigest(imageData: bytes) -> str:
+    """
+    SHA-256 of the raw image bytes, identifying an exact copy of an image
+    
+    The bytes are fed to hashlib through a memoryview in
+    CONTENT_DIGEST_CHUNK_SIZE slices, so no slice copies the buffer.
+    
+    Args:
+        imageData: Raw image bytes
         
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with memoryview(imageData) as view:
+        for start in range(0, len(view), CONTENT_DIGEST_CHUNK_SIZE):
+            digest.update(view[start:start + CONTENT_DIGEST_CHUNK_SIZE])
+    return digest.hexdigest()
+
+
+def imageHashToInt(imageHash: str) -> Optional[int]:
+    """
+    Convert a hex image hash to an integer for fast comparisons
+    
+    Args:
+        imageHash: Hash returned by calculateImageHash
+        
+    Returns:
+        Hash as an unsigned integer, or None for an empty or invalid hash
+    """
+    try:
+        return int(imageHash, 16)
+    except (TypeError, ValueError):
+        return None
+
+
+def hammingDistance(hashA: int, hashB: int) -> int:
+    """
+    Number of differing bits between two integer image hashes
+    
+    One XOR and a popcount (int.bit_count), instead of comparing hex strings
+    character by character.
+    """
+    return (hashA ^ hashB).bit_count()
+
+
+def hammingDistances(queryHash: int, candidateHashes):
+    """
+    Hamming distances from one image hash to many, vectorized
+    
+    Args:
+        queryHash: Integer hash to compare against
+        candidateHashes: uint64 NumPy array (or sequence of integer hashes)
+        
+    Returns:
+        NumPy array with the distance to each candidate
+    """
+    import numpy as np
+
+    candidates = np.asarray(candidateHashes, dtype=np.uint64)
+    differing = np.bitwise_xor(candidates, np.uint64(queryHash))
+    return np.unpackbits(differing.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+
+_REVERSE_SEARCH_CACHE: "OrderedDict[str, Tuple[float, Tuple[ImageMatch, ...]]]" = OrderedDict()
+_INFLIGHT_REVERSE_SEARCHES: "Dict[str, Future]" = {}
+_REVERSE_SEARCH_LOCK = threading.Lock()
+
+
+def clearReverseSearchCache() -> None:
+    """Drop all cached reverse image search results."""
+    with _REVERSE_SEARCH_LOCK:
+        _REVERSE_SEARCH_CACHE.clear()
+
+
+def _toEpochMillis(date: Optional[str]) -> Optional[int]:
+    """
+    Parse an ISO 8601 date from a reverse search response into Unix epoch
+    milliseconds (naive dates are taken as UTC), or None if it is missing or
+    unparseable. Dates are parsed once here so matches compare as integers.
+    """
+    if not date:
+        return None
+    try:
+        parsed = datetime.fromisoformat(date.strip().replace("Z", "+00:00"))
+    except ValueError:
+        logger.debug(f"Unparseable reverse search date: {date}")
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+def _queryReverseImageSearch(imageURL: str) -> List[ImageMatch]:
+    """
+    Query the reverse image search providers for an image URL
+    
+    Raises on provider errors, so failed lookups are not cached.
+    
     Note:
         This is a placeholder. In production, integrate with:
         - Google Custom Search API
         - TinEye API
         - Bing Visual Search API
     """
-    logger.info(f"Performing reverse image search for: {imageURL}")
+    # TODO: Implement actual reverse search
+    # Example with Google Custom Search API:
+    # results = google_custom_search(imageURL)
+    # return [ImageMatch(..., publishDate=_toEpochMillis(result.date)) for result in results]
+    
+    # For now, return empty list
+    logger.warning("Reverse image search not yet implemented - returning empty results")
+    return []
+
+
+def reverseImageSearch(imageURL: str) -> List[ImageMatch]:
+    """
+    Perform reverse image search to find original source
     
-    # Placeholder implementation
-    # In production, call actual reverse search APIs
-    matches = []
+    Matches are cached per URL for REVERSE_SEARCH_CACHE_TTL_SECONDS, and
+    concurrent calls for the same URL (a viral image checked by many users
+    at once) wait for a single provider request instead of each sending one.
     
-    try:
-        # TODO: Implement actual reverse search
-        # Example with Google Custom Search API:
-        # results = google_custom_search(imageURL)
-        # for result in results:
-        #     matches.append(ImageMatch(...))
+    Args:
+        imageURL: URL of the image to search
         
-        # For now, return empty list
-        logger.warning("Reverse image search not yet implemented - returning empty results")
+    Returns:
+        List of matching images with metadata
+    """
+    logger.info(f"Performing reverse image search for: {imageURL}")
+    key = imageURL.strip()
+    
+    with _REVERSE_SEARCH_LOCK:
+        entry = _REVERSE_SEARCH_CACHE.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[0] <= REVERSE_SEARCH_CACHE_TTL_SECONDS:
+                _REVERSE_SEARCH_CACHE.move_to_end(key)
+                return list(entry[1])
+            del _REVERSE_SEARCH_CACHE[key]
         
+        pending = _INFLIGHT_REVERSE_SEARCHES.get(key)
+        if pending is None:
+            future: Future = Future()
+            _INFLIGHT_REVERSE_SEARCHES[key] = future
+    
+    # Another thread is already searching this URL: share its result
+    if pending is not None:
+        return list(pending.result())
+    
+    matches: List[ImageMatch] = []
+    try:
+        matches = _queryReverseImageSearch(imageURL)
+        with _REVERSE_SEARCH_LOCK:
+            _REVERSE_SEARCH_CACHE[key] = (time.monotonic(), tuple(matches))
+            _REVERSE_SEARCH_CACHE.move_to_end(key)
+            if len(_REVERSE_SEARCH_CACHE) > REVERSE_SEARCH_CACHE_MAX_ENTRIES:
+                _REVERSE_SEARCH_CACHE.popitem(last=False)
     except Exception as e:
         logger.error(f"Error in reverse image search: {str(e)}")
+    finally:
+        with _REVERSE_SEARCH_LOCK:
+            del _INFLIGHT_REVERSE_SEARCHES[key]
+        future.set_result(tuple(matches))
     
-    return matches
+    return list(matches)
+
 
+class _ImageResultCache:
+    """
+    LRU cache of verification results keyed by SHA-256 of the image bytes, with TTL expiry.
 
-def detectManipulation(imageData: bytes) -> ManipulationReport:
+    `get` returns the result stored for exactly the same bytes; any edit,
+    however small, or changed EXIF gets a fresh verification. Each entry also
+    records the image's 64-bit perceptual hash, and `nearestMatches` returns
+    the reverse-search matches of the closest cached pHash within
+    SIMILAR_HASH_MAX_DISTANCE bits, since a re-encoded or resized copy of an
+    image has the same sources as the original.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Optional[int], ImageVerificationResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop entries older than the TTL (oldest first, in insertion order)."""
+        while self._entries:
+            key, (stored_at, _, _) = next(iter(self._entries.items()))
+            if now - stored_at <= self.ttl_seconds:
+                break
+            del self._entries[key]
+
+    def get(self, digest: str) -> Optional[ImageVerificationResult]:
+        """Copy of the result cached for these exact image bytes, or None on a miss."""
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            self._entries.move_to_end(digest)
+            return entry[2].model_copy(deep=True)
+
+    def nearestMatches(self, imageHash: int) -> Optional[List[ImageMatch]]:
+        """Reverse-search matches of the closest cached near-duplicate, or None."""
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            hashed = [(entry[1], entry[2]) for entry in self._entries.values() if entry[1] is not None]
+            if not hashed:
+                return None
+            distances = hammingDistances(imageHash, [cachedHash for cachedHash, _ in hashed])
+            best = int(distances.argmin())
+            if distances[best] > SIMILAR_HASH_MAX_DISTANCE:
+                return None
+            # Matches are immutable, so they can be shared
+            return list(hashed[best][1].matches)
+
+    def put(self, digest: str, imageHash: Optional[int], result: ImageVerificationResult) -> None:
+        """Store a result under its content digest, evicting the least recently used entries."""
+        with self._lock:
+            self._entries.pop(digest, None)
+            self._entries[digest] = (time.monotonic(), imageHash, result.model_copy(deep=True))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+_image_result_cache = _ImageResultCache(
+    IMAGE_RESULT_CACHE_MAX_ENTRIES, IMAGE_RESULT_CACHE_TTL_SECONDS
+)
+
+def _errorLevelAnalysis(decoded: _DecodedImage):
+    """
+    Run Error Level Analysis on a decoded image
+    
+    Regions pasted or edited after the last JPEG save recompress differently
+    from the rest of the picture. The image is resaved at ELA_JPEG_QUALITY,
+    the absolute per-pixel difference is summed over the RGB channels, and
+    the residual is averaged per ELA_BLOCK_SIZE block. All of this runs as
+    whole-array NumPy operations; there is no per-pixel Python loop.
+    
+    Returns:
+        (anomalous blocks as an (N, 2) array of block row/column indices,
+        total number of blocks)
+    """
+    import numpy as np
+
+    rgb = decoded.rgb()
+    turbo = _loadTurboJPEG()
+    if turbo is not None:
+        from turbojpeg import TJPF_RGB
+
+        resavedBytes = turbo.encode(rgb, quality=ELA_JPEG_QUALITY, pixel_format=TJPF_RGB)
+        resaved = turbo.decode(resavedBytes, pixel_format=TJPF_RGB)
+    else:
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.fromarray(rgb).save(buffer, "JPEG", quality=ELA_JPEG_QUALITY)
+        buffer.seek(0)
+        with Image.open(buffer) as resavedImage:
+            resaved = np.asarray(resavedImage.convert("RGB"))
+    # Widen while subtracting rather than copying both images to int16 first
+    residual = np.abs(np.subtract(rgb, resaved, dtype=np.int16)).sum(axis=2, dtype=np.uint16)
+
+    # Block means via a reshape of the cropped residual (a view, no copy)
+    size = ELA_BLOCK_SIZE
+    rows, cols = residual.shape[0] // size, residual.shape[1] // size
+    if rows == 0 or cols == 0:
+        return np.empty((0, 2), dtype=np.intp), 0
+    blocks = residual[:rows * size, :cols * size].reshape(rows, size, cols, size)
+    blockMeans = blocks.mean(axis=(1, 3), dtype=np.float32)
+
+    # Median and MAD rather than mean and standard deviation, so a large
+    # edited region does not inflate the threshold it is measured against
+    median = np.median(blockMeans)
+    spread = max(1.4826 * np.median(np.abs(blockMeans - median)), ELA_MIN_SPREAD)
+    threshold = max(median + ELA_ANOMALY_SIGMA * spread, ELA_MIN_ANOMALOUS_RESIDUAL)
+    return np.argwhere(blockMeans > threshold), blockMeans.size
+
+
+def detectManipulation(imageData: ImageInput) -> ManipulationReport:
     """
     Detect if image has been manipulated
     
     Args:
-        imageData: Raw image bytes
+        imageData: Raw image bytes, or an image already decoded by verifyImage
         
     Returns:
         Manipulation report with confidence score
@@ -139,17 +726,35 @@ def detectManipulation(imageData: bytes) -> ManipulationReport:
     logger.info("Analyzing image for manipulation")
     
     try:
-        # Placeholder implementation
-        # In production, implement actual detection algorithms
-        
         artifacts = []
         isManipulated = False
         confidence = 50.0
         manipulationType = "NONE"
         detectionMethod = "Basic analysis"
         
-        # TODO: Implement actual detection
-        # 1. Error Level Analysis
+        # 1. Error Level Analysis (JPEG only; other formats are not lossy)
+        decoded = _asDecodedImage(imageData)
+        if decoded.isJPEG():
+            detectionMethod = "Error Level Analysis"
+            anomalousBlocks, total = _errorLevelAnalysis(decoded)
+            anomalous = len(anomalousBlocks)
+            if total and anomalous / total >= ELA_MANIPULATED_BLOCK_FRACTION:
+                isManipulated = True
+                manipulationType = "EDITED"
+                confidence = min(95.0, 50.0 + 100.0 * anomalous / total)
+                artifacts.append(
+                    f"Inconsistent error levels in {anomalous} of {total} "
+                    f"{ELA_BLOCK_SIZE}x{ELA_BLOCK_SIZE} blocks"
+                )
+                # Locate the edit: pixel bounding box of the anomalous blocks
+                top, left = anomalousBlocks.min(axis=0)
+                bottom, right = anomalousBlocks.max(axis=0) + 1
+                artifacts.append(
+                    f"Error level anomalies within x={left * ELA_BLOCK_SIZE}-{right * ELA_BLOCK_SIZE}, "
+                    f"y={top * ELA_BLOCK_SIZE}-{bottom * ELA_BLOCK_SIZE}"
+                )
+        
+        # TODO: Implement further detection
         # 2. Check for cloning artifacts
         # 3. Analyze compression patterns
         # 4. Check metadata consistency
@@ -181,72 +786,105 @@ def detectManipulation(imageData: bytes) -> ManipulationReport:
         )
 
 
-def extractTextFromImage(imageData: bytes) -> Optional[str]:
+def loadOCRReader():
+    """
+    Load and cache the EasyOCR text reader.
+    
+    easyocr (and torch with it) is imported here rather than at module level so
+    importing this module stays cheap for processes that never run OCR. The
+    reader runs on the GPU when CUDA is available. If loading fails, the
+    failure is remembered and None is returned.
+    
+    Returns:
+        The loaded easyocr.Reader, or None if unavailable.
+    """
+    global _ocr_reader_cache, _ocr_reader_load_failed
+    
+    if _ocr_reader_cache is not None:
+        return _ocr_reader_cache
+    
+    if _ocr_reader_load_failed:
+        return None
+    
+    try:
+        # Import here to avoid import errors if not installed
+        import easyocr
+        import torch
+        
+        useGPU = torch.cuda.is_available()
+        logger.info(f"Loading EasyOCR reader for {OCR_LANGUAGES} (gpu={useGPU})")
+        _ocr_reader_cache = easyocr.Reader(OCR_LANGUAGES, gpu=useGPU)
+        return _ocr_reader_cache
+        
+    except Exception as e:
+        logger.warning(f"EasyOCR reader unavailable: {e}")
+        _ocr_reader_load_failed = True
+        return None
+
+
+def extractTextFromImage(imageData: ImageInput) -> Optional[str]:
     """
     Extract text from image using OCR
     
     Args:
-        imageData: Raw image bytes
+        imageData: Raw image bytes, or an image already decoded by verifyImage
         
     Returns:
         Extracted text or None
         
     Note:
-        Requires pytesseract and Tesseract OCR installed
+        Requires easyocr (and torch); uses the GPU when CUDA is available
     """
     logger.info("Extracting text from image using OCR")
     
     try:
-        # Placeholder implementation
-        # In production, use pytesseract or Google Vision API
-        
-        # TODO: Implement actual OCR
-        # from PIL import Image
-        # import pytesseract
-        # import io
-        # 
-        # image = Image.open(io.BytesIO(imageData))
-        # text = pytesseract.image_to_string(image)
-        # return text.strip()
-        
-        logger.warning("OCR not yet implemented - returning None")
-        return None
+        reader = loadOCRReader()
+        if reader is None:
+            logger.warning("OCR unavailable - returning None")
+            return None
+        
+        # Read straight from the shared decoded pixels, grouping lines into paragraphs
+        paragraphs = reader.readtext(_asDecodedImage(imageData).rgb(), detail=0, paragraph=True)
+        text = "\n".join(paragraphs).strip()
+        return text or None
         
     except Exception as e:
         logger.error(f"Error extracting text from image: {str(e)}")
         return None
 
 
-def extractMetadata(imageData: bytes) -> Optional[ImageMetadata]:
+def extractMetadata(imageData: ImageInput) -> Optional[ImageMetadata]:
     """
     Extract metadata from image (EXIF, etc.)
     
     Args:
-        imageData: Raw image bytes
+        imageData: Raw image bytes, or an image already decoded by verifyImage
         
     Returns:
         Image metadata or None
+        
+    Note:
+        Requires Pillow
     """
     logger.info("Extracting image metadata")
     
     try:
-        # Placeholder implementation
-        # In production, use PIL/Pillow to extract EXIF data
-        
-        # TODO: Implement actual metadata extraction
-        # from PIL import Image
-        # from PIL.ExifTags import TAGS
-        # import io
-        # 
-        # image = Image.open(io.BytesIO(imageData))
-        # exif = image.getexif()
-        # metadata = {}
-        # for tag_id, value in exif.items():
-        #     tag = TAGS.get(tag_id, tag_id)
-        #     metadata[tag] = value
-        
-        logger.warning("Metadata extraction not yet implemented - returning None")
-        return None
+        decoded = _asDecodedImage(imageData)
+        image = decoded.image()
+        exif = image.getexif()
+        
+        # DateTimeOriginal lives in the Exif sub-IFD; DateTime in the main IFD
+        creationDate = exif.get_ifd(_EXIF_IFD).get(_EXIF_DATETIME_ORIGINAL) or exif.get(_EXIF_DATETIME)
+        
+        return ImageMetadata(
+            width=image.width,
+            height=image.height,
+            format=image.format or "UNKNOWN",
+            fileSize=decoded.fileSize,
+            creationDate=str(creationDate) if creationDate else None,
+            cameraModel=exif.get(_EXIF_MODEL),
+            software=exif.get(_EXIF_SOFTWARE)
+        )
         
     except Exception as e:
         logger.error(f"Error extracting metadata: {str(e)}")
@@ -270,21 +908,65 @@ def verifyImage(imageURL: str, imageData: Optional[bytes] = None) -> ImageVerifi
     3. Detect manipulation
     4. Extract text (OCR)
     5. Extract metadata
+       (steps 3-5 run on worker threads concurrently with step 2)
     6. Determine verdict
+    
+    Results are cached: the same image bytes verified within the last
+    IMAGE_RESULT_CACHE_TTL_SECONDS return the earlier result, and a near
+    duplicate (by perceptual hash) reuses the earlier reverse image search
+    matches but is analysed afresh.
     """
     logger.info(f"Starting image verification for: {imageURL}")
     
+    # Decode once; every step below shares the decoded pixels. Only the
+    # wrapper references the bytes from here on, and it is released below
+    decoded = _DecodedImage(imageData) if imageData else None
+    del imageData
+    return _verifyDecoded(imageURL, decoded)
+
+
+def _verifyDecoded(
+    imageURL: str,
+    decoded: Optional[_DecodedImage],
+    imageHash: Optional[str] = None
+) -> ImageVerificationResult:
+    """
+    Run the verifyImage pipeline on an already wrapped image, releasing it
+    afterwards. `imageHash` skips step 1 when the hash was computed in a batch.
+    """
+    pending: List[Future] = []
     try:
+        # The same bytes were verified recently: reuse that result without
+        # decoding them. pHash ignores small local edits and EXIF, so it only
+        # keys match reuse below
+        digest = contentDigest(decoded.data) if decoded else None
+        if digest is not None:
+            cached = _image_result_cache.get(digest)
+            if cached is not None:
+                logger.info(f"Image verification cache hit for digest {digest}")
+                return cached
+        
         # Step 1: Calculate hash
-        imageHash = ""
-        if imageData:
-            imageHash = calculateImageHash(imageData)
+        if imageHash is None:
+            imageHash = calculateImageHash(decoded) if decoded else ""
+        hashKey = imageHashToInt(imageHash)
+        
+        # Steps 3-5 only need the pixels: run them on worker threads while
+        # the reverse image search waits on the network on this one
+        manipulationFuture = textFuture = metadataFuture = None
+        if decoded:
+            manipulationFuture = _IMAGE_POOL.submit(detectManipulation, decoded)
+            textFuture = _IMAGE_POOL.submit(extractTextFromImage, decoded)
+            metadataFuture = _IMAGE_POOL.submit(extractMetadata, decoded)
+            pending = [manipulationFuture, textFuture, metadataFuture]
         
-        # Step 2: Reverse image search
-        matches = reverseImageSearch(imageURL)
+        # Step 2: Reverse image search (a near-duplicate shares its sources)
+        matches = _image_result_cache.nearestMatches(hashKey) if hashKey is not None else None
+        if matches is None:
+            matches = reverseImageSearch(imageURL)
         
         # Step 3: Detect manipulation
-        manipulationReport = ManipulationReport(
+        manipulationReport = ManipulationReport.model_construct(
             isManipulated=False,
             confidence=50.0,
             manipulationType="NONE",
@@ -293,18 +975,23 @@ def verifyImage(imageURL: str, imageData: Optional[bytes] = None) -> ImageVerifi
             explanation="Image verification module is in development. Full analysis coming soon."
         )
         
-        if imageData:
-            manipulationReport = detectManipulation(imageData)
+        if manipulationFuture:
+            manipulationReport = manipulationFuture.result()
         
         # Step 4: Extract text
-        extractedText = None
-        if imageData:
-            extractedText = extractTextFromImage(imageData)
+        extractedText = textFuture.result() if textFuture else None
         
         # Step 5: Extract metadata
-        metadata = None
-        if imageData:
-            metadata = extractMetadata(imageData)
+        metadata = metadataFuture.result() if metadataFuture else None
+        
+        # The earliest dated match is the likely original; undated matches last
+        earliest = min(
+            matches,
+            key=lambda match: match.publishDate if match.publishDate is not None else sys.maxsize,
+            default=None
+        )
+        originalSource = earliest.sourceURL if earliest else None
+        firstSeen = earliest.publishedISO if earliest else None
         
         # Step 6: Determine verdict
         verdict = "UNVERIFIED"
@@ -315,21 +1002,15 @@ def verifyImage(imageURL: str, imageData: Optional[bytes] = None) -> ImageVerifi
             verdict = "MANIPULATED"
             confidence = manipulationReport.confidence
             explanation += f"Manipulation detected: {manipulationReport.explanation}"
-        elif len(matches) > 0:
+        elif earliest:
             # Found original source
-            originalSource = matches[0].sourceURL
-            firstSeen = matches[0].publishDate
             verdict = "AUTHENTIC"
             confidence = 70.0
             explanation += f"Original source found: {originalSource}"
         else:
             explanation += "No manipulation detected, but original source not found. Further verification recommended."
         
-        # Determine original source and first seen date
-        originalSource = matches[0].sourceURL if matches else None
-        firstSeen = matches[0].publishDate if matches else None
-        
-        return ImageVerificationResult(
+        result = ImageVerificationResult.model_construct(
             imageHash=imageHash,
             matches=matches,
             originalSource=originalSource,
@@ -342,16 +1023,21 @@ def verifyImage(imageURL: str, imageData: Optional[bytes] = None) -> ImageVerifi
             explanation=explanation
         )
         
+        if digest is not None:
+            _image_result_cache.put(digest, hashKey, result)
+        
+        return result
+        
     except Exception as e:
         logger.error(f"Error verifying image: {str(e)}", exc_info=True)
         
         # Return error result
-        return ImageVerificationResult(
+        return ImageVerificationResult.model_construct(
             imageHash="",
             matches=[],
             originalSource=None,
             firstSeen=None,
-            manipulationReport=ManipulationReport(
+            manipulationReport=ManipulationReport.model_construct(
                 isManipulated=False,
                 confidence=0.0,
                 manipulationType="UNKNOWN",
@@ -365,6 +1051,87 @@ def verifyImage(imageURL: str, imageData: Optional[bytes] = None) -> ImageVerifi
             confidence=0.0,
             explanation=f"Error during image verification: {str(e)}"
         )
+    
+    finally:
+        # A failed step leaves the others running on the pool: they must not
+        # read the pixels after release, so cancel or wait for each of them
+        for future in pending:
+            future.cancel()
+        wait(pending)
+        if decoded is not None:
+            decoded.release()
+
+
+def verifyImages(
+    items: List[Tuple[str, Optional[bytes]]],
+    max_workers: int = 4
+) -> List[ImageVerificationResult]:
+    """
+    Verify several images, e.g. all images from one article
+    
+    Perceptual hashes for the whole batch are computed with a single batched
+    DCT, then the remaining pipeline runs for up to `max_workers` images at a
+    time. One image's failure does not affect the others.
+    
+    Args:
+        items: (image URL, optional raw image bytes) pairs
+        max_workers: Maximum number of images verified concurrently
+        
+    Returns:
+        One verification result per item, in input order
+    """
+    if not items:
+        return []
+    logger.info(f"Starting batch image verification for {len(items)} images")
+    
+    decodedImages = [_DecodedImage(imageData) if imageData else None for _, imageData in items]
+    imageURLs = [imageURL for imageURL, _ in items]
+    del items
+    
+    try:
+        hashes = _calculateImageHashes(decodedImages)
+    except Exception as e:
+        # e.g. NumPy missing: let each image hash itself (and fail) as verifyImage would
+        logger.error(f"Error calculating image hashes: {str(e)}")
+        hashes = [None] * len(decodedImages)
+    
+    # A separate executor: the pipeline itself submits work to _IMAGE_POOL
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(imageURLs))) as executor:
+        return list(executor.map(_verifyDecoded, imageURLs, decodedImages, hashes))
+
+
+def resultToJSON(result: ImageVerificationResult) -> bytes:
+    """
+    Serialize a verification result to UTF-8 JSON bytes
+    
+    Uses pydantic-core's serializer directly, which writes the nested models
+    to bytes in one pass without building intermediate dicts (faster than
+    orjson.dumps(result.model_dump(mode='json')) for this model).
+    
+    Args:
+        result: Verification result
+        
+    Returns:
+        JSON body ready to send
+    """
+    return result.__pydantic_serializer__.to_json(result)
+
+
+async def verifyImageAsync(imageURL: str, imageData: Optional[bytes] = None) -> ImageVerificationResult:
+    """
+    Verify an image without blocking the event loop
+    
+    Runs verifyImage on a worker thread, so a server can await many
+    verifications at once while each overlaps its own network and CPU work.
+    
+    Args:
+        imageURL: URL of the image
+        imageData: Optional raw image bytes
+        
+    Returns:
+        Complete verification result
+    """
+    return await asyncio.to_thread(verifyImage, imageURL, imageData)
 
 
 # Example usage
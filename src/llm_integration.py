@@ -8,6 +8,7 @@ exponential backoff retry logic and fallback to rule-based extraction.
 Requirements: 2.1, 11.1, 11.2, 16.1
 """
 
+import heapq
 import time
 import re
 from typing import List, Optional, Tuple
@@ -569,13 +570,11 @@ def extractClaims(articleText: str, language: Optional[Language] = None) -> List
             logger.warning(f"Failed to create Claim object: {e}")
             continue
     
-    # Step 4: Sort by importance (descending)
-    claims.sort(key=lambda c: c.importance, reverse=True)
-    
-    # Step 5: Limit to MAX_CLAIMS_PER_ARTICLE
+    # Steps 4-5: Keep the MAX_CLAIMS_PER_ARTICLE most important claims, in
+    # descending order, with a bounded heap instead of a full sort
     if len(claims) > settings.MAX_CLAIMS_PER_ARTICLE:
         logger.info(f"Limiting claims from {len(claims)} to {settings.MAX_CLAIMS_PER_ARTICLE}")
-        claims = claims[:settings.MAX_CLAIMS_PER_ARTICLE]
+    claims = heapq.nlargest(settings.MAX_CLAIMS_PER_ARTICLE, claims, key=lambda c: c.importance)
     
     # Validation
     if len(articleText) > 100 and len(claims) == 0:
@@ -86,6 +86,7 @@ class Evidence(BaseModel):
     publishDate: Optional[datetime] = Field(default=None, description="Publication date of the evidence")
     credibilityScore: float = Field(..., ge=0.0, le=1.0, description="Credibility score of the source")
     relevanceScore: float = Field(..., ge=0.0, le=1.0, description="Relevance score to the claim")
+    combinedScore: float = Field(default=0.0, ge=0.0, le=1.0, description="Ranking score (70% relevance + 30% credibility)")
 
     @field_validator('sourceURL', 'sourceDomain', 'snippet')
     @classmethod
@@ -0,0 +1,192 @@
+"""
+Client-side rate limiting for outbound API calls.
+
+This module provides a token bucket used to throttle requests before they are
+sent, so concurrent fan-out stays under provider quotas instead of triggering
+429 responses, and a jittered exponential backoff for when a 429 still occurs.
+The bucket can also adapt its rate to observed throttling (AIMD): it halves on
+each 429 and recovers gradually after a run of successful requests. A circuit
+breaker lets callers fail fast while a service is down.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiter usable from both threads and coroutines.
+
+    Tokens refill continuously at `rate_per_minute / 60` per second up to
+    `capacity`. Each acquire reserves one token; if none is available the caller
+    waits until its reservation matures, so waiting callers are served in order.
+    Callers that report outcomes through `record_throttled` and
+    `record_success` get additive-increase/multiplicative-decrease adaptation
+    between `rate_per_minute / 16` and `rate_per_minute`.
+    """
+
+    # Multiplicative decrease factor applied on each throttled response
+    DECREASE_FACTOR = 0.5
+    # Successful requests needed before the rate is raised again
+    SUCCESS_WINDOW = 100
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate_per_minute: Sustained request rate (0 or less disables limiting)
+            capacity: Maximum burst size (default: ten seconds worth of requests)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate * 10)
+        self._max_rate = self.rate
+        self._min_rate = self.rate / 16
+        self._successes = 0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait for it."""
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def update_from_headers(self, headers) -> None:
+        """
+        Shrink the available burst to what the server says is left.
+
+        Reads the common `X-RateLimit-Remaining` response header; when the
+        provider reports fewer remaining requests than the bucket holds, the
+        bucket is drained to match so subsequent calls wait for refill instead
+        of running into 429 responses. Missing or malformed headers are ignored.
+
+        Args:
+            headers: Response headers mapping
+        """
+        try:
+            remaining = float(headers.get('X-RateLimit-Remaining'))
+        except (AttributeError, TypeError, ValueError):
+            return
+
+        with self._lock:
+            self._tokens = min(self._tokens, max(0.0, remaining))
+
+    def record_throttled(self) -> None:
+        """Halve the rate (down to 1/16 of the configured rate) after a 429 response."""
+        with self._lock:
+            if self.rate > 0:
+                self.rate = max(self._min_rate, self.rate * self.DECREASE_FACTOR)
+            self._successes = 0
+
+    def record_success(self) -> None:
+        """
+        Count a successful request; every SUCCESS_WINDOW successes the rate is
+        raised by 1/20 of the configured rate, up to the configured rate.
+        """
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.SUCCESS_WINDOW:
+                self._successes = 0
+                self.rate = min(self._max_rate, self.rate + self._max_rate / 20)
+
+    def acquire(self) -> None:
+        """Block the current thread until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker that stops calls to a failing service.
+
+    After `failure_threshold` consecutive failures the breaker opens and
+    `allow` returns False for `cooldown_seconds`, so callers fail fast instead
+    of each waiting out a timeout. After each cooldown one trial call is let
+    through: success closes the breaker, another failure keeps it open.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 30.0):
+        """
+        Initialize the breaker (closed).
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            cooldown_seconds: Seconds the breaker stays open between trial calls
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Return whether a call may be made now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.cooldown_seconds:
+                return False
+            # Let this call through as the trial and restart the cooldown,
+            # so concurrent callers keep failing fast until it reports back
+            self._opened_at = now
+            return True
+
+    def record_success(self) -> None:
+        """Close the breaker and reset the failure count."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker once the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+def backoff_with_jitter(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """
+    Delay before retry number `attempt` (0-based) using full-jitter backoff.
+
+    Randomizing the whole interval spreads out clients that were rate limited
+    at the same moment so they do not retry in lockstep.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay scale in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Seconds to wait
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+__all__ = ['TokenBucket', 'CircuitBreaker', 'backoff_with_jitter']
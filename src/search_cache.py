@@ -0,0 +1,280 @@
+"""
+Semantic Search Cache.
+
+This module caches search results keyed by the query that produced them. A lookup
+first tries an exact match on the normalized query text and then, when a
+sentence-embedding model is available, a cosine-similarity match against the
+embeddings of previously cached queries. Entries expire after a short TTL and the
+cache is bounded with least-recently-used eviction.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from math import sqrt
+from pathlib import Path
+from operator import mul
+from typing import Callable, List, Optional, Tuple
+
+from config.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+Embedding = List[float]
+
+# Global cache for the sentence-embedding model
+_embedding_model_cache = None
+_embedding_model_load_failed: bool = False
+
+# Persistent store of computed query embeddings (created on first use)
+_embedding_store = None
+
+
+def load_embedding_model():
+    """
+    Load and cache the sentence-embedding model used for semantic matching.
+
+    If sentence-transformers is not installed or the model cannot be loaded, the
+    failure is remembered and None is returned so the cache falls back to exact
+    query matching.
+
+    Returns:
+        The loaded SentenceTransformer model, or None if unavailable.
+    """
+    global _embedding_model_cache, _embedding_model_load_failed
+
+    if _embedding_model_cache is not None:
+        return _embedding_model_cache
+
+    if _embedding_model_load_failed:
+        return None
+
+    try:
+        # Import here to avoid import errors if not installed
+        from sentence_transformers import SentenceTransformer
+
+        model_name = settings.SEARCH_CACHE_EMBEDDING_MODEL
+        logger.info(f"Loading search cache embedding model: {model_name}")
+        _embedding_model_cache = SentenceTransformer(model_name)
+        return _embedding_model_cache
+
+    except Exception as e:
+        logger.warning(f"Search cache embedding model unavailable, using exact matching: {e}")
+        _embedding_model_load_failed = True
+        return None
+
+
+def embed_query(query: str) -> Optional[Embedding]:
+    """
+    Embed a query as an L2-normalized vector.
+
+    Args:
+        query: Query text
+
+    Returns:
+        Normalized embedding, or None if no embedding model is available.
+    """
+    model = load_embedding_model()
+    if model is None:
+        return None
+
+    def compute(text: str) -> Embedding:
+        vector = model.encode(text, normalize_embeddings=True)
+        return [float(value) for value in vector]
+
+    store = _get_embedding_store()
+    if store is None:
+        return compute(query)
+    return store.get_or_compute(query, compute)
+
+
+def _get_embedding_store():
+    """Return the on-disk embedding cache, or None if disabled by settings."""
+    global _embedding_store
+
+    if _embedding_store is None and settings.EMBEDDING_CACHE_PATH:
+        from src.embedding_cache import EmbeddingCache
+
+        db_path = Path(settings.EMBEDDING_CACHE_PATH)
+        if not db_path.is_absolute():
+            db_path = Path(__file__).parent.parent / db_path
+        _embedding_store = EmbeddingCache(db_path, settings.SEARCH_CACHE_EMBEDDING_MODEL)
+    return _embedding_store
+
+
+def _normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries share a key."""
+    return " ".join(query.lower().split())
+
+
+def _query_key(query: str) -> str:
+    """Hash of the normalized query used as the cache key."""
+    return hashlib.sha256(_normalize_query(query).encode("utf-8")).hexdigest()
+
+
+def _unit(vector: Embedding) -> array:
+    """
+    Scale a vector to unit length so inner product equals cosine similarity.
+    
+    The result is packed as a float32 array: 4 bytes per component instead of
+    a boxed Python float, which keeps the cached vectors compact and the
+    inner-product scan cache-friendly.
+    """
+    norm = sqrt(sum(map(mul, vector, vector)))
+    return array('f', (value / norm for value in vector) if norm else vector)
+
+
+class SemanticSearchCache:
+    """
+    LRU cache of search results with TTL expiry and semantic query matching.
+
+    Each entry stores (timestamp, query embedding, results, result limit).
+    Embeddings are kept L2-normalized in float32 arrays so the best match is
+    found by a flat inner-product scan. An entry fetched with a result limit
+    only answers lookups asking for at most that many results, unless the
+    backend returned fewer than the limit (then the entry is complete).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: float = 300,
+        similarity_threshold: float = 0.92,
+        embedder: Optional[Callable[[str], Optional[Embedding]]] = embed_query
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached queries before LRU eviction
+            ttl_seconds: Seconds after which an entry is considered stale
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            embedder: Function mapping a query to an embedding (None disables
+                semantic matching)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.embedder = embedder
+        self._entries: "OrderedDict[str, Tuple[float, Optional[array], List[dict], Optional[int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _embed(self, query: str) -> Optional[array]:
+        if self.embedder is None:
+            return None
+        try:
+            embedding = self.embedder(query)
+        except Exception as e:
+            logger.warning(f"Failed to embed query for search cache: {e}")
+            return None
+        return _unit(embedding) if embedding is not None else None
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop entries older than the TTL."""
+        expired = [
+            key for key, (stored_at, _, _, _) in self._entries.items()
+            if now - stored_at > self.ttl_seconds
+        ]
+        for key in expired:
+            del self._entries[key]
+
+    @staticmethod
+    def _covers(results: List[dict], stored_limit: Optional[int], limit: Optional[int]) -> bool:
+        """Whether results fetched with `stored_limit` answer a lookup for `limit` results."""
+        if stored_limit is None or len(results) < stored_limit:
+            return True
+        return limit is not None and limit <= stored_limit
+
+    def get(self, query: str, limit: Optional[int] = None) -> Optional[List[dict]]:
+        """
+        Look up cached results for a query.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results wanted (None for all)
+
+        Returns:
+            Copy of the cached result list (at most `limit` results), or None
+            on a miss or when the cached entry holds fewer results than asked for.
+        """
+        key = _query_key(query)
+
+        with self._lock:
+            self._evict_expired(time.monotonic())
+
+            entry = self._entries.get(key)
+            if entry is not None and self._covers(entry[2], entry[3], limit):
+                self._entries.move_to_end(key)
+                logger.debug(f"Search cache hit (exact) for '{query}'")
+                return [dict(result) for result in entry[2][:limit]]
+
+            if not self._entries or self.embedder is None:
+                return None
+
+        # Embed outside the lock; model inference is the slow part
+        embedding = self._embed(query)
+        if embedding is None:
+            return None
+
+        with self._lock:
+            best_key, best_score = None, self.similarity_threshold
+            for candidate_key, (_, candidate, results, stored_limit) in self._entries.items():
+                if candidate is None or not self._covers(results, stored_limit, limit):
+                    continue
+                score = sum(map(mul, embedding, candidate))
+                if score >= best_score:
+                    best_key, best_score = candidate_key, score
+
+            if best_key is None:
+                return None
+
+            self._entries.move_to_end(best_key)
+            logger.debug(f"Search cache hit (similarity {best_score:.3f}) for '{query}'")
+            return [dict(result) for result in self._entries[best_key][2][:limit]]
+
+    def put(self, query: str, results: List[dict], limit: Optional[int] = None) -> None:
+        """
+        Store results for a query.
+
+        Args:
+            query: Search query
+            results: Search result dictionaries to cache
+            limit: Result limit the search was run with (None if unlimited)
+        """
+        key = _query_key(query)
+        embedding = self._embed(query)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding, [dict(result) for result in results], limit)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries, e.g. after the trusted-source list changes."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared cache used by api_wrapper.search_unified
+search_cache = SemanticSearchCache(
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+    similarity_threshold=settings.SEARCH_CACHE_SIMILARITY_THRESHOLD,
+    embedder=embed_query if settings.SEARCH_CACHE_SEMANTIC else None
+)
+
+
+__all__ = [
+    'SemanticSearchCache',
+    'search_cache',
+    'load_embedding_model',
+    'embed_query'
+]
@@ -219,6 +219,95 @@ class SelfHostedAPIClient:
         
         raise SelfHostedAPIError("Unexpected error in search")
     
+    def search_batch(
+        self,
+        queries: List[str],
+        max_results: Optional[int] = None,
+        max_retries: int = 3
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for evidence for several queries in a single API request.
+        
+        Args:
+            queries: Search queries (at most 100 per call)
+            max_results: Maximum number of results per query (default: from settings)
+            max_retries: Maximum number of retry attempts
+        
+        Returns:
+            One list of search result dictionaries per query, in input order
+        
+        Raises:
+            SelfHostedAPIError: If API call fails after retries, or the response
+                does not hold exactly one entry per query
+        """
+        if not queries or any(not query or len(query.strip()) == 0 for query in queries):
+            raise ValueError("Queries cannot be empty")
+        
+        url = f"{self.base_url}/api/v1/search/batch"
+        payload = {
+            "queries": queries,
+            "max_results": max_results or (settings.MAX_EVIDENCE_PER_CLAIM * 2)
+        }
+        
+        # Retry loop with exponential backoff
+        for attempt in range(max_retries):
+            try:
+                logger.info(
+                    f"Calling self-hosted API for batch search of {len(queries)} queries "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                
+                response = requests.post(
+                    url,
+                    json=payload,
+                    headers=self._get_headers(),
+                    timeout=self.timeout
+                )
+                
+                if response.status_code == 200:
+                    data = response.json()
+                    results = [item.get("results", []) for item in data.get("responses", [])]
+                    
+                    # Results are matched to queries by position, so a short or
+                    # long response would attach evidence to the wrong query
+                    if len(results) != len(queries):
+                        raise SelfHostedAPIError(
+                            f"Batch search returned {len(results)} responses for {len(queries)} queries"
+                        )
+                    
+                    logger.info(f"Successfully retrieved batch search results for {len(results)} queries")
+                    return results
+                
+                else:
+                    logger.warning(f"API returned status {response.status_code}: {response.text}")
+                    
+                    if attempt < max_retries - 1:
+                        wait_time = 2 ** attempt
+                        logger.info(f"Retrying in {wait_time} seconds...")
+                        time.sleep(wait_time)
+                    else:
+                        raise SelfHostedAPIError(
+                            f"API returned status {response.status_code}: {response.text}"
+                        )
+            
+            except requests.Timeout:
+                logger.warning(f"API request timed out (attempt {attempt + 1}/{max_retries})")
+                if attempt < max_retries - 1:
+                    wait_time = 2 ** attempt
+                    time.sleep(wait_time)
+                else:
+                    raise SelfHostedAPIError("API request timed out after all retries")
+            
+            except requests.RequestException as e:
+                logger.error(f"API request failed: {e}")
+                if attempt < max_retries - 1:
+                    wait_time = 2 ** attempt
+                    time.sleep(wait_time)
+                else:
+                    raise SelfHostedAPIError(f"API request failed: {e}")
+        
+        raise SelfHostedAPIError("Unexpected error in search_batch")
+    
     def health_check(self) -> Dict[str, Any]:
         """
         Check if API server is healthy.
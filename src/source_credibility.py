@@ -8,15 +8,28 @@ or UNRELIABLE based on their credibility scores.
 
 import json
 import logging
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 from urllib.parse import urlparse
 
 from src.models import SourceCredibility, SourceCategory
 
 logger = logging.getLogger(__name__)
 
+# Lower score bounds of each category above UNRELIABLE, in ascending order
+_CATEGORY_BOUNDS = (0.3, 0.5, 0.8)
+_CATEGORIES = (
+    SourceCategory.UNRELIABLE,
+    SourceCategory.QUESTIONABLE,
+    SourceCategory.MAINSTREAM,
+    SourceCategory.TRUSTED,
+)
+
+# Bound on remembered lookups of domains that are not exact database keys
+_RESOLVED_SCORES_MAX_ENTRIES = 4096
+
 
 class SourceCredibilityDatabase:
     """Database for source credibility scores."""
@@ -34,6 +47,8 @@ class SourceCredibilityDatabase:
         
         self.db_path = Path(db_path)
         self.sources: Dict[str, dict] = {}
+        self.scores: Dict[str, float] = {}
+        self._resolved_scores: Dict[str, float] = {}
         self.default_score: float = 0.5
         self.last_updated: Optional[datetime] = None
         
@@ -46,11 +61,15 @@ class SourceCredibilityDatabase:
                 logger.warning(f"Credibility database not found at {self.db_path}")
                 return
             
-            with open(self.db_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_database()
             
             self.sources = data.get('sources', {})
             self.default_score = data.get('defaultCredibilityScore', 0.5)
+            self.scores = {
+                domain: source_data.get('credibilityScore', self.default_score)
+                for domain, source_data in self.sources.items()
+            }
+            self._resolved_scores.clear()
             
             # Parse last updated timestamp
             last_updated_str = data.get('lastUpdated')
@@ -63,6 +82,20 @@ class SourceCredibilityDatabase:
             logger.error(f"Error loading credibility database: {e}")
             # Continue with empty database
     
+    def _read_database(self) -> dict:
+        """
+        Read and parse the JSON database.
+        
+        The file holds a few dozen entries and is read once per process, so it
+        is parsed directly rather than from a serialized cache (a pickle next
+        to it would run code from anyone able to write the data directory).
+        
+        Returns:
+            Parsed database contents
+        """
+        with open(self.db_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
     def _extract_domain(self, url_or_domain: str) -> str:
         """
         Extract domain from URL or return domain as-is.
@@ -86,6 +119,26 @@ class SourceCredibilityDatabase:
         
         return domain.lower().strip()
     
+    def _match_domain(self, domain: str) -> Optional[str]:
+        """
+        Find the database entry covering a normalized domain.
+        
+        Subdomains inherit the entry of their closest listed parent, so
+        "news.bbc.co.uk" matches "bbc.co.uk". Any port is ignored.
+        
+        Args:
+            domain: Normalized domain name
+            
+        Returns:
+            The matching database key, or None if no entry covers the domain
+        """
+        host = domain.partition(':')[0]
+        while host:
+            if host in self.sources:
+                return host
+            _, _, host = host.partition('.')
+        return None
+    
     def _determine_category(self, score: float) -> SourceCategory:
         """
         Determine source category based on credibility score.
@@ -96,14 +149,8 @@ class SourceCredibilityDatabase:
         Returns:
             SourceCategory enum value
         """
-        if 0.8 <= score <= 1.0:
-            return SourceCategory.TRUSTED
-        elif 0.5 <= score < 0.8:
-            return SourceCategory.MAINSTREAM
-        elif 0.3 <= score < 0.5:
-            return SourceCategory.QUESTIONABLE
-        else:  # 0.0 <= score < 0.3
-            return SourceCategory.UNRELIABLE
+        # TRUSTED >= 0.8 > MAINSTREAM >= 0.5 > QUESTIONABLE >= 0.3 > UNRELIABLE
+        return _CATEGORIES[bisect_right(_CATEGORY_BOUNDS, score)]
     
     def lookup_source_credibility(self, domain: str) -> SourceCredibility:
         """
@@ -118,8 +165,9 @@ class SourceCredibilityDatabase:
         # Extract and normalize domain
         normalized_domain = self._extract_domain(domain)
         
-        # Look up in database
-        source_data = self.sources.get(normalized_domain)
+        # Look up in database, falling back to the closest listed parent domain
+        matched_domain = self._match_domain(normalized_domain)
+        source_data = self.sources.get(matched_domain) if matched_domain else None
         
         if source_data:
             # Found in database
@@ -148,6 +196,65 @@ class SourceCredibilityDatabase:
                 lastUpdated=datetime.now()
             )
     
+    def get_credibility_score(self, domain: str) -> float:
+        """
+        Look up only the credibility score for a source domain.
+        
+        Faster than lookup_source_credibility when the category and
+        SourceCredibility object are not needed.
+        
+        Args:
+            domain: Domain name or URL to look up
+            
+        Returns:
+            Credibility score (0.0 to 1.0), or the default score if unknown
+        """
+        score = self.scores.get(domain)
+        if score is not None:
+            return score
+        
+        # Subdomains, URLs and unknown domains recur across searches; remember
+        # what they resolved to instead of normalizing and matching again
+        score = self._resolved_scores.get(domain)
+        if score is not None:
+            return score
+        
+        matched_domain = self._match_domain(self._extract_domain(domain))
+        score = self.scores[matched_domain] if matched_domain else self.default_score
+        
+        if len(self._resolved_scores) >= _RESOLVED_SCORES_MAX_ENTRIES:
+            self._resolved_scores.clear()
+        self._resolved_scores[domain] = score
+        return score
+    
+    def lookup_source_credibility_many(self, domains: Iterable[str]) -> Dict[str, SourceCredibility]:
+        """
+        Look up credibility information for several source domains at once.
+        
+        Duplicate domains are looked up only once.
+        
+        Args:
+            domains: Domain names or URLs to look up
+            
+        Returns:
+            Dictionary mapping each given domain to its SourceCredibility
+        """
+        return {domain: self.lookup_source_credibility(domain) for domain in set(domains)}
+    
+    def get_credibility_scores(self, domains: Iterable[str]) -> Dict[str, float]:
+        """
+        Look up only the credibility scores for several source domains at once.
+        
+        Duplicate domains are looked up only once.
+        
+        Args:
+            domains: Domain names or URLs to look up
+            
+        Returns:
+            Dictionary mapping each given domain to its credibility score
+        """
+        return {domain: self.get_credibility_score(domain) for domain in set(domains)}
+    
     def get_all_sources(self) -> Dict[str, dict]:
         """
         Get all sources in the database.
@@ -205,3 +312,48 @@ def lookup_source_credibility(domain: str) -> SourceCredibility:
     """
     db = get_credibility_database()
     return db.lookup_source_credibility(domain)
+
+
+def get_credibility_score(domain: str) -> float:
+    """
+    Look up the credibility score for a source domain.
+    
+    This is a convenience function that uses the global database instance.
+    
+    Args:
+        domain: Domain name or URL to look up
+        
+    Returns:
+        Credibility score (0.0 to 1.0)
+    """
+    return get_credibility_database().get_credibility_score(domain)
+
+
+def lookup_source_credibility_many(domains: Iterable[str]) -> Dict[str, SourceCredibility]:
+    """
+    Look up credibility information for several source domains at once.
+    
+    This is a convenience function that uses the global database instance.
+    
+    Args:
+        domains: Domain names or URLs to look up
+        
+    Returns:
+        Dictionary mapping each given domain to its SourceCredibility
+    """
+    return get_credibility_database().lookup_source_credibility_many(domains)
+
+
+def get_credibility_scores(domains: Iterable[str]) -> Dict[str, float]:
+    """
+    Look up the credibility scores for several source domains at once.
+    
+    This is a convenience function that uses the global database instance.
+    
+    Args:
+        domains: Domain names or URLs to look up
+        
+    Returns:
+        Dictionary mapping each given domain to its credibility score
+    """
+    return get_credibility_database().get_credibility_scores(domains)
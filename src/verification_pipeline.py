@@ -17,7 +17,7 @@ import logging
 from src.models import ArticleInput, FinalVerdict, Claim, Evidence, NLIResult
 from src.article_parser import parseArticleFromURL, processTextInput
 from src.llm_integration import extractClaims
-from src.evidence_retrieval import searchEvidence
+from src.evidence_retrieval import searchEvidenceBatch
 from src.source_credibility import lookup_source_credibility
 from src.nli_engine import verifyClaimAgainstEvidence, aggregateNLIScores
 from src.tone_analyzer import analyzeTone
@@ -108,15 +108,15 @@ def verifyArticle(article_input: Union[str, ArticleInput]) -> FinalVerdict:
     logger.info("Step 3: Retrieving evidence for claims...")
     evidence_by_claim: Dict[UUID, List[Evidence]] = {}
     
-    for i, claim in enumerate(claims, 1):
-        logger.info(f"  Retrieving evidence for claim {i}/{len(claims)}: {claim.text[:50]}...")
-        try:
-            claim_evidence = searchEvidence(claim)
+    # Searches for all claims run concurrently
+    for i, (claim, claim_evidence) in enumerate(zip(claims, searchEvidenceBatch(claims)), 1):
+        logger.info(f"  Evidence for claim {i}/{len(claims)}: {claim.text[:50]}...")
+        if isinstance(claim_evidence, BaseException):
+            logger.error(f"  Error retrieving evidence for claim {claim.id}: {claim_evidence}")
+            evidence_by_claim[claim.id] = []
+        else:
             evidence_by_claim[claim.id] = claim_evidence
             logger.info(f"  Found {len(claim_evidence)} evidence items")
-        except Exception as e:
-            logger.error(f"  Error retrieving evidence for claim {claim.id}: {e}")
-            evidence_by_claim[claim.id] = []
     
     # Step 4: Run NLI verification for all claim-evidence pairs
     logger.info("Step 4: Running NLI verification...")
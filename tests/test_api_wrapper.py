@@ -0,0 +1,102 @@
+"""
+Unit tests for the API wrapper's batch helpers.
+
+Tests cover:
+- Batch search deduplication and input ordering
+- Per-query failures in batch search
+- Batch search called from inside a running event loop
+- Self-hosted batch responses that do not match the queries
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import api_wrapper
+from src.self_hosted_api_client import SelfHostedAPIClient, SelfHostedAPIError
+
+
+def results_for(query):
+    return [{"url": f"https://apnews.com/{query}", "title": query, "snippet": "s", "domain": "apnews.com"}]
+
+
+def fake_search(query, max_results=None, max_retries=3):
+    if query == "broken":
+        raise RuntimeError("search failed")
+    return results_for(query)
+
+
+async def fake_search_async(query, max_results=None, max_retries=3):
+    return fake_search(query, max_results, max_retries)
+
+
+@pytest.fixture
+def external_search():
+    with patch.object(api_wrapper.settings, "USE_SELF_HOSTED_API", False), \
+         patch.object(api_wrapper, "search_unified", side_effect=fake_search) as sync_search, \
+         patch.object(api_wrapper, "search_unified_async", side_effect=fake_search_async) as async_search:
+        yield sync_search, async_search
+
+
+class TestSearchBatchUnified:
+    """Tests for search_batch_unified and search_batch_unified_async."""
+
+    def test_duplicates_searched_once_in_input_order(self, external_search):
+        _, async_search = external_search
+        found = api_wrapper.search_batch_unified(["a", "b", "a"])
+
+        assert found == [results_for("a"), results_for("b"), results_for("a")]
+        assert async_search.call_count == 2
+
+    def test_failing_query_does_not_discard_the_batch(self, external_search):
+        found = api_wrapper.search_batch_unified(["a", "broken", "b"])
+
+        assert found[0] == results_for("a")
+        assert isinstance(found[1], RuntimeError)
+        assert found[2] == results_for("b")
+
+    def test_async_variant_returns_failures_in_place(self, external_search):
+        found = asyncio.run(api_wrapper.search_batch_unified_async(["broken", "a"]))
+
+        assert isinstance(found[0], RuntimeError)
+        assert found[1] == results_for("a")
+
+    def test_inside_running_event_loop_uses_threads(self, external_search):
+        sync_search, async_search = external_search
+
+        async def caller():
+            return api_wrapper.search_batch_unified(["a", "broken", "a"])
+
+        found = asyncio.run(caller())
+
+        assert found[0] == found[2] == results_for("a")
+        assert isinstance(found[1], RuntimeError)
+        assert sync_search.call_count == 2
+        assert async_search.call_count == 0
+
+    def test_empty_batch(self):
+        assert api_wrapper.search_batch_unified([]) == []
+
+
+class TestSelfHostedSearchBatch:
+    """Tests for SelfHostedAPIClient.search_batch responses."""
+
+    def _search_batch(self, queries, responses):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"responses": [{"results": results} for results in responses]}
+        client = SelfHostedAPIClient(base_url="http://localhost:8000", api_key="key")
+        with patch("src.self_hosted_api_client.requests.post", return_value=response) as post, \
+             patch("src.self_hosted_api_client.get_client", return_value=client), \
+             patch.object(api_wrapper.settings, "USE_SELF_HOSTED_API", True):
+            return api_wrapper.search_batch_unified(queries), post
+
+    def test_results_matched_to_queries(self):
+        found, post = self._search_batch(["a", "b", "a"], [results_for("a"), results_for("b")])
+
+        assert found == [results_for("a"), results_for("b"), results_for("a")]
+        assert post.call_count == 1
+
+    def test_short_response_raises(self):
+        with pytest.raises(SelfHostedAPIError, match="1 responses for 2 queries"):
+            self._search_batch(["a", "b"], [results_for("a")])
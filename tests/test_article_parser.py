@@ -1,6 +1,10 @@
 """Unit tests for the article parser module."""
 
+import socket
+import threading
+
 import pytest
+import requests
 from unittest.mock import Mock, patch
 from src.article_parser import (
     parseArticleFromURL,
@@ -14,9 +18,19 @@ from src.article_parser import (
     _normalize_text,
     _sanitize_html,
     _validate_utf8_encoding,
+    clear_article_cache,
+    _build_session,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_article_cache():
+    """Keep cached articles from leaking between tests."""
+    clear_article_cache()
+    yield
+    clear_article_cache()
+
+
 def test_valid_http_url():
     """Test that valid HTTP URLs pass validation."""
     _validate_url_format("http://example.com/article")
@@ -58,21 +72,120 @@ def test_normalize_multiple_spaces():
     assert normalized == "This has multiple spaces"
 
 
-@patch('src.article_parser.requests.Session')
-def test_successful_parsing(mock_session_class):
+@patch('src.article_parser._SESSION.get')
+def test_successful_parsing(mock_get):
     """Test successful article parsing from URL."""
     mock_response = Mock()
-    mock_response.text = "<html><body><article><p>Test content</p></article></body></html>"
+    mock_response.iter_content.return_value = [
+        b"<html><body><article><p>Test content</p></article></body></html>"
+    ]
+    mock_response.encoding = 'utf-8'
+    mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.raise_for_status = Mock()
     
-    mock_session = Mock()
-    mock_session.get.return_value = mock_response
-    mock_session_class.return_value = mock_session
+    mock_get.return_value = mock_response
     
     text = parseArticleFromURL("https://example.com/article")
     assert "Test content" in text
 
 
+@patch('src.article_parser._SESSION.get')
+def test_repeated_url_served_from_cache(mock_get):
+    """Test that a repeated URL is not fetched again while cached."""
+    mock_response = Mock()
+    mock_response.iter_content.return_value = [b"<article><p>Cached story</p></article>"]
+    mock_response.encoding = 'utf-8'
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_get.return_value = mock_response
+    
+    first = parseArticleFromURL("https://example.com/story")
+    second = parseArticleFromURL("https://example.com/story")
+    
+    assert first == second == "Cached story"
+    assert mock_get.call_count == 1
+
+
+@patch('src.article_parser.ARTICLE_CACHE_TTL_SECONDS', -1)
+@patch('src.article_parser._SESSION.get')
+def test_expired_entry_revalidated_with_etag(mock_get):
+    """Test that an expired entry is revalidated and reused on 304 Not Modified."""
+    fresh = Mock()
+    fresh.iter_content.return_value = [b"<article><p>Original story</p></article>"]
+    fresh.encoding = 'utf-8'
+    fresh.status_code = 200
+    fresh.headers = {'ETag': '"v1"'}
+    not_modified = Mock()
+    not_modified.status_code = 304
+    not_modified.headers = {}
+    mock_get.side_effect = [fresh, not_modified]
+    
+    parseArticleFromURL("https://example.com/story")
+    text = parseArticleFromURL("https://example.com/story")
+    
+    assert text == "Original story"
+    assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+
+
+@patch('src.article_parser._SESSION.get')
+def test_meta_charset_used_when_header_has_none(mock_get):
+    """Test that a <meta charset> declaration decides how the body is decoded."""
+    mock_response = Mock()
+    mock_response.iter_content.return_value = [
+        '<meta charset="windows-1252"><article><p>Caf\u00e9 story</p></article>'.encode('cp1252')
+    ]
+    mock_response.status_code = 200
+    mock_response.headers = {'Content-Type': 'text/html'}
+    mock_get.return_value = mock_response
+    
+    text = parseArticleFromURL("https://example.com/cafe")
+    assert text == "Caf\u00e9 story"
+
+
+@patch('src.article_parser._MAX_RESPONSE_BYTES', 10)
+@patch('src.article_parser._SESSION.get')
+def test_oversized_response_raises_error(mock_get):
+    """Test that responses over the size cap are rejected."""
+    mock_response = Mock()
+    mock_response.iter_content.return_value = [b"<html>", b"<body>too much</body></html>"]
+    mock_response.status_code = 200
+    mock_response.headers = {'Content-Type': 'text/html'}
+    mock_response.raise_for_status = Mock()
+    
+    mock_get.return_value = mock_response
+    
+    with pytest.raises(InvalidURLError, match="Response too large"):
+        parseArticleFromURL("https://example.com/article")
+    mock_response.close.assert_called_once()
+
+
+@patch('src.article_parser._SESSION.get')
+def test_non_html_content_type_raises_error(mock_get):
+    """Test that non-HTML responses are rejected without reading the body."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {'Content-Type': 'application/pdf'}
+    mock_response.raise_for_status = Mock()
+    
+    mock_get.return_value = mock_response
+    
+    with pytest.raises(InvalidURLError, match="Unsupported content type"):
+        parseArticleFromURL("https://example.com/report.pdf")
+    mock_response.iter_content.assert_not_called()
+    mock_response.close.assert_called_once()
+
+
+def test_extract_article_text_skips_head_content():
+    """Test that head metadata and scripts never reach the extracted text."""
+    html = (
+        "<html><head><title>Page title</title><script>var tracking = 1;</script></head>"
+        "<body><nav>Menu</nav><article><p>Story text</p></article></body></html>"
+    )
+    text = _extract_article_text(html)
+    assert text == "Story text"
+
+
 # Tests for text input handler (Task 5.2)
 
 def test_process_text_input_valid():
@@ -119,7 +232,7 @@ def test_sanitize_html_removes_tags():
     """Test that HTML tags are removed from text."""
     text = "<p>This is <b>bold</b> text</p>"
     result = _sanitize_html(text)
-    assert result == "This is bold text"
+    assert _normalize_text(result) == "This is bold text"
     assert "<p>" not in result
     assert "<b>" not in result
 
@@ -164,6 +277,29 @@ def test_sanitize_html_complex_html():
     assert "<" not in result
 
 
+def test_sanitize_html_plain_text_unchanged():
+    """Test that text without markup is returned as-is."""
+    text = "Plain claim about 5 > 3 with no markup"
+    assert _sanitize_html(text) == text
+
+
+def test_sanitize_html_decodes_entities():
+    """Test that HTML entities are decoded even without tags."""
+    assert _sanitize_html("Fish &amp; chips") == "Fish & chips"
+
+
+def test_sanitize_html_keeps_text_after_bare_less_than():
+    """Test that a bare '<' in plain text does not truncate the rest."""
+    result = _sanitize_html("the value of x<y in most trials. Further text follows.")
+    assert "Further text follows." in result
+
+
+def test_process_text_input_keeps_text_after_bare_less_than():
+    """Test that user text with a comparison is not cut off at the '<'."""
+    result = processTextInput("Claim: a<b. Second sentence continues.")
+    assert "Second sentence continues." in result
+
+
 def test_sanitize_html_empty_string():
     """Test sanitization of empty string."""
     result = _sanitize_html("")
@@ -192,6 +328,12 @@ def test_validate_utf8_encoding_invalid_bytes():
         _validate_utf8_encoding(invalid_bytes)
 
 
+def test_validate_utf8_encoding_lone_surrogate():
+    """Test UTF-8 validation rejects text with unencodable lone surrogates."""
+    with pytest.raises(TextInputError, match="cannot be encoded as UTF-8"):
+        _validate_utf8_encoding("broken \ud800 text")
+
+
 def test_validate_utf8_encoding_empty():
     """Test UTF-8 validation with empty string."""
     result = _validate_utf8_encoding("")
@@ -240,3 +382,26 @@ def test_process_text_input_unicode_characters():
     assert "🎉" in result
     assert "中文" in result
     assert "العربية" in result
+
+
+def test_session_read_timeout_raises_timeout():
+    """Test that a server that never answers surfaces as a Timeout, not a connection error."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    accepted = []
+    acceptor = threading.Thread(target=lambda: accepted.append(server.accept()), daemon=True)
+    acceptor.start()
+    try:
+        with pytest.raises(requests.exceptions.Timeout):
+            _build_session().get(f"http://127.0.0.1:{server.getsockname()[1]}/", timeout=0.2)
+    finally:
+        acceptor.join(1)
+        for connection, _ in accepted:
+            connection.close()
+        server.close()
+
+
+def test_session_redirect_cap():
+    """Test that the session enforces the configured redirect limit."""
+    assert _build_session(max_redirects=2).max_redirects == 2
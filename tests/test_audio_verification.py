@@ -0,0 +1,148 @@
+"""
+Unit tests for the audio verification module.
+
+Tests cover:
+- Construction, validation and serialization of the result models
+- Error results copied from the module-level templates
+- The verifyAudio pipeline with the placeholder analyses
+- Micro-batching of concurrent calls, including failing batches
+"""
+
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from src import audio_verification as av
+from src.audio_verification import (
+    AudioQuality,
+    AudioTranscription,
+    AudioVerificationResult,
+    DeepfakeAnalysis,
+    verifyAudio,
+)
+
+
+def make_result(**overrides):
+    fields = dict(
+        transcription=AudioTranscription(text="hello", confidence=90.0, language="en", duration=1.5),
+        deepfakeAnalysis=DeepfakeAnalysis(
+            isDeepfake=False,
+            confidence=50.0,
+            detectionMethod=av.DETECTION_METHOD_BASIC,
+            artifacts=[],
+            explanation="ok"
+        ),
+        audioQuality=AudioQuality(sampleRate=16000, bitrate=64, channels=1, duration=1.5, format="WAV"),
+        verdict=av.VERDICT_AUTHENTIC,
+        confidence=90.0,
+        explanation="fine"
+    )
+    fields.update(overrides)
+    return AudioVerificationResult(**fields)
+
+
+class TestResultModels:
+    """Tests for the audio result types."""
+
+    def test_construction_defaults(self):
+        result = make_result()
+
+        assert result.transcription.words is None
+        assert result.audioQuality.noiseLevel is None
+        assert result.audioQuality.clarity is None
+        assert result.textVerification is None
+
+    def test_serialization_round_trip(self):
+        result = make_result(textVerification={"verdict": "TRUE"})
+
+        dumped = result.model_dump()
+        assert dumped["transcription"]["text"] == "hello"
+        assert dumped["deepfakeAnalysis"]["detectionMethod"] == av.DETECTION_METHOD_BASIC
+        assert dumped["textVerification"] == {"verdict": "TRUE"}
+        assert AudioVerificationResult.model_validate_json(result.model_dump_json()) == result
+
+    def test_invalid_input_is_rejected(self):
+        with pytest.raises(ValidationError):
+            make_result(verdict="PROBABLY_FINE")
+        with pytest.raises(ValidationError):
+            AudioQuality(sampleRate="fast", bitrate=64, channels=1, duration=1.0, format="WAV")
+
+
+class TestVerifyAudio:
+    """Tests for the verifyAudio pipeline."""
+
+    def test_placeholder_pipeline_result(self):
+        result = verifyAudio(b"audio bytes")
+
+        assert result.verdict == av.VERDICT_UNVERIFIED
+        assert result.deepfakeAnalysis.detectionMethod == av.DETECTION_METHOD_BASIC
+        assert AudioVerificationResult.model_validate(result.model_dump()) == result
+
+    def test_error_result_copies_templates(self, monkeypatch):
+        monkeypatch.setattr(av, "transcribeAudio", lambda audio: 1 / 0)
+
+        result = verifyAudio(b"audio bytes")
+
+        assert result.verdict == av.VERDICT_ERROR
+        assert result.transcription.text == "Error: division by zero"
+        assert result.deepfakeAnalysis.detectionMethod == av.DETECTION_METHOD_ERROR
+        assert result.audioQuality.format == "error"
+        # Templates are copied, never modified
+        assert av._ERROR_TRANSCRIPTION.text == ""
+        assert av._ERROR_DEEPFAKE_ANALYSIS.explanation == ""
+        assert result.deepfakeAnalysis.artifacts is not av._ERROR_DEEPFAKE_ANALYSIS.artifacts
+
+
+class TestMicroBatcher:
+    """Tests for _MicroBatcher."""
+
+    @pytest.mark.parametrize("error", [ValueError("bad batch"), KeyboardInterrupt()])
+    def test_failing_batch_releases_every_caller(self, error):
+        batches = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def batchFunction(items):
+            batches.append(list(items))
+            if len(batches) == 1:
+                # Hold the first batch so the other callers queue behind it
+                started.set()
+                release.wait(5)
+            if 1 in items:
+                raise error
+            return [item * 2 for item in items]
+
+        batcher = av._MicroBatcher(batchFunction, maxBatchSize=3)
+        outcomes = {}
+
+        def call(item):
+            try:
+                outcomes[item] = batcher.submit(item)
+            except BaseException as e:
+                outcomes[item] = e
+
+        first = threading.Thread(target=call, args=(0,), daemon=True)
+        first.start()
+        assert started.wait(5)
+        others = [threading.Thread(target=call, args=(item,), daemon=True) for item in range(1, 6)]
+        for thread in others:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+
+        for thread in [first] + others:
+            thread.join(5)
+            assert not thread.is_alive()
+        failed = next(batch for batch in batches if 1 in batch)
+        assert batches[0] == [0] and len(failed) == 3
+        assert outcomes[0] == 0
+        for item in range(1, 6):
+            if item in failed:
+                assert outcomes[item] is error
+            elif isinstance(error, Exception):
+                assert outcomes[item] == item * 2
+            else:
+                # KeyboardInterrupt is re-raised in whichever thread ran the batch
+                assert outcomes[item] in (item * 2, error)
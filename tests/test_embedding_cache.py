@@ -0,0 +1,44 @@
+"""
+Unit tests for the persistent embedding cache.
+
+Tests cover:
+- Round-tripping vectors through float16 storage
+- Model name as part of the key
+- Computing only on a miss
+"""
+
+from src.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+    
+    def test_round_trip_uses_half_precision(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.db", "model-a")
+        cache.put("claim", [0.5, -0.25, 0.1])
+        
+        vector = cache.get("claim")
+        
+        assert vector[:2] == [0.5, -0.25]
+        assert abs(vector[2] - 0.1) < 1e-3
+        cache.close()
+    
+    def test_keys_are_scoped_by_model(self, tmp_path):
+        db_path = tmp_path / "embeddings.db"
+        EmbeddingCache(db_path, "model-a").put("claim", [1.0])
+        
+        assert EmbeddingCache(db_path, "model-b").get("claim") is None
+        assert EmbeddingCache(db_path, "model-a").get("claim") == [1.0]
+    
+    def test_get_or_compute_only_computes_on_miss(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.db", "model-a")
+        calls = []
+        
+        def compute(text):
+            calls.append(text)
+            return [0.0, 1.0]
+        
+        assert cache.get_or_compute("claim", compute) == [0.0, 1.0]
+        assert cache.get_or_compute("claim", compute) == [0.0, 1.0]
+        assert calls == ["claim"]
+        cache.close()
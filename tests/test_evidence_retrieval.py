@@ -6,21 +6,49 @@ Tests the search API integration, error handling, and rate limit handling.
 Requirements: 3.1, 11.3, 16.2
 """
 
+import asyncio
+import json
+from datetime import datetime, timezone
+
 import pytest
 from unittest.mock import patch, Mock
 import requests
 
+from src.rate_limiter import TokenBucket
 from src.evidence_retrieval import (
     callSearchAPI,
+    callSearchAPIAsync,
+    clearSearchCache,
+    calculateRelevance,
+    calculateRelevanceBatch,
+    calculateRelevancePrepared,
+    prepareClaim,
     extractDomain,
+    optimizeQueryForSearch,
+    searchEvidenceBatch,
+    searchEvidenceMany,
     SearchResult,
     SearchAPIError,
     RateLimitError,
+    _parse_date,
+    _rankEvidence,
+    _search_circuit_breakers,
     _parse_serper_results,
-    _parse_tavily_results
+    _parse_tavily_results,
+    _post_with_backoff
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_search_cache():
+    """Keep cached search results and provider failures from leaking between tests."""
+    clearSearchCache()
+    yield
+    clearSearchCache()
+    for breaker in _search_circuit_breakers.values():
+        breaker.record_success()
+
+
 class TestExtractDomain:
     """Test domain extraction from URLs."""
     
@@ -61,6 +89,84 @@ class TestExtractDomain:
         assert result == ""
 
 
+class TestOptimizeQueryForSearch:
+    """Test search query cleanup."""
+    
+    def test_quotes_removed_without_edge_whitespace(self):
+        """Test that removing quotes leaves no leading or trailing spaces."""
+        assert optimizeQueryForSearch('" \'Vaccines cause autism\' "') == "Vaccines cause autism"
+    
+    def test_long_query_cut_at_word_boundary(self):
+        """Test that long queries are cut at a word boundary."""
+        query = optimizeQueryForSearch("word  " * 50)
+        assert len(query) <= 200
+        assert query == query.strip()
+        assert query.endswith("word")
+    
+    def test_blank_claim(self):
+        """Test that a blank claim gives an empty query."""
+        assert optimizeQueryForSearch("  ") == ""
+
+
+class TestCalculateRelevanceBatch:
+    """Test batched relevance scoring."""
+    
+    CLAIM = "Scientists discovered a new species of bird in the Amazon rainforest"
+    SNIPPETS = [
+        "Researchers have found a previously unknown bird species in the Amazon",
+        "The Amazon rainforest is home to many species",
+        "The weather forecast predicts rain tomorrow",
+        "",
+    ]
+    
+    def test_batch_matches_single_scores(self):
+        """Test batch scores equal per-snippet calculateRelevance scores."""
+        expected = [calculateRelevance(self.CLAIM, snippet) for snippet in self.SNIPPETS]
+        assert calculateRelevanceBatch(self.CLAIM, self.SNIPPETS) == expected
+    
+    def test_prepared_claim_matches_single_scores(self):
+        """Test scoring against a prepared claim equals calculateRelevance."""
+        claim = prepareClaim(self.CLAIM)
+        for snippet in self.SNIPPETS:
+            assert calculateRelevancePrepared(claim, snippet) == calculateRelevance(self.CLAIM, snippet)
+    
+    def test_batch_empty_claim(self):
+        """Test empty claim scores every snippet as 0.0."""
+        assert calculateRelevanceBatch("", self.SNIPPETS) == [0.0] * len(self.SNIPPETS)
+    
+    def test_batch_no_snippets(self):
+        """Test empty snippet list returns empty scores."""
+        assert calculateRelevanceBatch(self.CLAIM, []) == []
+    
+    @patch('src.evidence_retrieval.settings')
+    def test_bm25_ranks_relevant_snippet_first(self, mock_settings):
+        """Test BM25 scores are bounded and rank the closest snippet highest."""
+        mock_settings.RELEVANCE_SCORER = "bm25"
+        
+        snippets = [self.CLAIM] + self.SNIPPETS
+        scores = calculateRelevanceBatch(self.CLAIM, snippets)
+        
+        assert all(0.0 <= score <= 1.0 for score in scores)
+        assert scores[0] == max(scores)
+        assert scores[1] > scores[3]
+        assert scores[3] == 0.0
+        assert scores[4] == 0.0
+    
+    @patch('src.evidence_retrieval.settings')
+    def test_tfidf_ranks_relevant_snippet_first(self, mock_settings):
+        """Test TF-IDF cosine scores are bounded and rank the closest snippet highest."""
+        mock_settings.RELEVANCE_SCORER = "tfidf"
+        
+        snippets = [self.CLAIM] + self.SNIPPETS
+        scores = calculateRelevanceBatch(self.CLAIM, snippets)
+        
+        assert len(scores) == len(snippets)
+        assert all(0.0 <= score <= 1.0 for score in scores)
+        assert scores[0] == pytest.approx(1.0)
+        assert scores[1] > scores[3]
+        assert scores[3] == 0.0
+
+
 class TestSearchResult:
     """Test SearchResult class."""
     
@@ -94,6 +200,27 @@ class TestSearchResult:
         assert result.date == "2024-01-15"
 
 
+class TestParseDate:
+    """Test parsing of search result dates."""
+    
+    def test_parse_iso_date(self):
+        """Test plain ISO dates take the fast path."""
+        assert _parse_date("2024-01-15") == datetime(2024, 1, 15)
+    
+    def test_parse_iso_datetime_with_z_suffix(self):
+        """Test a trailing Z is read as UTC."""
+        assert _parse_date("2024-01-15T10:30:00Z") == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+    
+    def test_parse_month_name_date(self):
+        """Test the "Jan 5, 2024" layout Serper uses."""
+        assert _parse_date("Jan 5, 2024") == datetime(2024, 1, 5)
+    
+    @patch.dict('sys.modules', {'dateutil': None})
+    def test_unparseable_date_returns_none(self):
+        """Test an unparseable date yields None instead of raising."""
+        assert _parse_date("sometime last week") is None
+
+
 class TestParseSerperResults:
     """Test parsing Serper API responses."""
     
@@ -165,6 +292,20 @@ class TestParseSerperResults:
         results = _parse_serper_results(data)
         assert len(results) == 1
         assert results[0].url == "https://example.com/article"
+    
+    def test_parse_serper_results_null_fields(self):
+        """Test null fields are treated like missing ones."""
+        data = {
+            "organic": [
+                {"link": "https://example.com/article", "snippet": "Valid snippet", "title": None},
+                {"link": "https://example.com/article2", "snippet": None},
+            ]
+        }
+        
+        results = _parse_serper_results(data)
+        assert [r.url for r in results] == ["https://example.com/article"]
+        assert results[0].title == ""
+        assert _parse_serper_results({"organic": None}) == []
 
 
 class TestParseTavilyResults:
@@ -243,7 +384,7 @@ class TestParseTavilyResults:
 class TestCallSearchAPI:
     """Test the main callSearchAPI function."""
     
-    @patch('src.evidence_retrieval.requests.post')
+    @patch('src.evidence_retrieval._SESSION.post')
     @patch('src.evidence_retrieval.settings')
     def test_call_serper_api_success(self, mock_settings, mock_post):
         """Test successful Serper API call."""
@@ -265,6 +406,7 @@ class TestCallSearchAPI:
                 }
             ]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         results = callSearchAPI("test query")
@@ -279,7 +421,7 @@ class TestCallSearchAPI:
         assert call_args[0][0] == "https://google.serper.dev/search"
         assert call_args[1]['json']['q'] == "test query"
     
-    @patch('src.evidence_retrieval.requests.post')
+    @patch('src.evidence_retrieval._SESSION.post')
     @patch('src.evidence_retrieval.settings')
     def test_call_tavily_api_success(self, mock_settings, mock_post):
         """Test successful Tavily API call."""
@@ -301,6 +443,7 @@ class TestCallSearchAPI:
                 }
             ]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         results = callSearchAPI("test query")
@@ -335,9 +478,10 @@ class TestCallSearchAPI:
         results = callSearchAPI("   ")
         assert len(results) == 0
     
-    @patch('src.evidence_retrieval.requests.post')
+    @patch('src.evidence_retrieval.time.sleep')
+    @patch('src.evidence_retrieval._SESSION.post')
     @patch('src.evidence_retrieval.settings')
-    def test_call_search_api_rate_limit(self, mock_settings, mock_post):
+    def test_call_search_api_rate_limit(self, mock_settings, mock_post, mock_sleep):
         """Test handling of rate limit error (429)."""
         mock_settings.SERPER_API_KEY = "test_key"
         mock_settings.TAVILY_API_KEY = None
@@ -352,7 +496,7 @@ class TestCallSearchAPI:
         with pytest.raises(RateLimitError, match="rate limit exceeded"):
             callSearchAPI("test query")
     
-    @patch('src.evidence_retrieval.requests.post')
+    @patch('src.evidence_retrieval._SESSION.post')
     @patch('src.evidence_retrieval.settings')
     def test_call_search_api_error_status(self, mock_settings, mock_post):
         """Test handling of API error status codes."""
@@ -370,7 +514,7 @@ class TestCallSearchAPI:
         with pytest.raises(SearchAPIError, match="returned status 500"):
             callSearchAPI("test query")
     
-    @patch('src.evidence_retrieval.requests.post')
+    @patch('src.evidence_retrieval._SESSION.post')
     @patch('src.evidence_retrieval.settings')
     def test_call_search_api_timeout(self, mock_settings, mock_post):
         """Test handling of request timeout."""
@@ -385,7 +529,7 @@ class TestCallSearchAPI:
         with pytest.raises(SearchAPIError, match="timed out"):
             callSearchAPI("test query")
     
-    @patch('src.evidence_retrieval.requests.post')
+    @patch('src.evidence_retrieval._SESSION.post')
     @patch('src.evidence_retrieval.settings')
     def test_call_search_api_connection_error(self, mock_settings, mock_post):
         """Test handling of connection errors."""
@@ -400,7 +544,7 @@ class TestCallSearchAPI:
         with pytest.raises(SearchAPIError, match="request failed"):
             callSearchAPI("test query")
     
-    @patch('src.evidence_retrieval.requests.post')
+    @patch('src.evidence_retrieval._SESSION.post')
     @patch('src.evidence_retrieval.settings')
     def test_call_search_api_prefers_serper(self, mock_settings, mock_post):
         """Test that Serper is preferred when both keys are available."""
@@ -413,6 +557,7 @@ class TestCallSearchAPI:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"organic": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         callSearchAPI("test query")
@@ -420,6 +565,226 @@ class TestCallSearchAPI:
         # Verify Serper API was called
         call_args = mock_post.call_args
         assert call_args[0][0] == "https://google.serper.dev/search"
+    
+    @patch('src.evidence_retrieval._SESSION.post')
+    @patch('src.evidence_retrieval.settings')
+    def test_call_search_api_fails_over_when_circuit_open(self, mock_settings, mock_post):
+        """Test that a provider with an open circuit is skipped for the other one."""
+        mock_settings.SERPER_API_KEY = "test_serper_key"
+        mock_settings.TAVILY_API_KEY = "test_tavily_key"
+        mock_settings.MAX_EVIDENCE_PER_CLAIM = 5
+        mock_settings.REQUEST_TIMEOUT_SECONDS = 10
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"results": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_post.return_value = mock_response
+        
+        serper = _search_circuit_breakers["serper"]
+        for _ in range(serper.failure_threshold):
+            serper.record_failure()
+        
+        callSearchAPI("test query")
+        
+        assert mock_post.call_args[0][0] == "https://api.tavily.com/search"
+    
+    @patch('src.evidence_retrieval._SESSION.post')
+    @patch('src.evidence_retrieval.settings')
+    def test_call_search_api_caches_repeated_query(self, mock_settings, mock_post):
+        """Test that a repeated query is answered from the cache."""
+        mock_settings.SERPER_API_KEY = "test_serper_key"
+        mock_settings.TAVILY_API_KEY = None
+        mock_settings.MAX_EVIDENCE_PER_CLAIM = 5
+        mock_settings.REQUEST_TIMEOUT_SECONDS = 10
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "organic": [{"link": "https://reuters.com/a", "snippet": "Snippet", "title": "Title"}]
+        }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_post.return_value = mock_response
+        
+        first = callSearchAPI("Test  Query")
+        second = callSearchAPI("test query")
+        
+        assert mock_post.call_count == 1
+        assert [r.url for r in second] == [r.url for r in first] == ["https://reuters.com/a"]
+
+
+
+class TestRankEvidence:
+    """Test filtering and ranking of search results into Evidence."""
+    
+    @patch('src.evidence_retrieval.settings')
+    def test_invalid_result_does_not_take_top_slot(self, mock_settings):
+        """Test a result that cannot become Evidence is dropped before ranking."""
+        mock_settings.MINIMUM_CREDIBILITY_THRESHOLD = 0.0
+        mock_settings.MAX_EVIDENCE_PER_CLAIM = 1
+        mock_settings.RELEVANCE_SCORER = "jaccard"
+        
+        claim = Mock(text="Scientists discovered a new bird species")
+        results = [
+            SearchResult(url="no-domain", snippet="Scientists discovered a new bird species"),
+            SearchResult(url="https://reuters.com/a", snippet="A new bird species was found"),
+        ]
+        
+        evidence = list(_rankEvidence(claim, results))
+        
+        assert [e.sourceDomain for e in evidence] == ["reuters.com"]
+
+
+class TestSearchSession:
+    """Test the shared search HTTP session."""
+    
+    def test_requests_compressed_responses(self):
+        """Test that search requests advertise gzip support."""
+        from src.evidence_retrieval import _SESSION
+        
+        assert "gzip" in _SESSION.headers["Accept-Encoding"]
+
+
+class TestPostWithBackoff:
+    """Test retrying of throttled and transiently failing search requests."""
+    
+    @staticmethod
+    def _response(status, headers=None):
+        response = Mock()
+        response.status_code = status
+        response.headers = headers or {}
+        return response
+    
+    @patch('src.evidence_retrieval.time.sleep')
+    @patch('src.evidence_retrieval._SESSION.post')
+    def test_retries_until_success_honoring_retry_after(self, mock_post, mock_sleep):
+        """Test that a 429 with Retry-After waits that long and then succeeds."""
+        mock_post.side_effect = [
+            self._response(429, {"Retry-After": "2"}),
+            self._response(503),
+            self._response(200)
+        ]
+        
+        limiter = Mock()
+        response = _post_with_backoff("https://api.example.com/search", limiter, max_retries=3)
+        
+        assert response.status_code == 200
+        assert mock_post.call_count == 3
+        assert mock_sleep.call_args_list[0][0][0] == 2.0
+        limiter.record_throttled.assert_called_once()
+        limiter.record_success.assert_called_once()
+    
+    @patch('src.evidence_retrieval.time.sleep')
+    @patch('src.evidence_retrieval._SESSION.post')
+    def test_returns_last_response_after_max_retries(self, mock_post, mock_sleep):
+        """Test that the final throttled response is returned once retries run out."""
+        mock_post.return_value = self._response(429)
+        
+        limiter = Mock()
+        response = _post_with_backoff("https://api.example.com/search", limiter, max_retries=2)
+        
+        assert response.status_code == 429
+        assert mock_post.call_count == 3
+        assert mock_sleep.call_count == 2
+        assert limiter.acquire.call_count == 2
+        assert limiter.record_throttled.call_count == 3
+    
+    @patch('src.evidence_retrieval._SESSION.post')
+    def test_client_errors_not_retried(self, mock_post):
+        """Test that non-transient errors are returned immediately."""
+        mock_post.return_value = self._response(400)
+        
+        assert _post_with_backoff("https://api.example.com/search", Mock()).status_code == 400
+        assert mock_post.call_count == 1
+
+
+class TestSearchEvidenceBatch:
+    """Test concurrent evidence search for several claims."""
+    
+    def test_results_in_claim_order_with_errors_in_place(self):
+        """Test that each claim gets its own result and failures do not affect others."""
+        claims = [Mock(text="first claim"), Mock(text="failing claim"), Mock(text="third claim")]
+        
+        async def fake_search(claim):
+            if claim.text == "failing claim":
+                raise SearchAPIError("boom")
+            return [claim.text]
+        
+        with patch('src.evidence_retrieval.searchEvidenceAsync', side_effect=fake_search):
+            results = searchEvidenceBatch(claims)
+        
+        assert results[0] == ["first claim"]
+        assert isinstance(results[1], SearchAPIError)
+        assert results[2] == ["third claim"]
+    
+    def test_empty_claims(self):
+        """Test that no claims gives no results."""
+        assert searchEvidenceBatch([]) == []
+    
+    def test_inside_running_event_loop_uses_threads(self):
+        """Test that calling from a running event loop does not raise and isolates failures."""
+        claims = [Mock(text="first claim"), Mock(text="failing claim")]
+        
+        def fake_search(claim):
+            if claim.text == "failing claim":
+                raise SearchAPIError("boom")
+            return [claim.text]
+        
+        async def call_from_loop():
+            return searchEvidenceBatch(claims)
+        
+        with patch('src.evidence_retrieval.searchEvidence', side_effect=fake_search):
+            results = asyncio.run(call_from_loop())
+        
+        assert results[0] == ["first claim"]
+        assert isinstance(results[1], SearchAPIError)
+    
+    def test_thread_pool_results_in_claim_order_with_errors_in_place(self):
+        """Test the thread-based variant isolates per-claim failures, including rate limits."""
+        claims = [Mock(text="first claim"), Mock(text="throttled claim"), Mock(text="third claim")]
+        
+        def fake_search(claim):
+            if claim.text == "throttled claim":
+                raise RateLimitError("slow down")
+            return [claim.text]
+        
+        with patch('src.evidence_retrieval.searchEvidence', side_effect=fake_search):
+            results = searchEvidenceMany(claims, max_workers=2)
+        
+        assert results[0] == ["first claim"]
+        assert isinstance(results[1], RateLimitError)
+        assert results[2] == ["third claim"]
+        assert searchEvidenceMany([]) == []
+    
+    @patch('src.evidence_retrieval._SESSION.post')
+    @patch('src.evidence_retrieval.settings')
+    def test_concurrent_identical_queries_share_one_request(self, mock_settings, mock_post):
+        """Test that concurrent searches for the same query send a single request."""
+        mock_settings.SERPER_API_KEY = "test_serper_key"
+        mock_settings.TAVILY_API_KEY = None
+        mock_settings.MAX_EVIDENCE_PER_CLAIM = 5
+        mock_settings.REQUEST_TIMEOUT_SECONDS = 10
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = {
+            "organic": [{"link": "https://reuters.com/a", "snippet": "Snippet", "title": "Title"}]
+        }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_post.return_value = mock_response
+        
+        async def search_twice():
+            return await asyncio.gather(
+                callSearchAPIAsync("test query"), callSearchAPIAsync("Test  Query")
+            )
+        
+        # Unthrottled limiter, so earlier tests' throttling cannot delay this one
+        with patch.dict('src.evidence_retrieval._search_rate_limiters', {"serper": TokenBucket(0)}):
+            first, second = asyncio.run(search_twice())
+        
+        assert mock_post.call_count == 1
+        assert [r.url for r in first] == [r.url for r in second] == ["https://reuters.com/a"]
 
 
 if __name__ == "__main__":
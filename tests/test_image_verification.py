@@ -0,0 +1,335 @@
+"""
+Unit tests for the image verification module.
+
+Tests cover:
+- Perceptual hashes of near-duplicate and different images
+- Batched hashing and Hamming distances
+- Reverse search date parsing
+- Reverse search caching and coalescing of concurrent lookups
+- Content digests and the verification result cache (exact hits and
+  near-duplicate matches)
+- Batch verification order and per-image failures
+- Error Level Analysis on clean screenshots and pasted edits
+
+Tests that decode pixels need NumPy and Pillow and are skipped without them.
+"""
+
+import hashlib
+import io
+import re
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src import image_verification as iv
+from src.image_verification import (
+    ImageMatch,
+    calculateImageHash,
+    hammingDistance,
+    imageHashToInt,
+    reverseImageSearch,
+    verifyImage,
+    verifyImages,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    iv._image_result_cache.clear()
+    iv.clearReverseSearchCache()
+    yield
+    iv._image_result_cache.clear()
+    iv.clearReverseSearchCache()
+
+
+@pytest.fixture
+def imaging():
+    """NumPy and Pillow, skipping the test when either is missing."""
+    np = pytest.importorskip("numpy")
+    Image = pytest.importorskip("PIL.Image")
+    return np, Image
+
+
+def make_photo(imaging, seed=0, size=256):
+    """Photo-like RGB image: smooth random colour regions plus sensor-style noise."""
+    np, Image = imaging
+    rng = np.random.default_rng(seed)
+    coarse = Image.fromarray((rng.random((12, 12, 3)) * 255).astype("uint8"))
+    pixels = np.asarray(coarse.resize((size, size), Image.BICUBIC), dtype=np.float32)
+    pixels += rng.normal(0, 6, pixels.shape)
+    return Image.fromarray(np.clip(pixels, 0, 255).astype("uint8"))
+
+
+def encode(image, fmt="JPEG", **kwargs):
+    buffer = io.BytesIO()
+    image.save(buffer, fmt, **kwargs)
+    return buffer.getvalue()
+
+
+def match(url, published=None):
+    return ImageMatch(
+        sourceURL=url,
+        sourceDomain="example.com",
+        title="t",
+        similarityScore=1.0,
+        publishDate=iv._toEpochMillis(published)
+    )
+
+
+class TestPerceptualHash:
+    """Tests for calculateImageHash and the Hamming distance helpers."""
+    
+    def test_near_duplicates_are_close(self, imaging):
+        photo = make_photo(imaging)
+        original = imageHashToInt(calculateImageHash(encode(photo, quality=95)))
+        recompressed = imageHashToInt(calculateImageHash(encode(photo.resize((180, 180)), quality=40)))
+        
+        assert len(calculateImageHash(encode(photo))) == 16
+        assert hammingDistance(original, recompressed) <= iv.SIMILAR_HASH_MAX_DISTANCE
+    
+    def test_different_images_are_far_apart(self, imaging):
+        first = imageHashToInt(calculateImageHash(encode(make_photo(imaging, seed=0))))
+        second = imageHashToInt(calculateImageHash(encode(make_photo(imaging, seed=1))))
+        assert hammingDistance(first, second) > iv.SIMILAR_HASH_MAX_DISTANCE
+    
+    def test_undecodable_image_gives_empty_hash(self):
+        assert calculateImageHash(b"not an image") == ""
+        assert imageHashToInt("") is None
+    
+    def test_batched_hashes_match_single_hashes(self, imaging):
+        images = [encode(make_photo(imaging, seed=seed), "PNG") for seed in range(3)]
+        decoded = [iv._DecodedImage(data) for data in images] + [None]
+        
+        assert iv._calculateImageHashes(decoded) == [calculateImageHash(data) for data in images] + [""]
+    
+    def test_vectorized_distances_match_scalar(self, imaging):
+        query = 0xF0F0F0F0F0F0F0F0
+        candidates = [0, query, 0xFFFFFFFFFFFFFFFF, 0x0F0F0F0F0F0F0F0F]
+        assert list(iv.hammingDistances(query, candidates)) == [hammingDistance(query, c) for c in candidates]
+
+
+class TestErrorLevelAnalysis:
+    """Tests for ELA in detectManipulation."""
+    
+    def test_clean_screenshot_is_not_manipulated(self, imaging):
+        _, Image = imaging
+        from PIL import ImageDraw
+        
+        screenshot = Image.new("RGB", (400, 300), "white")
+        draw = ImageDraw.Draw(screenshot)
+        for line in range(12):
+            draw.text((10, 10 + 22 * line), f"Breaking: officials confirm report {line} is accurate", fill="black")
+        data = encode(screenshot, quality=85)
+        
+        report = iv.detectManipulation(data)
+        assert report.detectionMethod == "Error Level Analysis"
+        assert not report.isManipulated
+        assert verifyImage("https://x.com/shot.jpg", data).verdict != "MANIPULATED"
+    
+    def test_clean_photo_is_not_manipulated(self, imaging):
+        assert not iv.detectManipulation(encode(make_photo(imaging), quality=90)).isManipulated
+    
+    def test_pasted_edit_is_detected_and_located(self, imaging):
+        np, Image = imaging
+        background = Image.open(io.BytesIO(encode(make_photo(imaging), quality=60))).convert("RGB")
+        patch = np.random.default_rng(1).integers(0, 256, (64, 64, 3), dtype=np.uint8)
+        background.paste(Image.fromarray(patch), (96, 96))
+        
+        report = iv.detectManipulation(encode(background, quality=95))
+        assert report.isManipulated
+        assert report.manipulationType == "EDITED"
+        # The reported box covers the patch, give or take one 8x8 block
+        left, right, top, bottom = map(int, re.findall(r"\d+", report.artifacts[1]))
+        assert abs(left - 96) <= 8 and abs(right - 160) <= 8
+        assert abs(top - 96) <= 8 and abs(bottom - 160) <= 8
+
+
+class TestToEpochMillis:
+    """Tests for parsing reverse search dates."""
+    
+    def test_utc_suffix(self):
+        assert iv._toEpochMillis("2021-05-01T00:00:00Z") == 1619827200000
+    
+    def test_offset_is_applied(self):
+        assert iv._toEpochMillis("2021-05-01T02:00:00+02:00") == 1619827200000
+    
+    def test_naive_date_is_utc(self):
+        assert iv._toEpochMillis("2019-01-02") == 1546387200000
+    
+    def test_missing_or_invalid(self):
+        assert iv._toEpochMillis(None) is None
+        assert iv._toEpochMillis("") is None
+        assert iv._toEpochMillis("last Tuesday") is None
+    
+    def test_published_iso_round_trip(self):
+        assert match("u", "2021-05-01T00:00:00Z").publishedISO == "2021-05-01T00:00:00+00:00"
+        assert match("u").publishedISO is None
+
+
+class TestReverseImageSearch:
+    """Tests for reverse search caching and coalescing."""
+    
+    def test_results_are_cached_per_url(self):
+        with patch.object(iv, "_queryReverseImageSearch", return_value=[match("a")]) as query:
+            assert reverseImageSearch("https://x.com/a.jpg") == [match("a")]
+            assert reverseImageSearch("https://x.com/a.jpg") == [match("a")]
+        assert query.call_count == 1
+    
+    def test_concurrent_lookups_share_one_request(self):
+        calls = []
+        
+        def slow_query(url):
+            calls.append(url)
+            time.sleep(0.1)
+            return [match(url)]
+        
+        results = []
+        with patch.object(iv, "_queryReverseImageSearch", side_effect=slow_query):
+            threads = [
+                threading.Thread(target=lambda: results.append(reverseImageSearch("https://x.com/v.jpg")))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert len(calls) == 1
+        assert results == [[match("https://x.com/v.jpg")]] * 8
+    
+    def test_failures_are_not_cached(self):
+        with patch.object(iv, "_queryReverseImageSearch", side_effect=RuntimeError("down")):
+            assert reverseImageSearch("https://x.com/b.jpg") == []
+        with patch.object(iv, "_queryReverseImageSearch", return_value=[match("b")]) as query:
+            assert reverseImageSearch("https://x.com/b.jpg") == [match("b")]
+        assert query.call_count == 1
+
+
+class TestImageResultCache:
+    """Tests for the content-digest keyed verification cache."""
+    
+    def test_repeat_verification_is_served_from_cache(self, imaging):
+        data = encode(make_photo(imaging), quality=90)
+        with patch.object(iv, "reverseImageSearch", return_value=[match("a")]) as search:
+            first = verifyImage("https://x.com/a.jpg", data)
+            with patch.object(iv, "detectManipulation", side_effect=AssertionError("pipeline ran")), \
+                 patch.object(iv, "calculateImageHash", side_effect=AssertionError("image decoded")):
+                second = verifyImage("https://x.com/a.jpg", data)
+        
+        assert search.call_count == 1
+        assert second == first
+        assert second is not first
+    
+    def test_near_duplicate_reuses_reverse_search_matches(self, imaging):
+        # Hashes three bits apart: a near duplicate, not an exact hit
+        hashes = iter(["00000000000000ff", "00000000000000f8"])
+        with patch.object(iv, "calculateImageHash", side_effect=lambda _: next(hashes)), \
+             patch.object(iv, "reverseImageSearch", return_value=[match("a", "2019-01-02")]) as search:
+            first = verifyImage("https://x.com/a.jpg", b"first upload")
+            nearDuplicate = verifyImage("https://y.com/a.jpg", b"second upload")
+        
+        assert search.call_count == 1
+        assert nearDuplicate.imageHash == "00000000000000f8"
+        assert nearDuplicate.matches == first.matches
+        assert nearDuplicate.originalSource == "a"
+        assert nearDuplicate.firstSeen == "2019-01-02T00:00:00+00:00"
+    
+    def test_edited_near_duplicate_is_analysed_again(self, imaging):
+        np, Image = imaging
+        original = make_photo(imaging)
+        edited = original.copy()
+        edited.paste(Image.fromarray(np.full((8, 8, 3), 255, dtype="uint8")), (120, 120))
+        exif = Image.Exif()
+        exif[iv._EXIF_SOFTWARE] = "Photo Editor"
+        originalData = encode(original, quality=90)
+        editedData = encode(edited, quality=90, exif=exif.tobytes())
+        # Same perceptual hash: only the bytes tell the two apart
+        assert calculateImageHash(editedData) == calculateImageHash(originalData)
+        
+        with patch.object(iv, "reverseImageSearch", return_value=[match("a")]) as search:
+            first = verifyImage("https://x.com/a.jpg", originalData)
+            with patch.object(iv, "detectManipulation", wraps=iv.detectManipulation) as detect:
+                second = verifyImage("https://x.com/b.jpg", editedData)
+        
+        assert search.call_count == 1
+        assert detect.call_count == 1
+        assert first.metadata.software is None
+        assert second.metadata.software == "Photo Editor"
+        assert second.metadata.fileSize == len(editedData)
+        assert second.matches == first.matches
+    
+    def test_content_digest_is_sha256_across_chunks(self):
+        data = bytes(range(256)) * (iv.CONTENT_DIGEST_CHUNK_SIZE // 128 + 3)
+        for size in (0, 1, iv.CONTENT_DIGEST_CHUNK_SIZE, len(data)):
+            assert iv.contentDigest(data[:size]) == hashlib.sha256(data[:size]).hexdigest()
+    
+    def test_lru_eviction_and_ttl(self):
+        cache = iv._ImageResultCache(max_entries=1, ttl_seconds=60)
+        result = verifyImage("https://x.com/none.jpg")
+        cache.put("one", 1, result)
+        cache.put("two", 2, result)
+        assert cache.get("one") is None
+        assert cache.get("two") == result
+        
+        with patch("src.image_verification.time.monotonic", return_value=time.monotonic() + 120):
+            assert cache.get("two") is None
+    
+    def test_distant_hash_is_not_a_near_match(self, imaging):
+        cache = iv._ImageResultCache(max_entries=10, ttl_seconds=60)
+        with patch.object(iv, "reverseImageSearch", return_value=[match("a")]):
+            cache.put("digest", 0, verifyImage("https://x.com/a.jpg"))
+        assert cache.nearestMatches(0xFFFF) is None
+        assert cache.nearestMatches(0b111) == [match("a")]
+
+
+class TestVerifyImages:
+    """Tests for batch verification."""
+    
+    def test_results_in_input_order_with_failing_item(self, imaging):
+        images = [encode(make_photo(imaging, seed=seed), quality=90) for seed in range(3)]
+        items = [
+            ("https://x.com/0.jpg", images[0]),
+            ("https://x.com/broken.jpg", b"not an image"),
+            ("https://x.com/1.jpg", images[1]),
+            ("https://x.com/none.jpg", None),
+            ("https://x.com/2.jpg", images[2]),
+        ]
+        expected = [calculateImageHash(data) for data in images]
+        
+        results = verifyImages(items, max_workers=3)
+        
+        assert [result.imageHash for result in results] == [expected[0], "", expected[1], "", expected[2]]
+        assert results[1].verdict == "UNVERIFIED"
+    
+    def test_empty_batch(self):
+        assert verifyImages([]) == []
+    
+    def test_failed_step_waits_for_others_before_release(self, imaging):
+        data = encode(make_photo(imaging), quality=90)
+        started, seen = [], []
+        
+        def slowOCR(decoded):
+            started.append(True)
+            time.sleep(0.2)
+            seen.append(len(decoded.data))
+            return None
+        
+        with patch.object(iv, "reverseImageSearch", return_value=[]), \
+             patch.object(iv, "detectManipulation", side_effect=RuntimeError("boom")), \
+             patch.object(iv, "extractTextFromImage", side_effect=slowOCR):
+            result = verifyImage("https://x.com/a.jpg", data)
+        
+        assert result.verdict == "ERROR"
+        # OCR was cancelled before starting, or finished on the live buffer
+        assert seen == [len(data)] * len(started)
+    
+    def test_earliest_match_is_original_source(self):
+        matches = [match("later", "2021-05-01T00:00:00Z"), match("undated"), match("earliest", "2019-01-02")]
+        with patch.object(iv, "reverseImageSearch", return_value=matches):
+            result = verifyImage("https://x.com/a.jpg")
+        
+        assert result.originalSource == "earliest"
+        assert result.firstSeen == "2019-01-02T00:00:00+00:00"
+        assert result.verdict == "AUTHENTIC"
@@ -74,6 +74,7 @@ class TestEvidence:
         assert evidence.sourceURL == "https://example.com/article"
         assert evidence.credibilityScore == 0.8
         assert evidence.relevanceScore == 0.9
+        assert evidence.combinedScore == 0.0
     
     def test_evidence_score_bounds(self):
         """Test that credibility and relevance scores are bounded."""
@@ -0,0 +1,116 @@
+"""
+Unit tests for client-side rate limiting.
+
+Tests cover:
+- Burst capacity and refill of the token bucket
+- Disabled limiting
+- Adaptive rate decrease and recovery
+- Circuit breaker opening, cooldown and recovery
+- Jittered backoff bounds
+"""
+
+from unittest.mock import patch
+
+from src.rate_limiter import CircuitBreaker, TokenBucket, backoff_with_jitter
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+    
+    def test_burst_within_capacity_does_not_wait(self):
+        bucket = TokenBucket(rate_per_minute=60, capacity=3)
+        assert [bucket._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    
+    def test_waits_once_capacity_is_exhausted(self):
+        with patch("src.rate_limiter.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate_per_minute=60, capacity=1)
+            assert bucket._reserve() == 0.0
+            assert bucket._reserve() == 1.0
+            assert bucket._reserve() == 2.0
+    
+    def test_tokens_refill_over_time(self):
+        with patch("src.rate_limiter.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate_per_minute=60, capacity=1)
+            bucket._reserve()
+        with patch("src.rate_limiter.time.monotonic", return_value=101.0):
+            assert bucket._reserve() == 0.0
+    
+    def test_remaining_header_drains_bucket(self):
+        with patch("src.rate_limiter.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate_per_minute=60, capacity=10)
+            bucket.update_from_headers({"X-RateLimit-Remaining": "1"})
+            assert bucket._reserve() == 0.0
+            assert bucket._reserve() == 1.0
+    
+    def test_missing_or_invalid_header_is_ignored(self):
+        bucket = TokenBucket(rate_per_minute=60, capacity=2)
+        bucket.update_from_headers({})
+        bucket.update_from_headers({"X-RateLimit-Remaining": "soon"})
+        assert [bucket._reserve() for _ in range(2)] == [0.0, 0.0]
+    
+    def test_non_positive_rate_disables_limiting(self):
+        bucket = TokenBucket(rate_per_minute=0)
+        assert all(bucket._reserve() == 0.0 for _ in range(100))
+
+    
+    def test_throttled_halves_rate_down_to_floor(self):
+        bucket = TokenBucket(rate_per_minute=60)
+        bucket.record_throttled()
+        assert bucket.rate == 0.5
+        for _ in range(10):
+            bucket.record_throttled()
+        assert bucket.rate == 1.0 / 16
+    
+    def test_successes_recover_rate_up_to_configured(self):
+        bucket = TokenBucket(rate_per_minute=60)
+        bucket.record_throttled()
+        for _ in range(TokenBucket.SUCCESS_WINDOW - 1):
+            bucket.record_success()
+        assert bucket.rate == 0.5
+        bucket.record_success()
+        assert bucket.rate == 0.55
+        for _ in range(TokenBucket.SUCCESS_WINDOW * 20):
+            bucket.record_success()
+        assert bucket.rate == 1.0
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+    
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=30)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.is_open
+        assert not breaker.allow()
+    
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=30)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.allow()
+    
+    def test_one_trial_per_cooldown(self):
+        with patch("src.rate_limiter.time.monotonic", return_value=100.0):
+            breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30)
+            breaker.record_failure()
+        with patch("src.rate_limiter.time.monotonic", return_value=131.0):
+            assert breaker.allow()
+            assert not breaker.allow()
+            breaker.record_failure()
+            assert not breaker.allow()
+        with patch("src.rate_limiter.time.monotonic", return_value=162.0):
+            assert breaker.allow()
+            breaker.record_success()
+            assert not breaker.is_open
+            assert breaker.allow()
+
+
+class TestBackoffWithJitter:
+    """Tests for backoff_with_jitter."""
+    
+    def test_delay_is_within_exponential_bound(self):
+        for attempt in range(6):
+            assert 0.0 <= backoff_with_jitter(attempt, base=1.0, cap=30.0) <= min(30.0, 2 ** attempt)
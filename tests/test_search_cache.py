@@ -0,0 +1,123 @@
+"""
+Unit tests for the semantic search cache.
+
+Tests cover:
+- Exact and normalized query hits
+- Similarity-based hits using an injected embedder
+- TTL expiry and LRU eviction
+- Clearing the cache
+- Result limits and search_unified's handling of mock fallback results
+"""
+
+from unittest.mock import patch
+
+from src import api_wrapper
+from src.evidence_retrieval import MockSearchResult, SearchResult
+from src.search_cache import SemanticSearchCache
+
+
+RESULTS = [{"url": "https://apnews.com/a", "title": "A", "snippet": "s", "domain": "apnews.com"}]
+
+VECTORS = {
+    "covid vaccine safety": [1.0, 0.0, 0.0],
+    "is the covid vaccine safe": [0.99, 0.1, 0.0],
+    "moon landing": [0.0, 0.0, 1.0],
+}
+
+
+def fake_embedder(query):
+    return VECTORS.get(query)
+
+
+class TestSemanticSearchCache:
+    """Tests for SemanticSearchCache."""
+    
+    def test_miss_on_empty_cache(self):
+        cache = SemanticSearchCache(embedder=None)
+        assert cache.get("anything") is None
+    
+    def test_exact_hit_ignores_case_and_whitespace(self):
+        cache = SemanticSearchCache(embedder=None)
+        cache.put("Covid  vaccine safety", RESULTS)
+        assert cache.get("covid vaccine SAFETY ") == RESULTS
+    
+    def test_returned_results_are_copies(self):
+        cache = SemanticSearchCache(embedder=None)
+        cache.put("query", RESULTS)
+        cache.get("query")[0]["title"] = "changed"
+        assert cache.get("query")[0]["title"] == "A"
+    
+    def test_semantic_hit_above_threshold(self):
+        cache = SemanticSearchCache(embedder=fake_embedder, similarity_threshold=0.9)
+        cache.put("covid vaccine safety", RESULTS)
+        assert cache.get("is the covid vaccine safe") == RESULTS
+    
+    def test_semantic_miss_below_threshold(self):
+        cache = SemanticSearchCache(embedder=fake_embedder, similarity_threshold=0.9)
+        cache.put("covid vaccine safety", RESULTS)
+        assert cache.get("moon landing") is None
+    
+    def test_entries_expire_after_ttl(self):
+        cache = SemanticSearchCache(embedder=None, ttl_seconds=300)
+        with patch("src.search_cache.time.monotonic", return_value=1000.0):
+            cache.put("query", RESULTS)
+        with patch("src.search_cache.time.monotonic", return_value=1301.0):
+            assert cache.get("query") is None
+        assert len(cache) == 0
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = SemanticSearchCache(embedder=None, max_entries=2)
+        cache.put("first", RESULTS)
+        cache.put("second", RESULTS)
+        cache.get("first")
+        cache.put("third", RESULTS)
+        assert cache.get("second") is None
+        assert cache.get("first") == RESULTS
+        assert cache.get("third") == RESULTS
+    
+    def test_clear(self):
+        cache = SemanticSearchCache(embedder=None)
+        cache.put("query", RESULTS)
+        cache.clear()
+        assert cache.get("query") is None
+    
+    def test_limited_entry_does_not_answer_larger_limit(self):
+        cache = SemanticSearchCache(embedder=None)
+        cache.put("query", RESULTS * 3, limit=3)
+        assert cache.get("query", 10) is None
+        assert cache.get("query") is None
+        assert cache.get("query", 2) == RESULTS * 2
+    
+    def test_short_limited_entry_is_complete(self):
+        cache = SemanticSearchCache(embedder=None)
+        cache.put("query", RESULTS, limit=3)
+        assert cache.get("query", 10) == RESULTS
+        assert cache.get("query") == RESULTS
+    
+    def test_limited_entry_skipped_for_similarity_match(self):
+        cache = SemanticSearchCache(embedder=fake_embedder)
+        cache.put("covid vaccine safety", RESULTS * 3, limit=3)
+        assert cache.get("is the covid vaccine safe", 10) is None
+        assert cache.get("is the covid vaccine safe", 3) == RESULTS * 3
+
+
+class TestSearchUnifiedCaching:
+    """Tests for search_unified's use of the search cache."""
+    
+    def _search(self, cache, results):
+        with patch("src.search_cache.search_cache", cache), \
+             patch.object(api_wrapper.settings, "USE_SELF_HOSTED_API", False), \
+             patch("src.evidence_retrieval.callSearchAPI", return_value=results) as call:
+            found = api_wrapper.search_unified("some claim", max_results=3)
+        return found, call
+    
+    def test_api_results_are_cached(self):
+        cache = SemanticSearchCache(embedder=None)
+        self._search(cache, [SearchResult(url="https://apnews.com/a", snippet="s")])
+        assert cache.get("some claim", 3) is not None
+    
+    def test_mock_fallback_results_are_not_cached(self):
+        cache = SemanticSearchCache(embedder=None)
+        found, _ = self._search(cache, [MockSearchResult(url="https://apnews.com/a", snippet="s")])
+        assert len(found) == 1
+        assert len(cache) == 0
@@ -13,6 +13,7 @@ import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -226,6 +227,60 @@ class TestSourceCredibilityDatabase:
         # Should return default for any lookup
         result = db.lookup_source_credibility("example.com")
         assert result.credibilityScore == 0.5
+    
+    def test_database_is_read_from_json_only(self, sample_db_file):
+        """Test no serialized copy is written and JSON edits are picked up."""
+        SourceCredibilityDatabase(sample_db_file)
+        assert not Path(sample_db_file).with_suffix('.pickle').exists()
+        
+        with open(sample_db_file, 'w') as f:
+            json.dump({"sources": {"example.org": {"credibilityScore": 0.9, "category": "TRUSTED"}}}, f)
+        
+        third = SourceCredibilityDatabase(sample_db_file)
+        assert list(third.sources) == ["example.org"]
+    
+    def test_subdomain_inherits_parent_entry(self, sample_db_file):
+        """Test subdomains match their closest listed parent domain."""
+        db = SourceCredibilityDatabase(sample_db_file)
+        
+        result = db.lookup_source_credibility("https://uk.reuters.com/world")
+        
+        assert result.domain == "uk.reuters.com"
+        assert result.credibilityScore == 0.95
+        assert result.category == SourceCategory.TRUSTED
+        assert db.get_credibility_score("edition.cnn.com") == db.lookup_source_credibility("cnn.com").credibilityScore
+        assert db.get_credibility_score("notcnn.com") == 0.5
+    
+    def test_get_credibility_score_matches_lookup(self, sample_db_file):
+        """Test the flat score lookup agrees with the full lookup."""
+        db = SourceCredibilityDatabase(sample_db_file)
+        
+        for domain in ["apnews.com", "https://www.reuters.com/world", "CNN.COM", "unknown-news-site.com",
+                       "news.apnews.com:443"]:
+            assert db.get_credibility_score(domain) == db.lookup_source_credibility(domain).credibilityScore
+    
+    def test_resolved_score_is_remembered(self, sample_db_file):
+        """Test a non-key domain is resolved once and then served from the memo."""
+        db = SourceCredibilityDatabase(sample_db_file)
+        
+        first = db.get_credibility_score("news.apnews.com")
+        with patch.object(db, '_match_domain', side_effect=AssertionError("not memoized")):
+            assert db.get_credibility_score("news.apnews.com") == first == db.get_credibility_score("apnews.com")
+    
+    def test_batch_lookups_match_single_lookups(self, sample_db_file):
+        """Test the batch lookups return one entry per distinct domain, matching single lookups."""
+        db = SourceCredibilityDatabase(sample_db_file)
+        domains = ["apnews.com", "cnn.com", "apnews.com", "unknown-news-site.com"]
+        
+        scores = db.get_credibility_scores(domains)
+        credibilities = db.lookup_source_credibility_many(domains)
+        
+        assert set(scores) == set(credibilities) == set(domains)
+        for domain in domains:
+            assert scores[domain] == db.get_credibility_score(domain)
+            expected = db.lookup_source_credibility(domain)
+            assert credibilities[domain].credibilityScore == expected.credibilityScore
+            assert credibilities[domain].category == expected.category
 
 
 class TestGlobalFunctions: